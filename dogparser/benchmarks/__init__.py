@@ -0,0 +1,3 @@
+from ._synthetic import MODELS, SCHEMAS, synthetic_record, synthetic_schema, write_synthetic_table
+from ._memory import measure_memory
+from ._export import EXPORT_MODELS, SyntheticExport, encode_text, write_synthetic_export
\ No newline at end of file
@@ -0,0 +1,83 @@
+import argparse
+import json
+import sys
+
+from ._export import write_synthetic_export
+from ._memory import measure_memory
+from ._speed import REPEATS, measure_conversions, measure_decoding, measure_parse
+from ._synthetic import MODELS
+
+def run_memory(records: int) -> list:
+    print(f'{"Model":<20} {"slots MB":>10} {"dict MB":>10} {"reduction":>10}')
+    results = []
+    for element_type in MODELS:
+        result = measure_memory(element_type, records)
+        print(f'{result["model"]:<20} {result["slots_bytes"] / 2**20:>10.1f} {result["dict_bytes"] / 2**20:>10.1f} {result["reduction"]:>10.0%}')
+        results.append(result)
+    return results
+
+def run_speed(records: int, output_format: str, repeats: int) -> list:
+    print(f'{"Benchmark":<36} {"records/s":>12} {"peak KB":>10}')
+    results = []
+    measurements = [lambda: measure_conversions(records, repeats)]
+    measurements += [lambda element_type=element_type: [measure_decoding(element_type, records, repeats)] for element_type in MODELS]
+    measurements += [lambda element_type=element_type: [measure_parse(element_type, records, output_format, repeats)] for element_type in MODELS]
+    for measure in measurements:
+        for result in measure():
+            print(f'{result["benchmark"]:<36} {result["records_per_second"]:>12.0f} {result["peak_bytes"] / 2**10:>10.0f}')
+            results.append(result)
+    return results
+
+def compare(results: list, baseline_file: str, tolerance: float) -> list:
+    """Benchmarks that are more than tolerance slower than in the baseline report"""
+
+    with open(baseline_file, 'r', encoding='utf8') as f:
+        baseline = {result['benchmark']: result for result in json.load(f)['speed']}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get(result['benchmark'])
+        if previous is not None and result['records_per_second'] < previous['records_per_second'] * (1 - tolerance):
+            regressions.append(result['benchmark'])
+            print(f'{result["benchmark"]} regressed from {previous["records_per_second"]:.0f} to {result["records_per_second"]:.0f} records/s')
+    return regressions
+
+def main():
+    argument_parser = argparse.ArgumentParser(description='Measures the speed and memory of the table decoders and the conversion utilities')
+    argument_parser.add_argument('SUITE', nargs='?', default='all', choices=['all', 'speed', 'memory', 'generate'],
+                                 help='The benchmarks to run, or generate to write a synthetic export to --destination')
+    argument_parser.add_argument('--records', default=100000, type=int, help='The number of records decoded per table')
+    argument_parser.add_argument('--repeats', default=REPEATS, type=int, help='The timed runs of each speed benchmark, the fastest is reported')
+    argument_parser.add_argument('--format', default='jsonl', help='The output format of the end to end parses')
+    argument_parser.add_argument('--output', default=None, help='A JSON file to write the results to, for use as a baseline')
+    argument_parser.add_argument('--baseline', default=None, help='A JSON file of earlier results, slower benchmarks fail the run')
+    argument_parser.add_argument('--tolerance', default=0.1, type=float, help='The slowdown against the baseline that is still accepted')
+    argument_parser.add_argument('--destination', default=None, help='With generate, the export directory to write')
+    argument_parser.add_argument('--dogs', default=100000, type=int, help='With generate, the number of dogs, the other tables are sized to match')
+    argument_parser.add_argument('--seed', default=0, type=int, help='With generate, the seed of the synthetic contents')
+
+    args = argument_parser.parse_args()
+
+    if args.SUITE == 'generate':
+        if args.destination is None:
+            raise AssertionError('generate requires a --destination directory')
+        write_synthetic_export(args.destination, args.dogs, args.seed)
+        return
+
+    report = {'records': args.records, 'speed': [], 'memory': []}
+    if args.SUITE in ('all', 'speed'):
+        report['speed'] = run_speed(args.records, args.format, args.repeats)
+    if args.SUITE in ('all', 'memory'):
+        report['memory'] = run_memory(args.records)
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline is not None:
+        regressions = compare(report['speed'], args.baseline, args.tolerance)
+        if regressions:
+            sys.exit(f'{len(regressions)} benchmarks regressed')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,356 @@
+import os
+import re
+import struct
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from ..parsers.eier._eier import Eier
+from ..parsers.hdstat._hdstat import HDStat
+from ..parsers.hdstatfarmorfar._hdstatfarmorfar import HdStatFarMorFar
+from ..parsers.hund._hund import Hund
+from ..parsers.innavl._innavl import Innavl
+from ..parsers.kaaringer._kaaringer import Kaaringer
+from ..parsers.kaaringsbeskrivelse._kaaringsbeskrivelse import Kaaringsbeskrivelse
+from ..parsers.kull._kull import Kull
+from ..parsers.nv._nv import Nv
+from ..parsers.oppdretter._oppdretter import Oppdretter
+from ..parsers.poststed._poststed import Poststed
+from ..parsers.siegervinner._siegervinner import Siegervinner
+from ..parsers.sykdom._sykdom import Sykdom
+from ..parsers.tyskull._tyskull import TysKull
+from ..parsers.utstillingsamleres._utstillingsamleres import Utstillingsamleres
+from ..parsers.utststat._utststat import UtStStat
+from ..parsers.utststattotal._utststattotal import UtStStatTotal
+from ..runners._tables import EXPORT_FILES
+from ..utils._conversion import DATAEASE_CHARACTERS
+from ._synthetic import synthetic_schema
+
+# The model of each table of a Hunder export
+EXPORT_MODELS = {
+    'HUNDER': Hund,
+    'EIERE': Eier,
+    'INNAVL': Innavl,
+    'OPPDRETTERE': Oppdretter,
+    'TYSKULL': TysKull,
+    'UTSTILLINGSAMLERES': Utstillingsamleres,
+    'POSTSTEDER': Poststed,
+    'SIEGERVINNER': Siegervinner,
+    'SIEGERVINNER2': Siegervinner,
+    'KULL': Kull,
+    'HDSTAT': HDStat,
+    'UTSTSTAT': UtStStat,
+    'KÅRINGER': Kaaringer,
+    'NV': Nv,
+    'UTSTSTATTOTAL': UtStStatTotal,
+    'KÅRINGSBESKRIVELSER': Kaaringsbeskrivelse,
+    'SYKDOMMER': Sykdom,
+    'HDSTATFARMORFAR': HdStatFarMorFar,
+    'HDSTATMORFARFAR': HdStatFarMorFar,
+}
+
+# What a record of each table describes, tables that are not listed describe a dog
+_SUBJECTS = {'KULL': 'litter', 'TYSKULL': 'litter', 'SYKDOMMER': 'litter', 'OPPDRETTERE': 'kennel', 'POSTSTEDER': 'postnr'}
+
+# Puppies per litter, the dogs of litter i are i * LITTER_LEN to i * LITTER_LEN + LITTER_LEN - 1
+LITTER_LEN = 5
+
+# Dogs at the start of the pedigree without parents
+_FOUNDERS = 1000
+
+# Parents are picked among the dogs registered shortly before the litter
+_GENERATION_WINDOW = 50000
+
+# The single byte DataEase stores for each character outside ASCII, the reverse of DATAEASE_CHARACTERS
+_ENCODING = {character: byte for byte, character in sorted(DATAEASE_CHARACTERS.items(), reverse=True)}
+
+# The bytes without a single character, written in the text as the placeholders graceful_conversion decodes
+# them to, so the generated strings also take its chained conversions (\xff is dropped when decoded)
+_PLACEHOLDER_ENCODING = {'?x93?': 0x93, '?x96?': 0x96, '?xfe?': 0xfe, '?xff?': 0xff}
+_PLACEHOLDER = re.compile('(' + '|'.join(re.escape(placeholder) for placeholder in _PLACEHOLDER_ENCODING) + ')')
+
+# Words that names are made of, including the characters DataEase stores as single bytes
+_DOG_NAMES = ['ICCARO', 'LEILA', 'NOLA', 'SCOTT', 'ISSO', 'HACH', 'LUNA', 'MACATO', 'FRISBEE', 'POLO', 'BJØRN', 'TÅKE',
+              'FRØYA', 'ÆSKE', 'MÖLLI', 'JÜRGEN', 'RÖDI', 'ÉLAN', 'DOÑA', 'ZÉLIE', 'ÅSA', 'KÄTHE', 'ODIN', 'TYR']
+_KENNEL_PREFIXES = ['AV', 'VOM', 'V.D.', 'DE LA', 'VON', 'FRA']
+_KENNEL_WORDS = ['PERLEGÅRDEN', 'HÜHNEGRAB', 'HOLTKÄMPER SEE', 'RÖDERBURG', 'CHAMIROX', 'BØLGEN', 'SKOGLY', 'FJELLHØI',
+                 'GRÜNWALD', 'PARC À MITRAILLES', 'ÆRLIGHET', 'NORDLYS', 'STORMØYA', 'VAL DE LA HOUÉE', 'ULVEHØGDA',
+                 'BIRKENSTEIN?xff?']
+_PEOPLE = ['Kari', 'Ola', 'Åse', 'Bjørn', 'Jürgen', 'Sindre', 'Ingrid', 'Mette', 'Hélène', 'Øystein', 'Ærle', 'Tove']
+_SURNAMES = ['Nordmann', 'Hansen', 'Løvås', 'Müller', 'Åsheim', 'Osnes', 'Bræk', 'Dahl', 'Strøm', 'Ødegård']
+_PLACES = ['OSLO', 'BERGEN', 'TRONDHEIM', 'TROMSØ', 'ÅLESUND', 'BODØ', 'LILLEHAMMER', 'FØRDE', 'MOSJØEN', 'HØNEFOSS']
+_STREETS = ['Storgata', 'Kirkeveien', 'Bjørkelia', 'Skogveien', 'Fjordgata', 'Åsveien', 'Møllebakken', 'Løkkeveien']
+_WORDS = ['god', 'meget', 'pen', 'sterk', 'bløt', 'kåret', 'fri', 'svak', 'middels', 'rygg', 'hode', 'øre', 'bær',
+          'bevegelse', 'gemytt', 'normal', 'for', 'lang', 'kort', 'ukjent',
+          'h?x93?y', 'r?x96?d', 'l?xfe?s']
+
+_MASK = (1 << 64) - 1
+
+def _mix(a: int, b: int) -> int:
+    """Deterministic 64 bit hash of two integers (splitmix64), every fact about a dog is derived from its index"""
+
+    x = (a * 0x9E3779B97F4A7C15 + b * 0xBF58476D1CE4E5B9 + 0x94D049BB133111EB) & _MASK
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK
+    return x ^ (x >> 31)
+
+def encode_text(text: str) -> bytes:
+    """Encodes a string the way DataEase stores it, the reverse of graceful_conversion"""
+
+    # The placeholders are kept as parts of their own by the capturing split
+    return b''.join(
+        bytes([_PLACEHOLDER_ENCODING[part]]) if part in _PLACEHOLDER_ENCODING else
+        bytes(_ENCODING[character] if character in _ENCODING else ord(character) for character in part)
+        for part in _PLACEHOLDER.split(text)
+    )
+
+class SyntheticExport:
+    """Consistent synthetic contents for every table of a Hunder export
+
+    Dogs, litters, kennels and postal codes are numbered, and every fact about them (parents, names, dates,
+    kennel, postal code) is derived from their number and the seed. The tables therefore reference each other
+    the way a real export does: parents are earlier dogs of the same HUNDER table, litters are found in KULL
+    and kennels in OPPDRETTERE, whatever the order or number of records generated.
+    """
+
+    _seed: int # Seed mixed into every derived fact
+    _dogs: int # Number of dogs in HUNDER
+    _kennels: int # Number of kennels in OPPDRETTERE
+    _postnrs: int # Number of postal codes in POSTSTEDER
+    _fillers: Dict[type, List[Tuple[int, int, Callable]]] # Offset, width and value of each column, by model
+
+    def __init__(self, dogs: int, seed: int = 0) -> None:
+        self._seed = seed
+        self._dogs = max(dogs, LITTER_LEN)
+        self._kennels = max(self._dogs // 50, 1)
+        self._postnrs = min(max(self._dogs // 20, 10), 9000)
+        self._fillers = {}
+
+    @property
+    def litters(self) -> int:
+        return self._dogs // LITTER_LEN
+
+    def counts(self) -> Dict[str, int]:
+        """Default number of records of every table"""
+
+        counts = {}
+        for table in EXPORT_MODELS:
+            subject = _SUBJECTS.get(table, 'dog')
+            if table in ('HUNDER', 'EIERE'):
+                counts[table] = self._dogs
+            elif table == 'TYSKULL':
+                counts[table] = max(self.litters // 10, 1)
+            elif subject == 'litter':
+                counts[table] = self.litters
+            elif subject == 'kennel':
+                counts[table] = self._kennels
+            elif subject == 'postnr':
+                counts[table] = self._postnrs
+            else:
+                counts[table] = max(self._dogs // 4, 1)
+        return counts
+
+    # Facts derived from the numbers
+
+    def _hash(self, kind: int, index: int) -> int:
+        return _mix(index, (self._seed << 20) + kind)
+
+    def reg_nr(self, dog: int) -> str:
+        return '' if dog < 0 else f'{dog % 100000 + 1}/{dog // 100000 % 100:02}'
+
+    def parents(self, litter: int) -> Tuple[int, int]:
+        """Father and mother of a litter, -1 for the founders"""
+
+        first = litter * LITTER_LEN
+        if first < _FOUNDERS:
+            return -1, -1
+        # Dogs with an even number are male, those with an odd number female
+        pairs = min(first, _GENERATION_WINDOW) // 2
+        father = (first // 2 - 1 - self._hash(1, litter) % pairs) * 2
+        mother = (first // 2 - 1 - self._hash(2, litter) % pairs) * 2 + 1
+        return father, mother
+
+    def litter_of(self, dog: int) -> int:
+        return dog // LITTER_LEN
+
+    def kullnr(self, litter: int) -> str:
+        digits = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        kullnr = ''
+        for _ in range(5):
+            litter, digit = divmod(litter, 36)
+            kullnr = digits[digit] + kullnr
+        return kullnr
+
+    def kennel_of(self, litter: int) -> int:
+        return self._hash(3, litter) % self._kennels
+
+    def kennel_name(self, kennel: int, prefixed: bool = True) -> str:
+        name = _KENNEL_WORDS[kennel % len(_KENNEL_WORDS)]
+        if kennel >= len(_KENNEL_WORDS):
+            name = f'{name} {kennel // len(_KENNEL_WORDS)}'
+        return f'{_KENNEL_PREFIXES[self._hash(4, kennel) % len(_KENNEL_PREFIXES)]} {name}' if prefixed else name
+
+    def dog_name(self, dog: int) -> str:
+        if dog < 0:
+            return ''
+        return f'{_DOG_NAMES[self._hash(5, dog) % len(_DOG_NAMES)]} {self.kennel_name(self.kennel_of(self.litter_of(dog)))}'
+
+    def postnr_of(self, kennel: int) -> int:
+        return self._hash(6, kennel) % self._postnrs
+
+    def postnr(self, postnr: int) -> str:
+        return f'{postnr + 1:04}'
+
+    def place(self, postnr: int) -> str:
+        return _PLACES[postnr % len(_PLACES)]
+
+    def person(self, index: int) -> str:
+        return f'{_PEOPLE[self._hash(7, index) % len(_PEOPLE)]} {_SURNAMES[self._hash(8, index) % len(_SURNAMES)]}'
+
+    def address(self, index: int) -> str:
+        return f'{_STREETS[self._hash(9, index) % len(_STREETS)]} {self._hash(10, index) % 120 + 1}'
+
+    def born(self, litter: int) -> date:
+        """Litters are born in the order of their number, from 1970 to 2022"""
+
+        return date(1970, 1, 1) + timedelta(days=litter * 19000 // max(self.litters, 1) + self._hash(11, litter) % 30)
+
+    # Records
+
+    def _subject(self, table: str, index: int) -> Tuple[int, int, int, int]:
+        """The dog, litter, kennel and postal code a record describes"""
+
+        subject = _SUBJECTS.get(table, 'dog')
+        if subject == 'postnr':
+            return -1, -1, -1, index % self._postnrs
+        if subject == 'kennel':
+            kennel = index % self._kennels
+            return -1, -1, kennel, self.postnr_of(kennel)
+
+        if subject == 'litter':
+            litter = index % self.litters
+            dog = litter * LITTER_LEN
+        elif table in ('HUNDER', 'EIERE'):
+            dog = index % self._dogs
+            litter = self.litter_of(dog)
+        else:
+            dog = self._hash(100 + list(EXPORT_MODELS).index(table), index) % self._dogs
+            litter = self.litter_of(dog)
+        kennel = self.kennel_of(litter)
+        return dog, litter, kennel, self.postnr_of(kennel)
+
+    def _filler(self, name: str, field_format: str, conversion: str, column: int) -> Callable:
+        """Function giving the value of a column from the index of the record and its subject"""
+
+        # Columns draw their values from hashes of their own
+        salt = 1000 + column * 16
+
+        def text(value: Callable) -> Callable:
+            return lambda index, subject: encode_text(value(index, subject))
+
+        numbered = re.fullmatch(r'(?:reg_nr|hund)(\d+)', name)
+        if numbered is not None:
+            # The puppies of the litter
+            puppy = int(numbered.group(1)) - 1
+            return text(lambda index, s: self.reg_nr(s[1] * LITTER_LEN + puppy) if puppy < LITTER_LEN else '')
+        if name == 'reg_nr':
+            return text(lambda index, s: self.reg_nr(s[0]))
+        if name in ('farens_reg_nr', 'morens_reg_nr'):
+            parent = 0 if name == 'farens_reg_nr' else 1
+            return text(lambda index, s: self.reg_nr(self.parents(s[1])[parent]))
+        if name == 'morfars_reg_nr':
+            return text(lambda index, s: self.reg_nr(self.parents(self.litter_of(max(self.parents(s[1])[1], 0)))[0]))
+        if name in ('far', 'farens_navn', 'mor', 'morens_navn'):
+            parent = 0 if name.startswith('far') else 1
+            return text(lambda index, s: self.dog_name(self.parents(s[1])[parent]))
+        if name == 'navn':
+            return text(lambda index, s: self.dog_name(s[0]))
+        if name in ('kennel', 'nkennel', 'kunkennel'):
+            return text(lambda index, s: self.kennel_name(s[2], name != 'kunkennel'))
+        if name in ('kullnr', 'kull'):
+            return text(lambda index, s: self.kullnr(s[1]))
+        if name == 'postnr':
+            return text(lambda index, s: self.postnr(s[3]))
+        if name == 'sted':
+            return text(lambda index, s: self.place(s[3]))
+        if name in ('eier', 'oppdr'):
+            return text(lambda index, s: self.person(s[2] if s[0] < 0 else s[0]))
+        if name == 'adresse':
+            return text(lambda index, s: self.address(s[2]))
+        if name.startswith('tlf'):
+            return text(lambda index, s: f'{self._hash(13, s[2]) % 90000000 + 10000000}')
+        if name in ('aar', 'aaaar'):
+            return text(lambda index, s: str(self.born(s[1]).year + 2))
+
+        if conversion in ('date', 'date_strict'):
+            def value(index, s):
+                day = self.born(s[1]) if name == 'fodt' else self.born(s[1]) + timedelta(days=self._hash(salt + 0, index) % 2000)
+                # Lenient dates are left empty now and then, like in the real tables
+                if conversion == 'date' and self._hash(salt + 1, index) % 33 == 0:
+                    return b''
+                return day.strftime('%d%m%y').encode('ascii')
+            return value
+        if conversion == 'decimal':
+            return lambda index, s: b'\x00\x00\x00\x80' if self._hash(salt + 2, index) % 10 == 0 else struct.pack('f', self._hash(salt + 3, index) % 400 / 4)
+        if field_format == 'H':
+            null = conversion == 'null'
+            return lambda index, s: struct.pack('<H', 32768 if null and self._hash(salt + 4, index) % 20 == 0 else self._hash(salt + 5, index) % 1000)
+        if field_format == 'B':
+            if name == 'kjonn_id':
+                return lambda index, s: bytes([1 + s[0] % 2])
+            if name.endswith('_id'):
+                # The synthetic schema has two values per enum besides the leading NULL
+                return lambda index, s: bytes([self._hash(salt + 6, index) % 3])
+            return lambda index, s: bytes([128 if conversion == 'null' and self._hash(salt + 7, index) % 20 == 0 else self._hash(salt + 8, index) % 20])
+
+        # Free text, a few words or nothing
+        width = int(field_format[:-1])
+        def words(index, s):
+            count = self._hash(salt + 9, index) % 4
+            return ' '.join(_WORDS[self._hash(salt + 10 + i, index) % len(_WORDS)] for i in range(count))[:width]
+        return text(words)
+
+    def record(self, table: str, index: int) -> bytes:
+        """Record index of a table"""
+
+        element_type = EXPORT_MODELS[table]
+        fillers = self._fillers.get(element_type)
+        if fillers is None:
+            layout = element_type.layout
+            fillers = self._fillers[element_type] = [
+                (offset, int(field_format[:-1]) if field_format.endswith('s') else struct.calcsize(field_format),
+                 self._filler(name, field_format, layout.conversions[name], column))
+                for column, ((name, field_format), offset) in enumerate(zip(layout.fields, layout.offsets))
+            ]
+
+        subject = self._subject(table, index)
+        content = bytearray(element_type.layout.record_len)
+        for offset, width, filler in fillers:
+            value = filler(index, subject)[:width]
+            content[offset:offset + len(value)] = value
+        return bytes(content)
+
+def write_synthetic_export(export_folder: str, dogs: int = 100000, seed: int = 0, counts: Dict[str, int] = None, chunk_len: int = 10000) -> Dict[str, int]:
+    """Writes a .DBA/.DBM pair for every table of a Hunder export, named like the files of a real export
+
+    The number of records of each table defaults to SyntheticExport.counts for the number of dogs, and can be
+    overridden by table name. Records are written in chunks of chunk_len, so exports of any size can be
+    generated in constant memory. Returns the number of records written by table.
+    """
+
+    export = SyntheticExport(dogs, seed)
+    table_counts = export.counts()
+    table_counts.update(counts or {})
+
+    os.makedirs(export_folder, exist_ok=True)
+    for file_name, table in EXPORT_FILES.items():
+        source_definition = os.path.join(export_folder, file_name)
+        with open(source_definition + '.DBA', 'wb') as f:
+            f.write(synthetic_schema(EXPORT_MODELS[table]))
+
+        with open(source_definition + '.DBM', 'wb') as f:
+            for start in range(0, table_counts[table], chunk_len):
+                f.write(b''.join(export.record(table, i) for i in range(start, min(start + chunk_len, table_counts[table]))))
+
+        print(f'{table}: {table_counts[table]} records written to {file_name}')
+
+    return table_counts
\ No newline at end of file
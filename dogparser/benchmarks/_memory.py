@@ -0,0 +1,51 @@
+import gc
+import io
+import contextlib
+import tracemalloc
+from typing import List
+
+from ._synthetic import synthetic_record
+
+def _decoded_size(element_type: type, contents: List[bytes]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        elements = [element_type.from_bytes(content) for content in contents]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del elements
+    return size
+
+def dict_model(element_type: type) -> type:
+    """The model rebuilt without __slots__, so its instances keep their attributes in a __dict__
+
+    A subclass would inherit the slots of the model and still store every attribute in them, so the class is
+    created again from the model's own namespace, leaving out the slot descriptors. LazyRecord keeps its
+    _content slot, which is not set for records decoded by from_bytes.
+    """
+
+    slots = set(element_type.__dict__.get('__slots__', ()))
+    namespace = {name: value for name, value in element_type.__dict__.items() if name not in slots and name not in ('__slots__', '__dict__', '__weakref__')}
+    return type(element_type.__name__, element_type.__bases__, namespace)
+
+def measure_memory(element_type: type, count: int = 100000) -> dict:
+    """Measures the memory held by count decoded records of a model, compared to the same model with a __dict__
+
+    Both decode through the same from_bytes, see dict_model.
+    """
+
+    contents = [synthetic_record(element_type, i) for i in range(count)]
+    dict_type = dict_model(element_type)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        slotted = _decoded_size(element_type, contents)
+        unslotted = _decoded_size(dict_type, contents)
+
+    return {
+        'model': element_type.__name__,
+        'records': count,
+        'slots_bytes': slotted,
+        'dict_bytes': unslotted,
+        'reduction': 1 - slotted / unslotted,
+    }
@@ -0,0 +1,92 @@
+import contextlib
+import importlib
+import io
+import os
+import struct
+import tempfile
+import timeit
+import tracemalloc
+from typing import Callable, Iterable
+
+from ..utils import date_conversion, extract_decimal, graceful_conversion
+from ._synthetic import synthetic_record, write_synthetic_table
+
+# Timed runs of each benchmark, the fastest is reported so a busy machine does not read as a regression
+REPEATS = 5
+
+# Bytes without a single character in the decoding table, strings with them take the chained conversions
+FALLBACK_CHARACTERS = '\x93\x96\xfe\xff'
+
+def _rate(function: Callable, inputs: Iterable, count: int, repeats: int = REPEATS) -> dict:
+    """Calls function on every input, returns the records per second of the fastest of repeats runs and the
+    peak memory of a traced run that keeps the results alive"""
+
+    def run() -> None:
+        for data in inputs:
+            function(data)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed = min(timeit.repeat(run, number=1, repeat=repeats))
+
+        tracemalloc.start()
+        try:
+            results = [function(data) for data in inputs]
+            _, peak = tracemalloc.get_traced_memory()
+            del results
+        finally:
+            tracemalloc.stop()
+
+    return {'records': count, 'seconds': elapsed, 'records_per_second': count / elapsed, 'peak_bytes': peak}
+
+def measure_decoding(element_type: type, count: int = 100000, repeats: int = REPEATS) -> dict:
+    """Measures element_type.from_bytes over count synthetic records"""
+
+    contents = [synthetic_record(element_type, i) for i in range(count)]
+    return {'benchmark': f'{element_type.__name__}.from_bytes', **_rate(element_type.from_bytes, contents, count, repeats)}
+
+def measure_conversions(count: int = 100000, repeats: int = REPEATS) -> list:
+    """Measures graceful_conversion, date_conversion and extract_decimal over count synthetic values each
+
+    The strings are measured twice, with the bytes of the single pass table and with the rare bytes
+    of FALLBACK_CHARACTERS that fall back on the chained conversions. The dates cover every day of a
+    century, so the date cache is exercised the way a real table does.
+    """
+
+    strings = [f'Kennel {i} \x9b\x86\x8f'.encode('latin-1').ljust(32, b'\x00') for i in range(count)]
+    fallback_strings = [f'Kennel {i} \x9b{FALLBACK_CHARACTERS[i % 4]}\x8f'.encode('latin-1').ljust(32, b'\x00') for i in range(count)]
+    dates = [f'{i % 28 + 1:02}{i // 28 % 12 + 1:02}{i // 336 % 100:02}'.encode() for i in range(count)]
+    decimals = [struct.pack('f', i * 0.25) if i % 10 else b'\x00\x00\x00\x80' for i in range(count)]
+
+    return [
+        {'benchmark': 'graceful_conversion', **_rate(graceful_conversion, strings, count, repeats)},
+        {'benchmark': 'graceful_conversion fallback', **_rate(graceful_conversion, fallback_strings, count, repeats)},
+        {'benchmark': 'date_conversion', **_rate(date_conversion, dates, count, repeats)},
+        {'benchmark': 'extract_decimal', **_rate(extract_decimal, decimals, count, repeats)},
+    ]
+
+def measure_parse(element_type: type, count: int = 100000, output_format: str = 'jsonl', repeats: int = REPEATS) -> dict:
+    """Measures the parse of the table of a model end to end, from a synthetic .DBA/.DBM pair to its output
+
+    The fastest of repeats parses is reported, and one more is traced for its peak memory.
+    """
+
+    parser = importlib.import_module(element_type.__module__.rsplit('.', 1)[0])
+
+    with tempfile.TemporaryDirectory() as folder:
+        source_definition = os.path.join(folder, 'SOURCE')
+        write_synthetic_table(element_type, source_definition, count)
+        os.makedirs(os.path.join(folder, 'OUT'))
+
+        # The schema cache would skip reading the schema after the first run
+        environment = os.environ.get('DOGPARSER_CACHE')
+        os.environ['DOGPARSER_CACHE'] = ''
+        try:
+            result = _rate(lambda destination: parser.parse(source_definition, destination, output_format),
+                           [os.path.join(folder, 'OUT')], count, repeats)
+        finally:
+            if environment is None:
+                del os.environ['DOGPARSER_CACHE']
+            else:
+                os.environ['DOGPARSER_CACHE'] = environment
+
+    return {'benchmark': f'{element_type.__name__} parse', **result}
\ No newline at end of file
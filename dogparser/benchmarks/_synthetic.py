@@ -0,0 +1,95 @@
+import os
+from typing import Dict, List, Tuple
+
+from ..parsers.eier._eier import Eier
+from ..parsers.hdstat._hdstat import HDStat
+from ..parsers.hdstatfarmorfar._hdstatfarmorfar import HdStatFarMorFar
+from ..parsers.hund._hund import Hund
+from ..parsers.innavl._innavl import Innavl
+from ..parsers.kaaringer._kaaringer import Kaaringer
+from ..parsers.kaaringsbeskrivelse._kaaringsbeskrivelse import Kaaringsbeskrivelse
+from ..parsers.kull._kull import Kull
+from ..parsers.nv._nv import Nv
+from ..parsers.oppdretter._oppdretter import Oppdretter
+from ..parsers.poststed._poststed import Poststed
+from ..parsers.siegervinner._siegervinner import Siegervinner
+from ..parsers.sykdom._sykdom import Sykdom
+from ..parsers.tyskull._tyskull import TysKull
+from ..parsers.utstillingsamleres._utstillingsamleres import Utstillingsamleres
+from ..parsers.utststat._utststat import UtStStat
+from ..parsers.utststattotal._utststattotal import UtStStatTotal
+
+# Every record model, in the order of the tables in the README
+MODELS = [Hund, Eier, Innavl, Oppdretter, TysKull, Utstillingsamleres, Poststed, Siegervinner, Kull, HDStat, UtStStat,
+          Kaaringer, Nv, UtStStatTotal, Kaaringsbeskrivelse, Sykdom, HdStatFarMorFar]
+
+# The first column name and the enums the schema reader of each model looks for, in the order it reads them
+SCHEMAS: Dict[type, Tuple[bytes, List[bytes]]] = {
+    Hund: (b'REG.NR', [b'LAND', b'kj\x9bnn', b'HD', b'AD', b'HEM', b'UTD', b'UTD2', b'UTMER', b'VIN', b'K\x8fRET', b'ZB',
+                       b'KKL', b'BRUKS', b'PREM', b'KVAL', b'KVAL2', b'TEST', b'HDH']),
+    Eier: (b'REG.NR', []),
+    Innavl: (b'REG.NR', []),
+    Oppdretter: (b'KENNEL', [b'PREFIKS', b'LAND', b'OPREFIKS']),
+    TysKull: (b'TOM1', [b'kj\x9bnn', b'k\x86ret', b'Meritter', b'hd']),
+    Utstillingsamleres: (b'REG.NR', [b'kj\x9bnn']),
+    Poststed: (b'POSTNR', [b'LAND', b'FYLKE']),
+    Siegervinner: (b'REG.NR', [b'GRAD', b'LAND', b'KLASSE', b'ZB']),
+    Kull: (b'b1', [b'LAND', b'HD']),
+    HDStat: (b'REG.NR', [b'kj\x9bnn']),
+    UtStStat: (b'REG.NR', []),
+    Kaaringer: (b'MERITTER', [b'KTID']),
+    Nv: (b'\x8f\x8fR', [b'GRAD', b'LAND', b'KLASSE', b'ZB']),
+    UtStStatTotal: (b'REG.NR', [b'kj\x9bnn']),
+    Kaaringsbeskrivelse: (b'REG.NR', []),
+    Sykdom: (b'KENNEL', []),
+    HdStatFarMorFar: (b'REG.NR', []),
+}
+
+def synthetic_record(element_type: type, index: int) -> bytes:
+    """Builds a valid record for a model, with strings and numbers that vary with the index"""
+
+    layout = element_type.layout
+    content = bytearray(layout.record_len)
+    for (name, field_format), offset in zip(layout.fields, layout.offsets):
+        conversion = layout.conversions[name]
+        if conversion in ('date', 'date_strict'):
+            value = f'{index % 28 + 1:02}{index % 12 + 1:02}{index % 100:02}'.encode()
+        elif conversion == 'decimal':
+            value = b'\x00\x00\x00\x80' # Null
+        elif field_format.endswith('s'):
+            width = int(field_format[:-1])
+            value = f'{name[:3].upper()}{index}'.encode()[:width]
+        elif field_format == 'H':
+            value = (index % 1000).to_bytes(2, 'little')
+        else:
+            value = bytes([index % 100])
+        content[offset:offset + len(value)] = value
+
+    return bytes(content)
+
+def synthetic_schema(element_type: type) -> bytes:
+    """Builds a .DBA file the schema reader of a model accepts, the columns are named after the layout and every
+    enum has the two values A and B
+    """
+
+    first_column, enums = SCHEMAS[element_type]
+    names = [first_column] + [name.upper().encode('ascii') for name in element_type.layout.names[1:]]
+
+    # A count byte in front of the column names and of the values of every enum, all separated by NULL bytes
+    schema = [b'DBA', bytes([len(names)]) + names[0], *names[1:], b'nei', b'ja']
+    for enum in enums:
+        schema += [enum, b'\x02A', b'B']
+
+    return b'\x00'.join(schema) + b'\x00'
+
+def write_synthetic_table(element_type: type, source_definition: str, count: int) -> None:
+    """Writes a .DBA/.DBM pair with count synthetic records for a model, source_definition is the path without extension"""
+
+    os.makedirs(os.path.dirname(os.path.abspath(source_definition)), exist_ok=True)
+
+    with open(source_definition + '.DBA', 'wb') as f:
+        f.write(synthetic_schema(element_type))
+
+    with open(source_definition + '.DBM', 'wb') as f:
+        for i in range(count):
+            f.write(synthetic_record(element_type, i))
\ No newline at end of file
@@ -1,9 +1,24 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, date_conversion, RecordLayout, LazyRecord
+
+# The owner table contains a 4 byte header that does not contain usefull data
+_LAYOUT = RecordLayout(record_len=180, header_len=4, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (registration number is a string capped at 12 characters)
+    ('kullnr', '5s', 'str'), # KULLNR (litter number/identifier is a string capped at 5 characters)
+    ('navn', '36s', 'str'), # NAVN (name of dog is a string capped at 36 characters)
+    ('kennel', '26s', 'str'), # KENNEL (name of kennel is a string capped at 26 characters)
+    ('eier', '50s', 'str'), # EIER (name of owner is a string capped at 50 characters)
+    ('sted', '40s', 'str'), # STED (Address is a string capped at 40 characters)
+    ('postnr', '7s', 'str'), # POSTNR (postal code is a string capped at 7 characters)
+])
+
+class Eier(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_kullnr', '_navn', '_kennel', '_eier', '_sted', '_postnr')
 
-class Eier:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _kullnr: Union[str, None] # Litter identifier (KULLNR in original schema)
     _navn: str # Name (NAVN in original schema)
@@ -28,38 +43,18 @@ class Eier:
     def from_bytes(cls, content: bytes):
         if len(content) != 180:
             raise AssertionError('Input for Eier should be 180 bytes')
-        
-        # The owner table contains a 4 byte header that does not contain usefull data
-        header = content[:4]
-
-        # Eliminate the already used data and set the next property
-        sub_content = content[4:] # 176 bytes remaining
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (registration number is a string capped at 12 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 164 bytes remaining
-        kullnr = graceful_conversion(sub_content[:5]) # KULLNR (litter number/identifier is a string capped at 5 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[5:] # 159 bytes remaining
-        navn = graceful_conversion(sub_content[:36]) # NAVN (name of dog is a string capped at 36 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[36:] # 123 bytes remaining
-        kennel = graceful_conversion(sub_content[:26]) # KENNEL (name of kennel is a string capped at 26 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[26:] # 97 bytes remaining
-        eier = graceful_conversion(sub_content[:50]) # EIER (name of owner is a string capped at 50 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[50:] # 47 bytes remaining
-        sted = graceful_conversion(sub_content[:40]) # STED (Address is a string capped at 40 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[40:] # 7 bytes remaining
-        postnr = graceful_conversion(sub_content[:7]) # POSTNR (postal code is a string capped at 7 characters)
-        
+
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, kullnr, navn, kennel, eier, sted, postnr) = _LAYOUT.unpack(content)
+
+        reg_nr = graceful_conversion(reg_nr)
+        kullnr = graceful_conversion(kullnr)
+        navn = graceful_conversion(navn)
+        kennel = graceful_conversion(kennel)
+        eier = graceful_conversion(eier)
+        sted = graceful_conversion(sted)
+        postnr = graceful_conversion(postnr)
+
         return cls(
             reg_nr=reg_nr,
             kullnr=kullnr,
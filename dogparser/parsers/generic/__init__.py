@@ -0,0 +1 @@
+from ._parser import parse
\ No newline at end of file
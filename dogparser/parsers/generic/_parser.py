@@ -0,0 +1,23 @@
+import os
+
+from ...utils import decode_records, write_records, load_layout, LayoutDecoder, read_checkpoint
+
+def parse(source_definition: str, destination_folder: str, layout_file: str, output_format: str = 'json', workers: int = 1, checkpoint_len: int = 0, resume: bool = False) -> int:
+
+    # Read the layout of the table
+    layout = load_layout(layout_file)
+
+    # Read the data
+    data_file = source_definition + '.DBM'
+
+    # The output is named after the layout file
+    name = os.path.splitext(os.path.basename(layout_file))[0].lower()
+
+    # Continue after the records an interrupted run already wrote
+    start = read_checkpoint(destination_folder, name, output_format) if resume else 0
+
+    # The records are decoded by a decoder compiled from the layout
+    elements = decode_records(LayoutDecoder(layout), data_file, layout.record_len, workers, start=start)
+
+    # Write the data
+    return write_records(elements, destination_folder, name, output_format, checkpoint_len, resume)
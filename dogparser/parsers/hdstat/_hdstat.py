@@ -1,10 +1,31 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, parse_date, anomaly, RecordLayout, LazyRecord
+
+# The HD Statistics table contains a 5 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=79, header_len=5, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('fodselsaar', 'B', 'null'), # FØDSELSÅR (Birth year is a 1 byte integer)
+    ('navn', '38s', 'str'), # NAVN (Name is a string capped at 38 characters)
+    ('kjonn_id', 'B'), # KJØNN (Sex of dog is an enum represented by a 1 byte integer)
+    ('antkull', 'H', 'null'), # ANTKULL (Number of litters is a 2 byte integer)
+    ('ant', 'H', 'null'), # ANT (Number of children is a 2 byte integer)
+    ('ro', 'H'), # RØ (RØ is a 2 byte integer)
+    ('sistedato', '6s', 'date'), # SISTEDATO (Last child date is represented by a 6 digit numerical string)
+    ('fri', 'H', 'null'), # FRI (FRI? is a 2 byte integer)
+    ('svak', 'H', 'null'), # SVAK (SVAK? is a 2 byte integer)
+    ('midd', 'H', 'null'), # MIDD (MIDD? is a 2 byte integer)
+    ('sterk', 'H', 'null'), # STERK (STERK is a 2 byte integer)
+    ('hd', 'H', 'null'), # HD (HD? is a 2 byte integer)
+])
+
+class HDStat(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_fodselsaar', '_navn', '_kjonn_id', '_antkull', '_ant', '_ro', '_sistedato',
+                 '_sistedato_raw', '_fri', '_svak', '_midd', '_sterk', '_hd')
 
-class HDStat:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _fodselsaar: Union[int, None] # Birth year (FØDSELSÅR in original schema)
     _navn: Union[str, None] # Name (NAVN in original schema)
@@ -45,86 +66,25 @@ class HDStat:
         if len(content) != 79:
             raise AssertionError("Input for HDStat should be 79 bytes")
 
-        # The HD Statistics table contains a 5 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[5:]
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, fodselsaar, navn, kjonn_id, antkull, ant, ro, sistedato_data, fri, svak, midd, sterk, hd) = _LAYOUT.unpack(content)
 
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the FØDSELSÅR property
-        fodselsaar = sub_content[0] # FØDSELSÅR (Birth year is a 1 byte integer)
+        reg_nr = graceful_conversion(reg_nr)
         fodselsaar = None if fodselsaar == 128 else fodselsaar # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the NAVN property
-        navn = graceful_conversion(sub_content[:38]) # NAVN (Name is a string capped at 38 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[38:]
-
-        # Parse the KJØNN property
-        kjonn_id = sub_content[0] # KJØNN (Sex of dog is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the ANTKULL property
-        antkull = struct.unpack('H', sub_content[:2])[0] # ANTKULL (Number of litters is a 2 byte integer)
+        navn = graceful_conversion(navn)
         antkull = None if antkull == 32768 else antkull # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the ANT property
-        ant = struct.unpack('H', sub_content[:2])[0] # ANT (Number of children is a 2 byte integer)
         ant = None if ant == 32768 else ant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the RØ property
-        ro = struct.unpack('H', sub_content[:2])[0] # RØ (RØ is a 2 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the SISTEDATO property
-        sistedato = None
-        sistedato_raw = graceful_conversion(sub_content[:6])
-        try:
-            sistedato = date_conversion(sub_content[:6]) # SISTEDATO (Last child date is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)        # Remove used data from next entries
-        sub_content = sub_content[6:]
-
-        # Parse the FRI property
-        fri = struct.unpack('H', sub_content[:2])[0] # FRI (FRI? is a 2 byte integer)
-        fri = None if fri == 32768 else fri # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
 
-        # Parse the SVAK property
-        svak = struct.unpack('H', sub_content[:2])[0] # SVAK (SVAK? is a 2 byte integer)
-        svak = None if svak == 32768 else svak # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        sistedato_date = parse_date(sistedato_data)
+        sistedato, sistedato_raw = sistedato_date.date, sistedato_date.raw
+        if sistedato_date.error is not None:
+            anomaly('invalid date', 'sistedato', sistedato_raw)
 
-        # Parse the MIDD property
-        midd = struct.unpack('H', sub_content[:2])[0] # MIDD (MIDD? is a 2 byte integer)
+        fri = None if fri == 32768 else fri # Set to python None if value indicates null
+        svak = None if svak == 32768 else svak # Set to python None if value indicates null
         midd = None if midd == 32768 else midd # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the STERK property
-        sterk = struct.unpack('H', sub_content[:2])[0] # STERK (STERK is a 2 byte integer)
         sterk = None if sterk == 32768 else sterk # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the HD property
-        hd = struct.unpack('H', sub_content[:2])[0] # HD (HD? is a 2 byte integer)
         hd = None if hd == 32768 else hd # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
 
         return cls(reg_nr=reg_nr,
                    fodselsaar=fodselsaar,
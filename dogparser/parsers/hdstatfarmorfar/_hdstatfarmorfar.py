@@ -1,10 +1,38 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion, extract_decimal
+from ...utils import graceful_conversion, parse_date, anomaly, extract_decimal, RecordLayout, LazyRecord
+
+# The Hd statistics table contains a 6 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=137, header_len=6, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('navn', '38s', 'str'), # NAVN (Name is a string capped at 38 characters)
+    ('reg_nrmf', '12s', 'str'), # REG.NRMF (Grandfathers registration number is a string capped at 12 characters)
+    ('morfar', '38s', 'str'), # MORFAR (Grandfather is a string capped at 38 characters)
+    ('antkull', 'H', 'null'), # ANTKULL (Number of litters is a 2 byte integer)
+    ('sistedato', '6s', 'date'), # SISTEDATO (Last child date is represented by a 6 digit numerical string)
+    ('ant', 'H', 'null'), # ANT (Number of children is a 2 byte integer)
+    ('ro', 'H', 'null'), # RØ (RØ is a 2 byte integer)
+    ('fri', 'H', 'null'), # FRI (FRI? is a 2 byte integer)
+    ('morant', 'H', 'null'), # MORANT (MORANT? is a 2 byte integer)
+    ('svak', 'H', 'null'), # SVAK (SVAK? is a 2 byte integer)
+    ('morro', 'H', 'null'), # MORRØ (MORRØ is a 2 byte integer)
+    ('midd', 'H', 'null'), # MIDD (MIDD? is a 2 byte integer)
+    ('morfri', 'H', 'null'), # MORFRI (MORFRI? is a 2 byte integer)
+    ('sterk', 'H', 'null'), # STERK (STERK is a 2 byte integer)
+    ('morc', 'B', 'null'), # MORC (MORD? is a 1 byte integer)
+    ('mord', 'B', 'null'), # MORD (MORD? is a 1 byte integer)
+    ('hd', 'H', 'null'), # HD (HD? is a 2 byte integer)
+    ('more', 'B', 'null'), # MORE (MORD? is a 1 byte integer)
+])
+
+class HdStatFarMorFar(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_navn', '_reg_nrmf', '_morfar', '_antkull', '_sistedato', '_sistedato_raw', '_ant',
+                 '_ro', '_fri', '_morant', '_svak', '_morro', '_midd', '_morfri', '_sterk', '_morc', '_mord', '_hd',
+                 '_more')
 
-class HdStatFarMorFar:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _navn: str # Name (NAVN in original schema)
     _reg_nrmf: str # Grandfathers registration number (REG.NRMF in original schema)
@@ -59,122 +87,34 @@ class HdStatFarMorFar:
         if len(content) != 137:
             raise AssertionError("Input for HdStatFarMorFar should be 137 bytes")
 
-        # The Hd statistics table contains a 6 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[6:]
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, navn, reg_nrmf, morfar, antkull, sistedato_data, ant, ro, fri, morant, svak, morro, midd,
+         morfri, sterk, morc, mord, hd, more) = _LAYOUT.unpack(content)
 
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the NAVN property
-        navn = graceful_conversion(sub_content[:38]) # NAVN (Name is a string capped at 38 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[38:]
-
-        # Parse the REG.NRMF property
-        reg_nrmf = graceful_conversion(sub_content[:12]) # REG.NRMF (Grandfathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
+        reg_nr = graceful_conversion(reg_nr)
+        navn = graceful_conversion(navn)
+        reg_nrmf = graceful_conversion(reg_nrmf)
+        morfar = graceful_conversion(morfar)
+        antkull = None if antkull == 32768 else antkull # Set to python None if value indicates null
 
-        # Parse the MORFAR property
-        morfar = graceful_conversion(sub_content[:38]) # MORFAR (Grandfather is a string capped at 38 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[38:]
+        sistedato_date = parse_date(sistedato_data)
+        sistedato, sistedato_raw = sistedato_date.date, sistedato_date.raw
+        if sistedato_date.error is not None:
+            anomaly('invalid date', 'sistedato', sistedato_raw)
 
-        # Parse the ANTKULL property
-        antkull = struct.unpack('H', sub_content[:2])[0] # ANTKULL (Number of litters is a 2 byte integer)
-        antkull = None if antkull == 32768 else antkull # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the SISTEDATO property
-        sistedato = None
-        sistedato_raw = graceful_conversion(sub_content[:6])
-        try:
-            sistedato = date_conversion(sub_content[:6]) # SISTEDATO (Last child date is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)        # Remove used data from next entries
-        sub_content = sub_content[6:]
-
-        # Parse the ANT property
-        ant = struct.unpack('H', sub_content[:2])[0] # ANT (Number of children is a 2 byte integer)
         ant = None if ant == 32768 else ant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the RØ property
-        ro = struct.unpack('H', sub_content[:2])[0] # RØ (RØ is a 2 byte integer)
         ro = None if ro == 32768 else ro # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the FRI property
-        fri = struct.unpack('H', sub_content[:2])[0] # FRI (FRI? is a 2 byte integer)
         fri = None if fri == 32768 else fri # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the MORANT property
-        morant = struct.unpack('H', sub_content[:2])[0] # MORANT (MORANT? is a 2 byte integer)
         morant = None if morant == 32768 else morant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the SVAK property
-        svak = struct.unpack('H', sub_content[:2])[0] # SVAK (SVAK? is a 2 byte integer)
         svak = None if svak == 32768 else svak # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the MORRØ property
-        morro = struct.unpack('H', sub_content[:2])[0] # MORRØ (MORRØ is a 2 byte integer)
         morro = None if morro == 32768 else morro # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the MIDD property
-        midd = struct.unpack('H', sub_content[:2])[0] # MIDD (MIDD? is a 2 byte integer)
         midd = None if midd == 32768 else midd # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the MORFRI property
-        morfri = struct.unpack('H', sub_content[:2])[0] # MORFRI (MORFRI? is a 2 byte integer)
         morfri = None if morfri == 32768 else morfri # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the STERK property
-        sterk = struct.unpack('H', sub_content[:2])[0] # STERK (STERK is a 2 byte integer)
         sterk = None if sterk == 32768 else sterk # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the MORC property
-        morc = sub_content[0] # MORC (MORD? is a 1 byte integer)
         morc = None if morc == 128 else morc # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the MORD property
-        mord = sub_content[0] # MORD (MORD? is a 1 byte integer)
         mord = None if mord == 128 else mord # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the HD property
-        hd = struct.unpack('H', sub_content[:2])[0] # HD (HD? is a 2 byte integer)
         hd = None if hd == 32768 else hd # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the MORE property
-        more = sub_content[0] # MORE (MORD? is a 1 byte integer)
         more = None if more == 128 else more # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
 
         return cls(reg_nr=reg_nr,
                    navn=navn,
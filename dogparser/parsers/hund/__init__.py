@@ -1 +1,2 @@
-from ._parser import parse
\ No newline at end of file
+from ._parser import parse
+from ._lookup import lookup
\ No newline at end of file
@@ -1,9 +1,54 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, parse_date, anomaly, RecordLayout, LazyRecord
+
+# The dog table contains a 10 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=250, header_len=10, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (registration number is a string capped at 12 characters)
+    ('fodt', '6s', 'date'), # FØDT (birthdate/født is represented by a 6 digit numerical string)
+    ('fd_land_id', 'B'), # FD-LAND index
+    ('kjonn_id', 'B'), # KJØNN index
+    ('kullnr', '5s', 'str'), # KULLNR (litter number/identifier is a string capped at 5 characters)
+    ('navn', '38s', 'str'), # NAVN (name of dog is a string capped at 38 characters)
+    ('hd_id', 'B'), # HD index
+    ('ad_id', 'B'), # AD index
+    ('kennel', '32s', 'str'), # KENNEL (name of kennel is a string capped at 32 characters)
+    ('hem_id', 'B'), # HEM index
+    ('farge', '10s', 'str'), # FARGE (color is a string capped at 10 characters)
+    ('utd_id', 'B'), # UTD index
+    ('utd2_id', 'B'), # UTD2 index
+    ('utd3_id', 'B'), # UTD3 index
+    ('utmer_id', 'B'), # UTMER index
+    ('vin_id', 'B'), # VIN index
+    ('k_id', 'B'), # K index
+    ('zb_id', 'B'), # ZB index
+    ('kkl_id', 'B'), # KKL index
+    ('bruks_id', 'B'), # BRUKS index
+    ('bruks2_id', 'B'), # BRUKS2 index
+    ('bruks3_id', 'B'), # BRUKS3 index
+    ('bruks4_id', 'B'), # BRUKS4 index
+    ('prem_id', 'B'), # PREM index
+    ('kval_id', 'B'), # KVAL index
+    ('kval2_id', 'B'), # KVAL2 index
+    ('test_id', 'B'), # TEST index
+    ('test2_id', 'B'), # TEST2 index
+    ('mer', '15s', 'str'), # Mer (Awards is a string capped at 38 characters)
+    ('farens_reg_nr', '12s', 'str'), # FARENS REG.NR (registration number is a string capped at 12 characters)
+    ('far', '38s', 'str'), # FAR (name of father is a string capped at 38 characters)
+    ('morens_reg_nr', '12s', 'str'), # MORENS REG.NR (registration number is a string capped at 12 characters)
+    ('mor', '38s', 'str'), # MOR (name of mother is a string capped at 38 characters)
+])
+
+class Hund(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_navn', '_fodt', '_fodt_raw', '_kullnr', '_kennel', '_farge', '_farens_reg_nr', '_far',
+                 '_morens_reg_nr', '_mor', '_mer', '_fd_land_id', '_kjonn_id', '_hd_id', '_ad_id', '_hem_id',
+                 '_utd_id', '_utd2_id', '_utd3_id', '_utmer_id', '_vin_id', '_k_id', '_zb_id', '_kkl_id',
+                 '_bruks_id', '_bruks2_id', '_bruks3_id', '_bruks4_id', '_prem_id', '_kval_id', '_kval2_id',
+                 '_test_id', '_test2_id')
 
-class Hund:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _navn: str # Name (NAVN in original schema)
     _fodt: Union[date, None] # Birthdate (FØDT in original schema)
@@ -95,147 +140,28 @@ class Hund:
     def from_bytes(cls, content: bytes):
         if len(content) != 250:
             raise AssertionError('Input for Hund should be 250 bytes')
-        
-        # The dog table contains a 10 byte header that does not contain useful data
-        header = content[:10]
-        sub_content = content
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[10:] # 240 bytes remaining
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (registration number is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 228 bytes remaining
-        fodt = None
-        fodt_raw = graceful_conversion(sub_content[:6])
-        try:
-            fodt = date_conversion(sub_content[:6]) # FØDT (birthdate/født is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[6:] # 222 bytes remaining
-        fd_land_id = sub_content[0] # FD-LAND index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 221 bytes remaining
-        kjonn_id = sub_content[0] # KJØNN index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 220 bytes remaining
-        kullnr = graceful_conversion(sub_content[:5]) # KULLNR (litter number/identifier is a string capped at 5 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[5:] # 215 bytes remaining
-        navn = graceful_conversion(sub_content[:38]) # NAVN (name of dog is a string capped at 38 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[38:] # 177 bytes remaining
-        hd_id = sub_content[0] # HD index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 176 bytes remaining
-        ad_id = sub_content[0] # AD index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 175 bytes remaining
-        kennel = graceful_conversion(sub_content[:32]) # KENNEL (name of kennel is a string capped at 32 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[32:] # 143 bytes remaining
-        hem_id = sub_content[0] # HEM index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 142 bytes remaining
-        farge = graceful_conversion(sub_content[:10]) # FARGE (color is a string capped at 10 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[10:] # 132 bytes remaining
-        utd_id = sub_content[0] # UTD index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 131 bytes remaining
-        utd2_id = sub_content[0] # UTD2 index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 130 bytes remaining
-        utd3_id = sub_content[0] # UTD3 index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 129 bytes remaining
-        utmer_id = sub_content[0] # UTMER index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 128 bytes remaining
-        vin_id = sub_content[0] # VIN index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 127 bytes remaining
-        k_id = sub_content[0] # K index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 126 bytes remaining
-        zb_id = sub_content[0] # ZB index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 125 bytes remaining
-        kkl_id = sub_content[0] # KKL index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 124 bytes remaining
-        bruks_id = sub_content[0] # BRUKS index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 123 bytes remaining
-        bruks2_id = sub_content[0] # BRUKS2 index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 122 bytes remaining
-        bruks3_id = sub_content[0] # BRUKS3 index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 121 bytes remaining
-        bruks4_id = sub_content[0] # BRUKS4 index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 120 bytes remaining
-        prem_id = sub_content[0] # PREM index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 119 bytes remaining
-        kval_id = sub_content[0] # KVAL index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 118 bytes remaining
-        kval2_id = sub_content[0] # KVAL2 index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 117 bytes remaining
-        test_id = sub_content[0] # TEST index
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 116 bytes remaining
-        test2_id = sub_content[0] # TEST2 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 115 bytes remaining
-        mer = graceful_conversion(sub_content[:15]) # Mer (Awards is a string capped at 38 characters)
 
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[15:] # 100 bytes remaining
-        farens_reg_nr = graceful_conversion(sub_content[:12]) # FARENS REG.NR (registration number is a string capped at 12 characters)
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, fodt_data, fd_land_id, kjonn_id, kullnr, navn, hd_id, ad_id, kennel, hem_id, farge, utd_id,
+         utd2_id, utd3_id, utmer_id, vin_id, k_id, zb_id, kkl_id, bruks_id, bruks2_id, bruks3_id, bruks4_id,
+         prem_id, kval_id, kval2_id, test_id, test2_id, mer, farens_reg_nr, far, morens_reg_nr, mor) = _LAYOUT.unpack(content)
 
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 88 bytes remaining
-        far = graceful_conversion(sub_content[:38]) # FAR (name of father is a string capped at 38 characters)
+        reg_nr = graceful_conversion(reg_nr)
 
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[38:] # 50 bytes remaining
-        morens_reg_nr = graceful_conversion(sub_content[:12]) # MORENS REG.NR (registration number is a string capped at 12 characters)
+        fodt_date = parse_date(fodt_data)
+        fodt, fodt_raw = fodt_date.date, fodt_date.raw
+        if fodt_date.error is not None:
+            anomaly('invalid date', 'fodt', fodt_raw)
 
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 38 bytes remaining
-        mor = graceful_conversion(sub_content[:38]) # MOR (name of mother is a string capped at 38 characters)
+        kullnr = graceful_conversion(kullnr)
+        navn = graceful_conversion(navn)
+        kennel = graceful_conversion(kennel)
+        farge = graceful_conversion(farge)
+        mer = graceful_conversion(mer)
+        farens_reg_nr = graceful_conversion(farens_reg_nr)
+        far = graceful_conversion(far)
+        morens_reg_nr = graceful_conversion(morens_reg_nr)
+        mor = graceful_conversion(mor)
 
         return cls(
             reg_nr=reg_nr,
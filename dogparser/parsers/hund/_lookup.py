@@ -0,0 +1,22 @@
+from typing import Dict, Union
+
+from ._hund import Hund
+from ...utils import RecordIndex
+
+# The reg_nr index of each HUNDER source, kept open for the lifetime of the process
+_INDEXES: Dict[str, RecordIndex] = {}
+
+def lookup(source_definition: str, reg_nr: str) -> Union[Hund, None]:
+    """Decodes the dog with the registration number, None if the HUNDER table has no such dog
+
+    Only the 250 byte record of the dog is decoded. The reg_nr index of the .DBM file is built on the first
+    lookup if it does not exist yet, and rebuilt if the .DBM file has changed since.
+    """
+
+    index = _INDEXES.get(source_definition)
+    if index is None or index.stale:
+        if index is not None:
+            index.close()
+        index = _INDEXES[source_definition] = RecordIndex(source_definition + '.DBM', Hund.layout)
+
+    return index.lookup(reg_nr, Hund)
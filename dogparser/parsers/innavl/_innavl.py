@@ -1,9 +1,21 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, date_conversion, RecordLayout, LazyRecord
+
+# The inbreeding table contains a 3 byte header that does not contain usefull data
+_LAYOUT = RecordLayout(record_len=289, header_len=3, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (registration number is a string capped at 12 characters)
+    ('kullnr', '5s', 'str'), # KULLNR (litter number/identifier is a string capped at 5 characters)
+    ('navn', '36s', 'str'), # NAVN (name of dog is a string capped at 36 characters)
+    ('innavl', '233s', 'str'), # KENNEL (name of kennel is a string capped at 26 characters)
+])
+
+class Innavl(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_kullnr', '_navn', '_innavl')
 
-class Innavl:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _kullnr: Union[str, None] # Litter identifier (KULLNR in original schema)
     _navn: str # Name (NAVN in original schema)
@@ -21,26 +33,15 @@ class Innavl:
     def from_bytes(cls, content: bytes):
         if len(content) != 289:
             raise AssertionError('Input for INNAVL should be 289 bytes')
-        
-        # The inbreeding table contains a 3 byte header that does not contain usefull data
-        header = content[:3]
-
-        # Eliminate the already used data and set the next property
-        sub_content = content[3:] # 286 bytes remaining
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (registration number is a string capped at 12 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 274 bytes remaining
-        kullnr = graceful_conversion(sub_content[:5]) # KULLNR (litter number/identifier is a string capped at 5 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[5:] # 269 bytes remaining
-        navn = graceful_conversion(sub_content[:36]) # NAVN (name of dog is a string capped at 36 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[36:] # 233 bytes remaining
-        innavl = graceful_conversion(sub_content[:233]) # KENNEL (name of kennel is a string capped at 26 characters)
-        
+
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, kullnr, navn, innavl) = _LAYOUT.unpack(content)
+
+        reg_nr = graceful_conversion(reg_nr)
+        kullnr = graceful_conversion(kullnr)
+        navn = graceful_conversion(navn)
+        innavl = graceful_conversion(innavl)
+
         return cls(
             reg_nr=reg_nr,
             kullnr=kullnr,
@@ -1,10 +1,7 @@
-import os
-import json
+from ...utils import extract_enum, extract_values, decode_records, write_records, load_schema, write_enums, read_checkpoint, logger
+from ._innavl import Innavl
 
-from ...utils import extract_enum, extract_values
-from ._innavl import Innavl, InnavlList
-
-def parse(source_definition: str, destination_folder: str):
+def parse(source_definition: str, destination_folder: str, output_format: str = 'json', workers: int = 1, checkpoint_len: int = 0, resume: bool = False) -> int:
     
     # Parse the schem
     parse_schema(source_definition=source_definition, destination_folder=destination_folder)
@@ -12,41 +9,33 @@ def parse(source_definition: str, destination_folder: str):
     # Read the data
     data_file = source_definition + '.DBM'
 
-    eier_list = []
-
     element_len = 289
 
-    with open(data_file, 'rb') as f:
-        i = 0
-        data = f.read(element_len)
+    # Continue after the records an interrupted run already wrote
+    start = read_checkpoint(destination_folder, 'innavl', output_format) if resume else 0
 
-        while len(data) == element_len:
-            if i and not i% 1000:
-                print(f'{i} records parsed')
-            eier = Innavl.from_bytes(data)
-            eier_list.append(eier)
-            data = f.read(element_len)
-            i+=1
+    # The records are decoded as the writer consumes them, spread over worker processes if requested
+    elements = decode_records(Innavl, data_file, element_len, workers, start=start)
 
     # Write the data
-    os.makedirs(os.path.join(destination_folder, 'DATA'), exist_ok=True)
-    with open(os.path.join(destination_folder, 'DATA/innavl.json'), 'w', encoding='utf8') as f:
-        json.dump(InnavlList(eier_list).native, f, indent=2, ensure_ascii=False)
+    return write_records(elements, destination_folder, 'innavl', output_format, checkpoint_len, resume)
 
 
 def parse_schema(source_definition: str, destination_folder: str):
     
-    # Read the schema
-    schema_file = source_definition + '.DBA'
+    # Read the schema, unless its manifest shows the DBA file was read before
+    schema = load_schema(source_definition + '.DBA', read_schema)
+
+    write_enums(schema, destination_folder)
+
 
-    with open(schema_file, 'rb') as f:
-        schema_data = f.read()
+def read_schema(schema_data: bytes) -> dict:
     
     # Strip the extraneous data and split into elements
     stripped_schema_data = schema_data[schema_data.index(b'REG.NR')-1:]
     schema_split = stripped_schema_data.split(b'\x00')
     columns, _ = extract_values(schema_split, 0, schema_data[schema_data.index(b'REG.NR')-1])
-    print(columns)
+    logger.debug(columns)
 
 
     stripped_schema_data = schema_data[schema_data.index(b'nei\x00ja'):]
@@ -55,9 +44,9 @@ def parse_schema(source_definition: str, destination_folder: str):
     enums = [
     ]
 
+    enum_values = {}
     for target, file in enums:
         # Get the enumerator
-        enum, schema_split = extract_enum(schema_split, target)
+        enum_values[file], schema_split = extract_enum(schema_split, target)
 
-        with open(os.path.join(destination_folder, file), 'w', encoding='utf8') as f:
-            json.dump(enum, f, ensure_ascii=False, indent=True)
+    return {'columns': columns, 'enums': enum_values}
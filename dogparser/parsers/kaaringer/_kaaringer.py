@@ -1,10 +1,24 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion, extract_decimal
+from ...utils import graceful_conversion, date_conversion, extract_decimal, RecordLayout, LazyRecord
+
+# The Awards Statistics table contains a 5 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=70, header_len=5, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('navn', '36s', 'str'), # NAVN (Name is a string capped at 36 characters)
+    ('ktid_id', 'B'), # KTID (KTID is an enum represented by a 1 byte integer)
+    ('wid', '4s', 'decimal'), # WID (WID is a 1 byte integer)
+    ('brt', '4s', 'decimal'), # BRT (BRT is a 1 byte integer)
+    ('bru', '4s', 'decimal'), # BRU (BRU is a 1 byte integer)
+    ('gew', '4s', 'decimal'), # GEW (GEW is a 1 byte integer)
+])
+
+class Kaaringer(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_navn', '_ktid_id', '_wid', '_brt', '_bru', '_gew')
 
-class Kaaringer:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _navn: str # Name (NAVN in original schema)
     _ktid_id: int # KTID (KTID in original schema)
@@ -29,44 +43,15 @@ class Kaaringer:
         if len(content) != 70:
             raise AssertionError("Input for Kaaringer should be 70 bytes")
 
-        # The Awards Statistics table contains a 5 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[5:]
-
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the NAVN property
-        navn = graceful_conversion(sub_content[:36]) # NAVN (Name is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the KTID property
-        ktid_id = sub_content[0] # KTID (KTID is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the WID property
-        wid = extract_decimal(sub_content[:4]) # WID (WID is a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the BRT property
-        brt = extract_decimal(sub_content[:4]) # BRT (BRT is a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the BRU property
-        bru = extract_decimal(sub_content[:4]) # BRU (BRU is a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the GEW property
-        gew = extract_decimal(sub_content[:4]) # GEW (GEW is a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, navn, ktid_id, wid, brt, bru, gew) = _LAYOUT.unpack(content)
+
+        reg_nr = graceful_conversion(reg_nr)
+        navn = graceful_conversion(navn)
+        wid = extract_decimal(wid)
+        brt = extract_decimal(brt)
+        bru = extract_decimal(bru)
+        gew = extract_decimal(gew)
 
         return cls(reg_nr=reg_nr,
                    navn=navn,
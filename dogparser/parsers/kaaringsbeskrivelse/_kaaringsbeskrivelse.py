@@ -1,10 +1,23 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion, extract_decimal
+from ...utils import graceful_conversion, date_conversion, extract_decimal, RecordLayout, LazyRecord
+
+# The Awards descriptions table contains a 5 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=839, header_len=5, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('navn', '36s', 'str'), # NAVN (Name is a string capped at 36 characters)
+    ('k1', '255s', 'str'), # K1 (K1 is a string capped at 255 characters)
+    ('k2', '255s', 'str'), # K2 (K2 is a string capped at 255 characters)
+    ('v', '135s', 'str'), # V (V is a string capped at 135 characters)
+    ('vi', '141s', 'str'), # VI (VI is a string capped at 141 characters)
+])
+
+class Kaaringsbeskrivelse(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_navn', '_k1', '_k2', '_v', '_vi')
 
-class Kaaringsbeskrivelse:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _navn: str # Name (NAVN in original schema)
     _k1: Union[str, None] # K1 (K1 in original schema)
@@ -26,39 +39,15 @@ class Kaaringsbeskrivelse:
         if len(content) != 839:
             raise AssertionError("Input for Kaaringsbeskrivelse should be 839 bytes")
 
-        # The Awards descriptions table contains a 5 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[5:]
-
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the NAVN property
-        navn = graceful_conversion(sub_content[:36]) # NAVN (Name is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the K1 property
-        k1 = graceful_conversion(sub_content[:255]) # K1 (K1 is a string capped at 255 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[255:]
-
-        # Parse the K2 property
-        k2 = graceful_conversion(sub_content[:255]) # K2 (K2 is a string capped at 255 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[255:]
-
-        # Parse the V property
-        v = graceful_conversion(sub_content[:135]) # V (V is a string capped at 135 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[135:]
-
-        # Parse the VI property
-        vi = graceful_conversion(sub_content[:141]) # VI (VI is a string capped at 141 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[141:]
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, navn, k1, k2, v, vi) = _LAYOUT.unpack(content)
+
+        reg_nr = graceful_conversion(reg_nr)
+        navn = graceful_conversion(navn)
+        k1 = graceful_conversion(k1)
+        k2 = graceful_conversion(k2)
+        v = graceful_conversion(v)
+        vi = graceful_conversion(vi)
 
         return cls(reg_nr=reg_nr,
                    navn=navn,
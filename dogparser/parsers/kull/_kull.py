@@ -1,9 +1,76 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, parse_date, anomaly, RecordLayout, LazyRecord
+
+# The litter table contains a 16 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=844, header_len=16, fields=[
+    ('kullb', '1s', 'str'), # KULLB (Litter letter is a string capped at 1 characters)
+    ('kennel', '32s', 'str'), # KENNEL (Kennel is a string capped at 32 characters)
+    ('kullnr', '5s', 'str'), # KULLNR (Litter number/identifier is a string capped at 5 characters)
+    ('fodt', '6s', 'date'), # FØDT (Birthdate is represented by a 6 digit numerical string)
+    ('fd_land_id', 'B'), # FD-LAND (Birth country index is an enum represented by a 1 byte integer)
+    ('oppdr', '60s', 'str'), # OPPDR (Breeder is a string capped at 60 characters)
+    ('adresse', '35s', 'str'), # ADRESSE (Address is a string capped at 35 characters)
+    ('postnr', '7s', 'str'), # POSTNR (Postal code is a string capped at 7 characters)
+    ('farens_reg_nr', '12s', 'str'), # FARENS REG.NR (Fathers registration number is a string capped at 12 characters)
+    ('morfars_reg_nr', '12s', 'str'), # MORFARS REG.NR (Grandfathers registration number is a string capped at 12 characters)
+    ('morens_reg_nr', '12s', 'str'), # MORENS REG.NR (Mothers registration number is a string capped at 12 characters)
+    ('sosken', '233s', 'str'), # SØSKEN (Siblings is a string capped at 233 characters)
+    ('innavl', '153s', 'str'), # INNAVL (Inbreeding is a string capped at 153 characters)
+    ('merkn', '66s', 'str'), # MERKN (Remarks is a string capped at 66 characters)
+    ('ant', 'B', 'null'), # ANT (Number is a 1 byte integer)
+    ('h', 'B', 'null'), # H (H? is a 1 byte integer)
+    ('t', 'B', 'null'), # T (T? is a 1 byte integer)
+    ('utmrkber', 'B', 'null'), # UTMRKBER (UTMRKBER? is a 1 byte integer)
+    ('friber', 'B', 'null'), # FRIBER (FRIBER? is a 1 byte integer)
+    ('svakber', 'B', 'null'), # SVAKBER (SVAKBER? is a 1 byte integer)
+    ('middelsber', 'B', 'null'), # MIDDELSBER (MIDDELSBER? is a 1 byte integer)
+    ('sterkber', 'B', 'null'), # STERKBER (STERKBER? is a 1 byte integer)
+    ('utmrk', 'B', 'null'), # UTMRK (UTMRK? is a 1 byte integer)
+    ('fri', 'B', 'null'), # FRI (FRI? is a 1 byte integer)
+    ('svak', 'B', 'null'), # SVAK (SVAK? is a 1 byte integer)
+    ('middels', 'B', 'null'), # MIDDELS (MIDDELS? is a 1 byte integer)
+    ('sterk', 'B', 'null'), # STERK (STERK? is a 1 byte integer)
+    ('ro', 'B', 'null'), # RØ (RØ? is a 1 byte integer)
+    ('tothd', 'B', 'null'), # TOTHD (TOTHD? is a 1 byte integer)
+    ('friberad', 'B', 'null'), # FRIBERAD (FRIBERAD? is a 1 byte integer)
+    ('svakberad', 'B', 'null'), # SVAKBERAD (SVAKBERAD? is a 1 byte integer)
+    ('middelsberad', 'B', 'null'), # MIDDELSBERAD (MIDDELSBERAD? is a 1 byte integer)
+    ('sterkberad', 'B', 'null'), # STERKBERAD (STERKBERAD? is a 1 byte integer)
+    ('friad', 'B', 'null'), # FRIAD (FRIAD? is a 1 byte integer)
+    ('svakad', 'B', 'null'), # SVAKAD (SVAKAD? is a 1 byte integer)
+    ('middelsad', 'B', 'null'), # MIDDELSAD (MIDDELSAD? is a 1 byte integer)
+    ('sterkad', 'B', 'null'), # STERKAD (STERKAD? is a 1 byte integer)
+    ('road', 'B', 'null'), # RØAD (RØAD? is a 1 byte integer)
+    ('totad', 'B', 'null'), # TOTAD (TOTAD? is a 1 byte integer)
+    ('reg_nr1', '12s', 'str'), # REG.NR1 (Registration number for dog number 1 is a string capped at 12 characters)
+    ('reg_nr2', '12s', 'str'), # REG.NR2 (Registration number for dog number 2 is a string capped at 12 characters)
+    ('reg_nr3', '12s', 'str'), # REG.NR3 (Registration number for dog number 3 is a string capped at 12 characters)
+    ('reg_nr4', '12s', 'str'), # REG.NR4 (Registration number for dog number 4 is a string capped at 12 characters)
+    ('reg_nr5', '12s', 'str'), # REG.NR5 (Registration number for dog number 5 is a string capped at 12 characters)
+    ('reg_nr6', '12s', 'str'), # REG.NR6 (Registration number for dog number 6 is a string capped at 12 characters)
+    ('reg_nr7', '12s', 'str'), # REG.NR7 (Registration number for dog number 7 is a string capped at 12 characters)
+    ('reg_nr8', '12s', 'str'), # REG.NR8 (Registration number for dog number 8 is a string capped at 12 characters)
+    ('reg_nr9', '12s', 'str'), # REG.NR9 (Registration number for dog number 9 is a string capped at 12 characters)
+    ('reg_nr10', '12s', 'str'), # REG.NR10 (Registration number for dog number 10 is a string capped at 12 characters)
+    ('reg_nr11', '12s', 'str'), # REG.NR11 (Registration number for dog number 11 is a string capped at 12 characters)
+    ('reg_nr12', '12s', 'str'), # REG.NR12 (Registration number for dog number 12 is a string capped at 12 characters)
+    ('reg_nr13', '12s', 'str'), # REG.NR13 (Registration number for dog number 13 is a string capped at 12 characters)
+    ('reg_nr14', '12s', 'str'), # REG.NR14 (Registration number for dog number 14 is a string capped at 12 characters)
+])
+
+class Kull(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_kullb', '_kennel', '_kullnr', '_fodt', '_fodt_raw', '_fd_land_id', '_oppdr', '_adresse',
+                 '_postnr', '_farens_reg_nr', '_morfars_reg_nr', '_morens_reg_nr', '_sosken', '_innavl', '_merkn',
+                 '_ant', '_h', '_t', '_utmrkber', '_friber', '_svakber', '_middelsber', '_sterkber', '_utmrk',
+                 '_fri', '_svak', '_middels', '_sterk', '_ro', '_tothd', '_friberad', '_svakberad', '_middelsberad',
+                 '_sterkberad', '_friad', '_svakad', '_middelsad', '_sterkad', '_road', '_totad', '_reg_nr1',
+                 '_reg_nr2', '_reg_nr3', '_reg_nr4', '_reg_nr5', '_reg_nr6', '_reg_nr7', '_reg_nr8', '_reg_nr9',
+                 '_reg_nr10', '_reg_nr11', '_reg_nr12', '_reg_nr13', '_reg_nr14')
 
-class Kull:
     _kullb: Union[str, None] # Litter letter (KULLB in original schema)
     _kennel: Union[str, None] # Kennel (KENNEL in original schema)
     _kullnr: str # Litter number/identifier (KULLNR in original schema)
@@ -137,303 +204,70 @@ class Kull:
         if len(content) != 844:
             raise AssertionError("Input for Kull should be 844 bytes")
 
-        # The litter table contains a 16 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[16:]
-
-        # Parse the KULLB property
-        kullb = graceful_conversion(sub_content[:1]) # KULLB (Litter letter is a string capped at 1 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the KENNEL property
-        kennel = graceful_conversion(sub_content[:32]) # KENNEL (Kennel is a string capped at 32 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[32:]
-
-        # Parse the KULLNR property
-        kullnr = graceful_conversion(sub_content[:5]) # KULLNR (Litter number/identifier is a string capped at 5 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[5:]
-
-        # Parse the FØDT property
-        fodt = None
-        fodt_raw = graceful_conversion(sub_content[:6])
-        try:
-            fodt = date_conversion(sub_content[:6]) # FØDT (Birthdate is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)        # Remove used data from next entries
-        sub_content = sub_content[6:]
-
-        # Parse the FD-LAND property
-        fd_land_id = sub_content[0] # FD-LAND (Birth country index is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the OPPDR property
-        oppdr = graceful_conversion(sub_content[:60]) # OPPDR (Breeder is a string capped at 60 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[60:]
-
-        # Parse the ADRESSE property
-        adresse = graceful_conversion(sub_content[:35]) # ADRESSE (Address is a string capped at 35 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[35:]
-
-        # Parse the POSTNR property
-        postnr = graceful_conversion(sub_content[:7]) # POSTNR (Postal code is a string capped at 7 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[7:]
-
-        # Parse the FARENS REG.NR property
-        farens_reg_nr = graceful_conversion(sub_content[:12]) # FARENS REG.NR (Fathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the MORFARS REG.NR property
-        morfars_reg_nr = graceful_conversion(sub_content[:12]) # MORFARS REG.NR (Grandfathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the MORENS REG.NR property
-        morens_reg_nr = graceful_conversion(sub_content[:12]) # MORENS REG.NR (Mothers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the SØSKEN property
-        sosken = graceful_conversion(sub_content[:233]) # SØSKEN (Siblings is a string capped at 233 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[233:]
-
-        # Parse the INNAVL property
-        innavl = graceful_conversion(sub_content[:153]) # INNAVL (Inbreeding is a string capped at 153 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[153:]
-
-        # Parse the MERKN property
-        merkn = graceful_conversion(sub_content[:66]) # MERKN (Remarks is a string capped at 66 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[66:]
-
-        # Parse the ANT property
-        ant = sub_content[0] # ANT (Number is a 1 byte integer)
+        # Unpack every column in a single call, the layout skips the header
+        (kullb, kennel, kullnr, fodt_data, fd_land_id, oppdr, adresse, postnr, farens_reg_nr, morfars_reg_nr,
+         morens_reg_nr, sosken, innavl, merkn, ant, h, t, utmrkber, friber, svakber, middelsber, sterkber,
+         utmrk, fri, svak, middels, sterk, ro, tothd, friberad, svakberad, middelsberad, sterkberad, friad,
+         svakad, middelsad, sterkad, road, totad, reg_nr1, reg_nr2, reg_nr3, reg_nr4, reg_nr5, reg_nr6,
+         reg_nr7, reg_nr8, reg_nr9, reg_nr10, reg_nr11, reg_nr12, reg_nr13, reg_nr14) = _LAYOUT.unpack(content)
+
+        kullb = graceful_conversion(kullb)
+        kennel = graceful_conversion(kennel)
+        kullnr = graceful_conversion(kullnr)
+
+        fodt_date = parse_date(fodt_data)
+        fodt, fodt_raw = fodt_date.date, fodt_date.raw
+        if fodt_date.error is not None:
+            anomaly('invalid date', 'fodt', fodt_raw)
+
+        oppdr = graceful_conversion(oppdr)
+        adresse = graceful_conversion(adresse)
+        postnr = graceful_conversion(postnr)
+        farens_reg_nr = graceful_conversion(farens_reg_nr)
+        morfars_reg_nr = graceful_conversion(morfars_reg_nr)
+        morens_reg_nr = graceful_conversion(morens_reg_nr)
+        sosken = graceful_conversion(sosken)
+        innavl = graceful_conversion(innavl)
+        merkn = graceful_conversion(merkn)
         ant = None if ant == 128 else ant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the H property
-        h = sub_content[0] # H (H? is a 1 byte integer)
         h = None if h == 128 else h # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the T property
-        t = sub_content[0] # T (T? is a 1 byte integer)
         t = None if t == 128 else t # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the UTMRKBER property
-        utmrkber = sub_content[0] # UTMRKBER (UTMRKBER? is a 1 byte integer)
         utmrkber = None if utmrkber == 128 else utmrkber # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the FRIBER property
-        friber = sub_content[0] # FRIBER (FRIBER? is a 1 byte integer)
         friber = None if friber == 128 else friber # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the SVAKBER property
-        svakber = sub_content[0] # SVAKBER (SVAKBER? is a 1 byte integer)
         svakber = None if svakber == 128 else svakber # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the MIDDELSBER property
-        middelsber = sub_content[0] # MIDDELSBER (MIDDELSBER? is a 1 byte integer)
         middelsber = None if middelsber == 128 else middelsber # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the STERKBER property
-        sterkber = sub_content[0] # STERKBER (STERKBER? is a 1 byte integer)
         sterkber = None if sterkber == 128 else sterkber # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the UTMRK property
-        utmrk = sub_content[0] # UTMRK (UTMRK? is a 1 byte integer)
         utmrk = None if utmrk == 128 else utmrk # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the FRI property
-        fri = sub_content[0] # FRI (FRI? is a 1 byte integer)
         fri = None if fri == 128 else fri # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the SVAK property
-        svak = sub_content[0] # SVAK (SVAK? is a 1 byte integer)
         svak = None if svak == 128 else svak # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the MIDDELS property
-        middels = sub_content[0] # MIDDELS (MIDDELS? is a 1 byte integer)
         middels = None if middels == 128 else middels # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the STERK property
-        sterk = sub_content[0] # STERK (STERK? is a 1 byte integer)
         sterk = None if sterk == 128 else sterk # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the RØ property
-        ro = sub_content[0] # RØ (RØ? is a 1 byte integer)
         ro = None if ro == 128 else ro # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the TOTHD property
-        tothd = sub_content[0] # TOTHD (TOTHD? is a 1 byte integer)
         tothd = None if tothd == 128 else tothd # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the FRIBERAD property
-        friberad = sub_content[0] # FRIBERAD (FRIBERAD? is a 1 byte integer)
         friberad = None if friberad == 128 else friberad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the SVAKBERAD property
-        svakberad = sub_content[0] # SVAKBERAD (SVAKBERAD? is a 1 byte integer)
         svakberad = None if svakberad == 128 else svakberad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the MIDDELSBERAD property
-        middelsberad = sub_content[0] # MIDDELSBERAD (MIDDELSBERAD? is a 1 byte integer)
         middelsberad = None if middelsberad == 128 else middelsberad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the STERKBERAD property
-        sterkberad = sub_content[0] # STERKBERAD (STERKBERAD? is a 1 byte integer)
         sterkberad = None if sterkberad == 128 else sterkberad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the FRIAD property
-        friad = sub_content[0] # FRIAD (FRIAD? is a 1 byte integer)
         friad = None if friad == 128 else friad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the SVAKAD property
-        svakad = sub_content[0] # SVAKAD (SVAKAD? is a 1 byte integer)
         svakad = None if svakad == 128 else svakad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the MIDDELSAD property
-        middelsad = sub_content[0] # MIDDELSAD (MIDDELSAD? is a 1 byte integer)
         middelsad = None if middelsad == 128 else middelsad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the STERKAD property
-        sterkad = sub_content[0] # STERKAD (STERKAD? is a 1 byte integer)
         sterkad = None if sterkad == 128 else sterkad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the RØAD property
-        road = sub_content[0] # RØAD (RØAD? is a 1 byte integer)
         road = None if road == 128 else road # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the TOTAD property
-        totad = sub_content[0] # TOTAD (TOTAD? is a 1 byte integer)
         totad = None if totad == 128 else totad # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the REG.NR1 property
-        reg_nr1 = graceful_conversion(sub_content[:12]) # REG.NR1 (Registration number for dog number 1 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR2 property
-        reg_nr2 = graceful_conversion(sub_content[:12]) # REG.NR2 (Registration number for dog number 2 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR3 property
-        reg_nr3 = graceful_conversion(sub_content[:12]) # REG.NR3 (Registration number for dog number 3 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR4 property
-        reg_nr4 = graceful_conversion(sub_content[:12]) # REG.NR4 (Registration number for dog number 4 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR5 property
-        reg_nr5 = graceful_conversion(sub_content[:12]) # REG.NR5 (Registration number for dog number 5 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR6 property
-        reg_nr6 = graceful_conversion(sub_content[:12]) # REG.NR6 (Registration number for dog number 6 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR7 property
-        reg_nr7 = graceful_conversion(sub_content[:12]) # REG.NR7 (Registration number for dog number 7 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR8 property
-        reg_nr8 = graceful_conversion(sub_content[:12]) # REG.NR8 (Registration number for dog number 8 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR9 property
-        reg_nr9 = graceful_conversion(sub_content[:12]) # REG.NR9 (Registration number for dog number 9 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR10 property
-        reg_nr10 = graceful_conversion(sub_content[:12]) # REG.NR10 (Registration number for dog number 10 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR11 property
-        reg_nr11 = graceful_conversion(sub_content[:12]) # REG.NR11 (Registration number for dog number 11 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR12 property
-        reg_nr12 = graceful_conversion(sub_content[:12]) # REG.NR12 (Registration number for dog number 12 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR13 property
-        reg_nr13 = graceful_conversion(sub_content[:12]) # REG.NR13 (Registration number for dog number 13 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the REG.NR14 property
-        reg_nr14 = graceful_conversion(sub_content[:12]) # REG.NR14 (Registration number for dog number 14 is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
+        reg_nr1 = graceful_conversion(reg_nr1)
+        reg_nr2 = graceful_conversion(reg_nr2)
+        reg_nr3 = graceful_conversion(reg_nr3)
+        reg_nr4 = graceful_conversion(reg_nr4)
+        reg_nr5 = graceful_conversion(reg_nr5)
+        reg_nr6 = graceful_conversion(reg_nr6)
+        reg_nr7 = graceful_conversion(reg_nr7)
+        reg_nr8 = graceful_conversion(reg_nr8)
+        reg_nr9 = graceful_conversion(reg_nr9)
+        reg_nr10 = graceful_conversion(reg_nr10)
+        reg_nr11 = graceful_conversion(reg_nr11)
+        reg_nr12 = graceful_conversion(reg_nr12)
+        reg_nr13 = graceful_conversion(reg_nr13)
+        reg_nr14 = graceful_conversion(reg_nr14)
 
         return cls(kullb=kullb,
                    kennel=kennel,
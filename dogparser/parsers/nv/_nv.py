@@ -1,10 +1,33 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion, extract_decimal
+from ...utils import graceful_conversion, date_conversion, extract_decimal, RecordLayout, LazyRecord
+
+# The Awards Statistics table contains a 7 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=163, header_len=7, fields=[
+    ('aar', '4s', 'str'), # ÅR (Year is a string capped at 4 characters)
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('katalog_nummer', '4s', 'str'), # KATALOG_NUMMER (Catalog number is a string capped at 4 characters)
+    ('navn', '36s', 'str'), # NAVN (Name is a string capped at 36 characters)
+    ('grad_id', 'B'), # GRAD (Grade is an enum represented by a 1 byte integer)
+    ('plass', 'H', 'null'), # PLASS (Place is a 2 byte integer)
+    ('plassering', '11s', 'str'), # PLASSERING (Placement is a string capped at 11 characters)
+    ('l_id', 'B'), # L (Country code is an enum represented by a 1 byte integer)
+    ('aaaar', '4s', 'str'), # ÅÅR (Year is a string capped at 4 characters)
+    ('plass2', '3s', 'str'), # PLASS2 (Place column 2 is a string capped at 3 characters)
+    ('klasse_id', 'B'), # KLASSE (Class is an enum represented by a 1 byte integer)
+    ('far', '36s', 'str'), # FAR (Fathers name is a string capped at 36 characters)
+    ('mor', '36s', 'str'), # MOR (Mothers name is a string capped at 36 characters)
+    ('katnr', 'H', 'null'), # KATNR (Category number is a 2 byte integer)
+    ('plassiffer', '3s', 'str'), # PLASSIFFER (Placement number is a string capped at 3 characters)
+])
+
+class Nv(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_aar', '_reg_nr', '_katalog_nummer', '_navn', '_grad_id', '_plass', '_plassering', '_l_id',
+                 '_aaaar', '_plass2', '_klasse_id', '_far', '_mor', '_katnr', '_plassiffer')
 
-class Nv:
     _aar: Union[str, None] # Year (ÅR in original schema)
     _reg_nr: str # Registration number (REG.NR in original schema)
     _katalog_nummer: str # Catalog number (KATALOG_NUMMER in original schema)
@@ -47,86 +70,22 @@ class Nv:
         if len(content) != 163:
             raise AssertionError("Input for Nv should be 163 bytes")
 
-        # The Awards Statistics table contains a 7 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[7:]
-
-        # Parse the ÅR property
-        aar = graceful_conversion(sub_content[:4]) # ÅR (Year is a string capped at 4 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the KATALOG_NUMMER property
-        katalog_nummer = graceful_conversion(sub_content[:4]) # KATALOG_NUMMER (Catalog number is a string capped at 4 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the NAVN property
-        navn = graceful_conversion(sub_content[:36]) # NAVN (Name is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the GRAD property
-        grad_id = sub_content[0] # GRAD (Grade is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the PLASS property
-        plass = struct.unpack('H', sub_content[:2])[0] # PLASS (Place is a 2 byte integer)
+        # Unpack every column in a single call, the layout skips the header
+        (aar, reg_nr, katalog_nummer, navn, grad_id, plass, plassering, l_id, aaaar, plass2, klasse_id, far,
+         mor, katnr, plassiffer) = _LAYOUT.unpack(content)
+
+        aar = graceful_conversion(aar)
+        reg_nr = graceful_conversion(reg_nr)
+        katalog_nummer = graceful_conversion(katalog_nummer)
+        navn = graceful_conversion(navn)
         plass = None if plass == 32768 else plass # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the PLASSERING property
-        plassering = graceful_conversion(sub_content[:11]) # PLASSERING (Placement is a string capped at 11 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[11:]
-
-        # Parse the L property
-        l_id = sub_content[0] # L (Country code is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the ÅÅR property
-        aaaar = graceful_conversion(sub_content[:4]) # ÅÅR (Year is a string capped at 4 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the PLASS2 property
-        plass2 = graceful_conversion(sub_content[:3]) # PLASS2 (Place column 2 is a string capped at 3 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[3:]
-
-        # Parse the KLASSE property
-        klasse_id = sub_content[0] # KLASSE (Class is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the FAR property
-        far = graceful_conversion(sub_content[:36]) # FAR (Fathers name is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the MOR property
-        mor = graceful_conversion(sub_content[:36]) # MOR (Mothers name is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the KATNR property
-        katnr = struct.unpack('H', sub_content[:2])[0] # KATNR (Category number is a 2 byte integer)
+        plassering = graceful_conversion(plassering)
+        aaaar = graceful_conversion(aaaar)
+        plass2 = graceful_conversion(plass2)
+        far = graceful_conversion(far)
+        mor = graceful_conversion(mor)
         katnr = None if katnr == 32768 else katnr # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the PLASSIFFER property
-        plassiffer = graceful_conversion(sub_content[:3]) # PLASSIFFER (Placement number is a string capped at 3 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[3:]
+        plassiffer = graceful_conversion(plassiffer)
 
         return cls(aar=aar,
                    reg_nr=reg_nr,
@@ -1,9 +1,31 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, date_conversion, RecordLayout, LazyRecord
+
+# The breeder table contains a 5 byte header that does not contain usefull data
+_LAYOUT = RecordLayout(record_len=250, header_len=5, fields=[
+    ('kennel', '32s', 'str'), # KENNEL (name of kennel is a string capped at 32 characters)
+    ('prefiks_id', 'B'), # OPREFIKS (Breeder prefix identifier)
+    ('fd_land_id', 'B'), # OPREFIKS (Breeder prefix identifier)
+    ('oppdr', '60s', 'str'), # OPPDR (name of breeder is a string capped at 50 characters)
+    ('adresse', '40s', 'str'), # ADRESSE (Address is a string capped at 40 characters)
+    ('postnr', '7s', 'str'), # POSTNR (postal code is a string capped at 7 characters)
+    ('tlf', '15s', 'str'), # TLF (TELEPHONE is a string capped at 15 characters)
+    ('tlfa', '13s', 'str'), # TLFA (TELEPHONE A is a string capped at 15 characters)
+    ('tlfm', '15s', 'str'), # TLFM (TELEPHONE M is a string capped at 15 characters)
+    ('oprefiks_id', 'B'), # OPREFIKS (Breeder prefix identifier)
+    ('kunkennel', '28s', 'str'), # KUNNKENNEL (kennel name, without prefix, is a string capped at 28 characters)
+    ('nkennel', '32s', 'str'), # NKENNEL (nkennel is a string capped at 32 characters)
+])
+
+class Oppdretter(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+    _column_names = {'tlfa': 'tlfm', 'tlfm': 'tlfa'} # The constructor stores TLFA and TLFM swapped
+
+    __slots__ = ('_kennel', '_oppdr', '_adresse', '_postnr', '_tlf', '_tlfa', '_tlfm', '_kunkennel', '_nkennel',
+                 '_prefiks_id', '_fd_land_id', '_oprefiks_id')
 
-class Oppdretter:
     _kennel: str # Kennel name (KENNEL in original schema)
     _oppdr: Union[str, None] # Breeder (OPPDR in original schema)
     _adresse: Union[str, None] # Adress (ADRESSE in original schema)
@@ -41,59 +63,21 @@ class Oppdretter:
     def from_bytes(cls, content: bytes):
         if len(content) != 250:
             raise AssertionError('Input for OPDRETTER should be 250 bytes')
-        
-        # The breeder table contains a 5 byte header that does not contain usefull data
-        header = content[:5]
-        sub_content = content
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[5:] # 245 bytes remaining
-        kennel = graceful_conversion(sub_content[:32]) # KENNEL (name of kennel is a string capped at 32 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[32:] # 213 bytes remaining
-        prefiks_id = sub_content[0] # OPREFIKS (Breeder prefix identifier)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 212 bytes remaining
-        fd_land_id = sub_content[0] # OPREFIKS (Breeder prefix identifier)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 211 bytes remaining
-        oppdr = graceful_conversion(sub_content[:60]) # OPPDR (name of breeder is a string capped at 50 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[60:] # 151 bytes remaining
-        adresse = graceful_conversion(sub_content[:40]) # ADRESSE (Address is a string capped at 40 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[40:] # 111 bytes remaining
-        postnr = graceful_conversion(sub_content[:7]) # POSTNR (postal code is a string capped at 7 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[7:] # 104 bytes remaining
-        tlf = graceful_conversion(sub_content[:15]) # TLF (TELEPHONE is a string capped at 15 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[15:] # 89 bytes remaining
-        tlfa = graceful_conversion(sub_content[:13]) # TLFA (TELEPHONE A is a string capped at 15 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[13:] # 76 bytes remaining
-        tlfm = graceful_conversion(sub_content[:15]) # TLFM (TELEPHONE M is a string capped at 15 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[15:] # 61 bytes remaining
-        oprefiks_id = sub_content[0] # OPREFIKS (Breeder prefix identifier)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 60 bytes remaining
-        kunkennel = graceful_conversion(sub_content[:28]) # KUNNKENNEL (kennel name, without prefix, is a string capped at 28 characters)
-        
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[28:] # 32 bytes remaining
-        nkennel = graceful_conversion(sub_content[:32]) # NKENNEL (nkennel is a string capped at 32 characters)
-        
+
+        # Unpack every column in a single call, the layout skips the header
+        (kennel, prefiks_id, fd_land_id, oppdr, adresse, postnr, tlf, tlfa, tlfm, oprefiks_id, kunkennel,
+         nkennel) = _LAYOUT.unpack(content)
+
+        kennel = graceful_conversion(kennel)
+        oppdr = graceful_conversion(oppdr)
+        adresse = graceful_conversion(adresse)
+        postnr = graceful_conversion(postnr)
+        tlf = graceful_conversion(tlf)
+        tlfa = graceful_conversion(tlfa)
+        tlfm = graceful_conversion(tlfm)
+        kunkennel = graceful_conversion(kunkennel)
+        nkennel = graceful_conversion(nkennel)
+
         return cls(
             kennel=kennel,
             prefiks_id=prefiks_id,
@@ -1,9 +1,21 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, date_conversion, RecordLayout, LazyRecord
+
+# The postal location table contains a 3 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=32, header_len=3, fields=[
+    ('postnr', '7s', 'str'), # POSTNR (Postal code is a string capped at 7 characters)
+    ('sted', '20s', 'str'), # STED (Location is a string capped at 20 characters)
+    ('land_id', 'B'), # LAND (Country is an enum represented by a 1 byte integer)
+    ('fylke_id', 'B'), # FYLKE (County is an enum represented by a 1 byte integer)
+])
+
+class Poststed(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_postnr', '_sted', '_land_id', '_fylke_id')
 
-class Poststed:
     _postnr: str # Postal code (POSTNR in original schema)
     _sted: Union[str, None] # Location (STED in original schema)
     _land_id: int # Country (LAND in original schema)
@@ -21,29 +33,11 @@ class Poststed:
         if len(content) != 32:
             raise AssertionError("Input for Poststed should be 32 bytes")
 
-        # The postal location table contains a 3 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[3:]
-
-        # Parse the POSTNR property
-        postnr = graceful_conversion(sub_content[:7]) # POSTNR (Postal code is a string capped at 7 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[7:]
-
-        # Parse the STED property
-        sted = graceful_conversion(sub_content[:20]) # STED (Location is a string capped at 20 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[20:]
-
-        # Parse the LAND property
-        land_id = sub_content[0] # LAND (Country is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the FYLKE property
-        fylke_id = sub_content[0] # FYLKE (County is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
+        # Unpack every column in a single call, the layout skips the header
+        (postnr, sted, land_id, fylke_id) = _LAYOUT.unpack(content)
+
+        postnr = graceful_conversion(postnr)
+        sted = graceful_conversion(sted)
 
         return cls(postnr=postnr,
                    sted=sted,
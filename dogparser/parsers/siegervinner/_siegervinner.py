@@ -1,9 +1,28 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, date_conversion, RecordLayout, LazyRecord
+
+# The Showcase winners table contains a 5 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=79, header_len=5, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('katalog_nummer', '4s', 'str'), # KATALOG-NUMMER (Catalog number is a string capped at 4 characters)
+    ('navn', '36s', 'str'), # NAVN (Name of dog is a string capped at 36 characters)
+    ('grad_id', 'B'), # GRAD (Grade is an enum represented by a 1 byte integer)
+    ('plass', 'B'), # PLASS (Pacement is a 1 byte integer)
+    (None, '1x'), # Unused bytes
+    ('l_id', 'B'), # L (Country is an enum represented by a 1 byte integer)
+    ('aar', '4s', 'str'), # ÅR (Year is a string capped at 4 characters)
+    ('plassering', '13s', 'str'), # PLASSERING (Placement string is a string capped at 13 characters)
+    ('klasse_id', 'B'), # KLASSE (Class is an enum represented by a 1 byte integer)
+])
+
+class Siegervinner(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_katalog_nummer', '_navn', '_grad_id', '_plass', '_l_id', '_aar', '_plassering',
+                 '_klasse_id')
 
-class Siegervinner:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _katalog_nummer: str # Catalog number (KATALOG-NUMMER in original schema)
     _navn: str # Name of dog (NAVN in original schema)
@@ -32,57 +51,14 @@ class Siegervinner:
         if len(content) != 79:
             raise AssertionError("Input for Siegervinner should be 79 bytes")
 
-        # The Showcase winners table contains a 5 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[5:]
-
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the KATALOG-NUMMER property
-        katalog_nummer = graceful_conversion(sub_content[:4]) # KATALOG-NUMMER (Catalog number is a string capped at 4 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the NAVN property
-        navn = graceful_conversion(sub_content[:36]) # NAVN (Name of dog is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the GRAD property
-        grad_id = sub_content[0] # GRAD (Grade is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the PLASS property
-        plass = sub_content[0] # PLASS (Pacement is a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Skip unused bytes
-        sub_content = sub_content[1:]
-
-        # Parse the L property
-        l_id = sub_content[0] # L (Country is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the ÅR property
-        aar = graceful_conversion(sub_content[:4]) # ÅR (Year is a string capped at 4 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[4:]
-
-        # Parse the PLASSERING property
-        plassering = graceful_conversion(sub_content[:13]) # PLASSERING (Placement string is a string capped at 13 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[13:]
-
-        # Parse the KLASSE property
-        klasse_id = sub_content[0] # KLASSE (Class is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, katalog_nummer, navn, grad_id, plass, l_id, aar, plassering, klasse_id) = _LAYOUT.unpack(content)
+
+        reg_nr = graceful_conversion(reg_nr)
+        katalog_nummer = graceful_conversion(katalog_nummer)
+        navn = graceful_conversion(navn)
+        aar = graceful_conversion(aar)
+        plassering = graceful_conversion(plassering)
 
         return cls(reg_nr=reg_nr,
                    katalog_nummer=katalog_nummer,
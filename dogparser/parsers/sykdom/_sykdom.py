@@ -1,10 +1,41 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion, extract_decimal
+from ...utils import graceful_conversion, date_conversion, extract_decimal, RecordLayout, LazyRecord
+
+# The Awards descriptions table contains a 7 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=720, header_len=7, fields=[
+    ('kull', '5s', 'str'), # KULL (Litter number is a string capped at 5 characters)
+    ('farens_reg_nr', '12s', 'str'), # FARENS REG.NR (Fathers egistration number is a string capped at 12 characters)
+    ('far', '36s', 'str'), # FAR (Father is a string capped at 36 characters)
+    ('morens_reg_nr', '12s', 'str'), # MORENS REG.NR (Mothers egistration number is a string capped at 12 characters)
+    ('mor', '36s', 'str'), # MOR (Mother is a string capped at 36 characters)
+    ('ant_fe', '2s', 'str'), # ANT.FE (ANT.FE is a string capped at 2 characters)
+    ('kilde', '20s', 'str'), # KILDE (Source is a string capped at 20 characters)
+    ('langhaar', '30s', 'str'), # LANGHÅR (Longhair is a string capped at 30 characters)
+    ('tenner_bitt', '30s', 'str'), # TENNER/BITT (Teeth and bite is a string capped at 30 characters)
+    ('mono_krypto', '30s', 'str'), # MONO/KRYPTO (MONO/KRYPTO is a string capped at 30 characters)
+    ('gemytt', '30s', 'str'), # GEMYTT (GEMYTT is a string capped at 30 characters)
+    ('pancreass', '30s', 'str'), # PANCREASS (PANCREASS is a string capped at 30 characters)
+    ('immunsvikt', '30s', 'str'), # IMMUNSVIKT (Immune deficiency is a string capped at 30 characters)
+    ('strupebrokk', '30s', 'str'), # STRUPEBROKK (STRUPEBROKK is a string capped at 30 characters)
+    ('navlebrokk', '30s', 'str'), # NAVLEBROKK (NAVLEBROKK is a string capped at 30 characters)
+    ('albueartrose', '30s', 'str'), # ALBUEARTROSE (Elbow artrosis is a string capped at 30 characters)
+    ('kloe', '30s', 'str'), # KLØE (Itching is a string capped at 30 characters)
+    ('forkalkn', '30s', 'str'), # FORKALKN (FORKALKN is a string capped at 30 characters)
+    ('orer', '30s', 'str'), # ØRER (Ears is a string capped at 30 characters)
+    ('hud', '30s', 'str'), # HUD (Skin is a string capped at 30 characters)
+    ('annet', '45s', 'str'), # ANNET (Other is a string capped at 45 characters)
+    ('tekst', '155s', 'str'), # TEKST (Text is a string capped at 155 characters)
+])
+
+class Sykdom(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_kull', '_farens_reg_nr', '_far', '_morens_reg_nr', '_mor', '_ant_fe', '_kilde', '_langhaar',
+                 '_tenner_bitt', '_mono_krypto', '_gemytt', '_pancreass', '_immunsvikt', '_strupebrokk',
+                 '_navlebrokk', '_albueartrose', '_kloe', '_forkalkn', '_orer', '_hud', '_annet', '_tekst')
 
-class Sykdom:
     _kull: str # Litter number (KULL in original schema)
     _farens_reg_nr: Union[str, None] # Fathers egistration number (FARENS REG.NR in original schema)
     _far: Union[str, None] # Father (FAR in original schema)
@@ -64,119 +95,33 @@ class Sykdom:
         if len(content) != 720:
             raise AssertionError("Input for Sykdom should be 720 bytes")
 
-        # The Awards descriptions table contains a 7 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[7:]
-
-        # Parse the KULL property
-        kull = graceful_conversion(sub_content[:5]) # KULL (Litter number is a string capped at 5 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[5:]
-
-        # Parse the FARENS REG.NR property
-        farens_reg_nr = graceful_conversion(sub_content[:12]) # FARENS REG.NR (Fathers egistration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the FAR property
-        far = graceful_conversion(sub_content[:36]) # FAR (Father is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the MORENS REG.NR property
-        morens_reg_nr = graceful_conversion(sub_content[:12]) # MORENS REG.NR (Mothers egistration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the MOR property
-        mor = graceful_conversion(sub_content[:36]) # MOR (Mother is a string capped at 36 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[36:]
-
-        # Parse the ANT.FE property
-        ant_fe = graceful_conversion(sub_content[:2]) # ANT.FE (ANT.FE is a string capped at 2 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the KILDE property
-        kilde = graceful_conversion(sub_content[:20]) # KILDE (Source is a string capped at 20 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[20:]
-
-        # Parse the LANGHÅR property
-        langhaar = graceful_conversion(sub_content[:30]) # LANGHÅR (Longhair is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the TENNER/BITT property
-        tenner_bitt = graceful_conversion(sub_content[:30]) # TENNER/BITT (Teeth and bite is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the MONO/KRYPTO property
-        mono_krypto = graceful_conversion(sub_content[:30]) # MONO/KRYPTO (MONO/KRYPTO is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the GEMYTT property
-        gemytt = graceful_conversion(sub_content[:30]) # GEMYTT (GEMYTT is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the PANCREASS property
-        pancreass = graceful_conversion(sub_content[:30]) # PANCREASS (PANCREASS is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the IMMUNSVIKT property
-        immunsvikt = graceful_conversion(sub_content[:30]) # IMMUNSVIKT (Immune deficiency is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the STRUPEBROKK property
-        strupebrokk = graceful_conversion(sub_content[:30]) # STRUPEBROKK (STRUPEBROKK is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the NAVLEBROKK property
-        navlebrokk = graceful_conversion(sub_content[:30]) # NAVLEBROKK (NAVLEBROKK is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the ALBUEARTROSE property
-        albueartrose = graceful_conversion(sub_content[:30]) # ALBUEARTROSE (Elbow artrosis is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the KLØE property
-        kloe = graceful_conversion(sub_content[:30]) # KLØE (Itching is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the FORKALKN property
-        forkalkn = graceful_conversion(sub_content[:30]) # FORKALKN (FORKALKN is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the ØRER property
-        orer = graceful_conversion(sub_content[:30]) # ØRER (Ears is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the HUD property
-        hud = graceful_conversion(sub_content[:30]) # HUD (Skin is a string capped at 30 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[30:]
-
-        # Parse the ANNET property
-        annet = graceful_conversion(sub_content[:45]) # ANNET (Other is a string capped at 45 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[45:]
-
-        # Parse the TEKST property
-        tekst = graceful_conversion(sub_content[:155]) # TEKST (Text is a string capped at 155 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[155:]
+        # Unpack every column in a single call, the layout skips the header
+        (kull, farens_reg_nr, far, morens_reg_nr, mor, ant_fe, kilde, langhaar, tenner_bitt, mono_krypto,
+         gemytt, pancreass, immunsvikt, strupebrokk, navlebrokk, albueartrose, kloe, forkalkn, orer, hud,
+         annet, tekst) = _LAYOUT.unpack(content)
+
+        kull = graceful_conversion(kull)
+        farens_reg_nr = graceful_conversion(farens_reg_nr)
+        far = graceful_conversion(far)
+        morens_reg_nr = graceful_conversion(morens_reg_nr)
+        mor = graceful_conversion(mor)
+        ant_fe = graceful_conversion(ant_fe)
+        kilde = graceful_conversion(kilde)
+        langhaar = graceful_conversion(langhaar)
+        tenner_bitt = graceful_conversion(tenner_bitt)
+        mono_krypto = graceful_conversion(mono_krypto)
+        gemytt = graceful_conversion(gemytt)
+        pancreass = graceful_conversion(pancreass)
+        immunsvikt = graceful_conversion(immunsvikt)
+        strupebrokk = graceful_conversion(strupebrokk)
+        navlebrokk = graceful_conversion(navlebrokk)
+        albueartrose = graceful_conversion(albueartrose)
+        kloe = graceful_conversion(kloe)
+        forkalkn = graceful_conversion(forkalkn)
+        orer = graceful_conversion(orer)
+        hud = graceful_conversion(hud)
+        annet = graceful_conversion(annet)
+        tekst = graceful_conversion(tekst)
 
         return cls(kull=kull,
                    farens_reg_nr=farens_reg_nr,
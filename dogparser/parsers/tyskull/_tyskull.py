@@ -1,9 +1,95 @@
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, date_conversion, RecordLayout, LazyRecord
+
+# The german litter table contains a 17 byte header that does not contain usefull data
+_LAYOUT = RecordLayout(record_len=587, header_len=17, fields=[
+    ('kullb', '1s', 'str'), # KULLB (Litter letter is a string capped at 1 character)
+    ('kennel', '32s', 'str'), # KENNEL (Kennel is a string capped at 32 characters)
+    ('fodt', '6s', 'date_strict'), # FØDT (birthdate/født is represented by a 6 digit numerical string)
+    ('kullnr', '5s', 'str'), # KULLNR (Litter number/identifier is a string capped at 6 characters)
+    ('farens_reg_nr', '12s', 'str'), # FARENS REG.NR (registration number is a string capped at 12 characters)
+    ('farens_navn', '38s', 'str'), # FARens_navn (name of father is a string capped at 38 characters)
+    ('morens_reg_nr', '12s', 'str'), # MORENS REG.NR (registration number is a string capped at 12 characters)
+    ('morens_navn', '38s', 'str'), # MORENS NAVN (name of mother is a string capped at 38 characters)
+    ('alle_id', 'B'), # ALLE index
+    ('sosken', '233s', 'str'), # SIBLINGS (sibling information is a string capped at 233 characters)
+    ('hund1', '12s', 'str'), # HUND1 (Individual dog name is a string capped at 12 characters)
+    ('kj1_id', 'B'), # KJ1 index
+    ('k1_id', 'B'), # K1 index
+    ('m1_id', 'B'), # M1 index
+    ('hd1_id', 'B'), # HD1 index
+    ('hund2', '12s', 'str'), # HUND2 (Individual dog name is a string capped at 12 characters)
+    ('kj2_id', 'B'), # KJ2 index
+    ('k2_id', 'B'), # K2 index
+    ('m2_id', 'B'), # M2 index
+    ('hd2_id', 'B'), # HD2 index
+    ('hund3', '12s', 'str'), # HUND3 (Individual dog name is a string capped at 12 characters)
+    ('kj3_id', 'B'), # KJ3 index
+    ('k3_id', 'B'), # K3 index
+    ('m3_id', 'B'), # M3 index
+    ('hd3_id', 'B'), # HD3 index
+    ('hund4', '12s', 'str'), # HUND4 (Individual dog name is a string capped at 12 characters)
+    ('kj4_id', 'B'), # KJ4 index
+    ('k4_id', 'B'), # K4 index
+    ('m4_id', 'B'), # M4 index
+    ('hd4_id', 'B'), # HD4 index
+    ('hund5', '12s', 'str'), # HUND5 (Individual dog name is a string capped at 12 characters)
+    ('kj5_id', 'B'), # KJ5 index
+    ('k5_id', 'B'), # K5 index
+    ('m5_id', 'B'), # M5 index
+    ('hd5_id', 'B'), # HD5 index
+    ('hund6', '12s', 'str'), # HUND6 (Individual dog name is a string capped at 12 characters)
+    ('kj6_id', 'B'), # KJ6 index
+    ('k6_id', 'B'), # K6 index
+    ('m6_id', 'B'), # M6 index
+    ('hd6_id', 'B'), # HD6 index
+    ('hund7', '12s', 'str'), # HUND7 (Individual dog name is a string capped at 12 characters)
+    ('kj7_id', 'B'), # KJ7 index
+    ('k7_id', 'B'), # K7 index
+    ('m7_id', 'B'), # M7 index
+    ('hd7_id', 'B'), # HD7 index
+    ('hund8', '12s', 'str'), # HUND8 (Individual dog name is a string capped at 12 characters)
+    ('kj8_id', 'B'), # KJ8 index
+    ('k8_id', 'B'), # K8 index
+    ('m8_id', 'B'), # M8 index
+    ('hd8_id', 'B'), # HD8 index
+    ('hund9', '12s', 'str'), # HUND9 (Individual dog name is a string capped at 12 characters)
+    ('kj9_id', 'B'), # KJ9 index
+    ('k9_id', 'B'), # K9 index
+    ('m9_id', 'B'), # M9 index
+    ('hd9_id', 'B'), # HD9 index
+    ('hund10', '12s', 'str'), # HUND10 (Individual dog name is a string capped at 12 characters)
+    ('kj10_id', 'B'), # KJ10 index
+    ('k10_id', 'B'), # K10 index
+    ('m10_id', 'B'), # M10 index
+    ('hd10_id', 'B'), # HD10 index
+    ('hund11', '12s', 'str'), # HUND11 (Individual dog name is a string capped at 12 characters)
+    ('kj11_id', 'B'), # KJ11 index
+    ('k11_id', 'B'), # K11 index
+    ('m11_id', 'B'), # M11 index
+    ('hd11_id', 'B'), # HD11 index
+    ('hund12', '12s', 'str'), # HUND12 (Individual dog name is a string capped at 12 characters)
+    ('kj12_id', 'B'), # KJ12 index
+    ('k12_id', 'B'), # K12 index
+    ('m12_id', 'B'), # M12 index
+    ('hd12_id', 'B'), # HD12 index
+])
+
+class TysKull(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_kullb', '_kennel', '_fodt', '_kullnr', '_farens_reg_nr', '_farens_navn', '_morens_reg_nr',
+                 '_morens_navn', '_alle_id', '_sosken', '_hund1', '_kj1_id', '_k1_id', '_m1_id', '_hd1_id', '_hund2',
+                 '_kj2_id', '_k2_id', '_m2_id', '_hd2_id', '_hund3', '_kj3_id', '_k3_id', '_m3_id', '_hd3_id',
+                 '_hund4', '_kj4_id', '_k4_id', '_m4_id', '_hd4_id', '_hund5', '_kj5_id', '_k5_id', '_m5_id',
+                 '_hd5_id', '_hund6', '_kj6_id', '_k6_id', '_m6_id', '_hd6_id', '_hund7', '_kj7_id', '_k7_id',
+                 '_m7_id', '_hd7_id', '_hund8', '_kj8_id', '_k8_id', '_m8_id', '_hd8_id', '_hund9', '_kj9_id',
+                 '_k9_id', '_m9_id', '_hd9_id', '_hund10', '_kj10_id', '_k10_id', '_m10_id', '_hd10_id', '_hund11',
+                 '_kj11_id', '_k11_id', '_m11_id', '_hd11_id', '_hund12', '_kj12_id', '_k12_id', '_m12_id',
+                 '_hd12_id')
 
-class TysKull:
 
     _kullb: Union[str, None] # The litter letter (KULLB in original schema)
     _kennel: Union[str, None] # The kennel that the litter was born to (KENNEL in original schema)
@@ -211,292 +297,36 @@ class TysKull:
     def from_bytes(cls, content: bytes):
         if len(content) != 587:
             raise AssertionError('Input for TysKull should be 250 bytes')
-        
-        # The german litter table contains a 17 byte header that does not contain usefull data
-        header = content[:17]
-        sub_content = content
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[17:] # 570 bytes remaining
-        kullb = graceful_conversion(sub_content[:1]) # KULLB (Litter letter is a string capped at 1 character)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 569 bytes remaining
-        kennel = graceful_conversion(sub_content[:32]) # KENNEL (Kennel is a string capped at 32 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[32:] # 537 bytes remaining
-        fodt = date_conversion(sub_content[:6])  # FØDT (birthdate/født is represented by a 6 digit numerical string)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[6:] # 531 bytes remaining
-        kullnr = graceful_conversion(sub_content[:5]) # KULLNR (Litter number/identifier is a string capped at 6 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[5:] # 526 bytes remaining
-        farens_reg_nr = graceful_conversion(sub_content[:12]) # FARENS REG.NR (registration number is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 514 bytes remaining
-        farens_navn = graceful_conversion(sub_content[:38]) # FARens_navn (name of father is a string capped at 38 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[38:] # 476 bytes remaining
-        morens_reg_nr = graceful_conversion(sub_content[:12]) # MORENS REG.NR (registration number is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] # 464 bytes remaining
-        morens_navn = graceful_conversion(sub_content[:38]) # MORENS NAVN (name of mother is a string capped at 38 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[38:] # 426 bytes remaining
-        alle_id = sub_content[0]# ALLE index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] # 425 bytes remaining
-        sosken = graceful_conversion(sub_content[:233]) # SIBLINGS (sibling information is a string capped at 233 characters)
-
-        # Siblings 192 bytes remaining
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[233:]
-        hund1 = graceful_conversion(sub_content[:12]) # HUND1 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj1_id = sub_content[0]# KJ1 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k1_id = sub_content[0]# K1 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m1_id = sub_content[0]# M1 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd1_id = sub_content[0]# HD1 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund2 = graceful_conversion(sub_content[:12]) # HUND2 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj2_id = sub_content[0]# KJ2 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k2_id = sub_content[0]# K2 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m2_id = sub_content[0]# M2 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd2_id = sub_content[0]# HD2 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund3 = graceful_conversion(sub_content[:12]) # HUND3 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj3_id = sub_content[0]# KJ3 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k3_id = sub_content[0]# K3 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m3_id = sub_content[0]# M3 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd3_id = sub_content[0]# HD3 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund4 = graceful_conversion(sub_content[:12]) # HUND4 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj4_id = sub_content[0]# KJ4 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k4_id = sub_content[0]# K4 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m4_id = sub_content[0]# M4 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd4_id = sub_content[0]# HD4 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund5 = graceful_conversion(sub_content[:12]) # HUND5 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj5_id = sub_content[0]# KJ5 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k5_id = sub_content[0]# K5 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m5_id = sub_content[0]# M5 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd5_id = sub_content[0]# HD5 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund6 = graceful_conversion(sub_content[:12]) # HUND6 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj6_id = sub_content[0]# KJ6 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k6_id = sub_content[0]# K6 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m6_id = sub_content[0]# M6 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd6_id = sub_content[0]# HD6 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund7 = graceful_conversion(sub_content[:12]) # HUND7 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj7_id = sub_content[0]# KJ7 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k7_id = sub_content[0]# K7 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m7_id = sub_content[0]# M7 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        hd7_id = sub_content[0]# HD7 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund8 = graceful_conversion(sub_content[:12]) # HUND8 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] 
-        kj8_id = sub_content[0]# KJ8 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        k8_id = sub_content[0]# K8 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        m8_id = sub_content[0]# M8 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        hd8_id = sub_content[0]# HD8 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund9 = graceful_conversion(sub_content[:12]) # HUND9 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] 
-        kj9_id = sub_content[0]# KJ9 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        k9_id = sub_content[0]# K9 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        m9_id = sub_content[0]# M9 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd9_id = sub_content[0]# HD9 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund10 = graceful_conversion(sub_content[:12]) # HUND10 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj10_id = sub_content[0]# KJ10 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k10_id = sub_content[0]# K10 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m10_id = sub_content[0]# M10 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd10_id = sub_content[0]# HD10 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund11 = graceful_conversion(sub_content[:12]) # HUND11 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:]
-        kj11_id = sub_content[0]# KJ11 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        k11_id = sub_content[0]# K11 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m11_id = sub_content[0]# M11 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd11_id = sub_content[0]# HD11 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hund12 = graceful_conversion(sub_content[:12]) # HUND12 (Individual dog name is a string capped at 12 characters)
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[12:] 
-        kj12_id = sub_content[0]# KJ12 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:] 
-        k12_id = sub_content[0]# K12 index
-
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        m12_id = sub_content[0]# M12 index
 
-        # Eliminate the already used data and set the next property
-        sub_content = sub_content[1:]
-        hd12_id = sub_content[0]# HD12 index
+        # Unpack every column in a single call, the layout skips the header
+        (kullb, kennel, fodt, kullnr, farens_reg_nr, farens_navn, morens_reg_nr, morens_navn, alle_id,
+         sosken, hund1, kj1_id, k1_id, m1_id, hd1_id, hund2, kj2_id, k2_id, m2_id, hd2_id, hund3, kj3_id,
+         k3_id, m3_id, hd3_id, hund4, kj4_id, k4_id, m4_id, hd4_id, hund5, kj5_id, k5_id, m5_id, hd5_id,
+         hund6, kj6_id, k6_id, m6_id, hd6_id, hund7, kj7_id, k7_id, m7_id, hd7_id, hund8, kj8_id, k8_id,
+         m8_id, hd8_id, hund9, kj9_id, k9_id, m9_id, hd9_id, hund10, kj10_id, k10_id, m10_id, hd10_id,
+         hund11, kj11_id, k11_id, m11_id, hd11_id, hund12, kj12_id, k12_id, m12_id, hd12_id) = _LAYOUT.unpack(content)
+
+        kullb = graceful_conversion(kullb)
+        kennel = graceful_conversion(kennel)
+        fodt = date_conversion(fodt)
+        kullnr = graceful_conversion(kullnr)
+        farens_reg_nr = graceful_conversion(farens_reg_nr)
+        farens_navn = graceful_conversion(farens_navn)
+        morens_reg_nr = graceful_conversion(morens_reg_nr)
+        morens_navn = graceful_conversion(morens_navn)
+        sosken = graceful_conversion(sosken)
+        hund1 = graceful_conversion(hund1)
+        hund2 = graceful_conversion(hund2)
+        hund3 = graceful_conversion(hund3)
+        hund4 = graceful_conversion(hund4)
+        hund5 = graceful_conversion(hund5)
+        hund6 = graceful_conversion(hund6)
+        hund7 = graceful_conversion(hund7)
+        hund8 = graceful_conversion(hund8)
+        hund9 = graceful_conversion(hund9)
+        hund10 = graceful_conversion(hund10)
+        hund11 = graceful_conversion(hund11)
+        hund12 = graceful_conversion(hund12)
 
         return cls(
             kullb=kullb,
@@ -1,11 +1,42 @@
-import struct
 
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, parse_date, anomaly, RecordLayout, LazyRecord
+
+# The showcase table contains a 5 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=84, header_len=5, fields=[
+    ('reg_nr', '12s', 'str'), # REG.NR (Registration number is a string capped at 12 characters)
+    ('farens_reg_nr', '12s', 'str'), # FARENS REG.NR (Fathers registration number is a string capped at 12 characters)
+    ('morfars_reg_nr', '12s', 'str'), # MORFARS REG.NR (Grandfathers registration number is a string capped at 12 characters)
+    ('fodt', '6s', 'date'), # FØDT (Birthdate is represented by a 6 digit numerical string)
+    ('kjonn_id', 'B'), # KJØNN (Sex of dog is an enum represented by a 1 byte integer)
+    ('oppdateringsdato', '6s', 'date'), # OPPDATERINGSDATO (Update date is represented by a 6 digit numerical string)
+    ('antgangutstilt', 'H', 'null'), # ANTGANGUTSTILT (Number of times displayed is a 2 byte integer)
+    ('premieant1', 'H', 'null'), # 1PREMIEANT (Number of times won is a 2 byte integer)
+    ('premiepros1', 'H', 'null'), # 1PREMIEPROS (Winning percentage is a 2 byte integer)
+    ('premieant2', 'H', 'null'), # 2PREMIEANT (Number of times placed 2nd is a 2 byte integer)
+    ('premiepros2', 'H', 'null'), # 2PREMIEPROS (2nd place percentage is a 2 byte integer)
+    ('premieant3', 'H', 'null'), # 3PREMIEANT (Number of times placed 3rd is a 2 byte integer)
+    ('premiepros3', 'H', 'null'), # 3PREMIEPROS (3rd place percentage is a 2 byte integer)
+    ('kibant', 'H', 'null'), # KIBANT (KIB number is a 2 byte integer)
+    ('kibpros', 'H', 'null'), # KIBPROS (KIB Percentage is a 2 byte integer)
+    ('hpant', 'H', 'null'), # HPANT (HP number is a 2 byte integer)
+    ('hppros', 'H', 'null'), # HPPROS (HP Percentage is a 2 byte integer)
+    ('ckant', 'H', 'null'), # CKANT (CK number is a 2 byte integer)
+    ('ckpros', 'H', 'null'), # CKPROS (CK Percentage is a 2 byte integer)
+    ('certant', 'H', 'null'), # CERTANT (CERT number is a 2 byte integer)
+    ('certpros', 'H', 'null'), # CERTPROS (CERT Percentage is a 2 byte integer)
+])
+
+class Utstillingsamleres(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+
+    __slots__ = ('_reg_nr', '_farens_reg_nr', '_morfars_reg_nr', '_fodt', '_fodt_raw', '_kjonn_id',
+                 '_oppdateringsdato', '_oppdateringsdato_raw', '_antgangutstilt', '_premieant1', '_premiepros1',
+                 '_premieant2', '_premiepros2', '_premieant3', '_premiepros3', '_kibant', '_kibpros', '_hpant',
+                 '_hppros', '_ckant', '_ckpros', '_certant', '_certpros')
 
-class Utstillingsamleres:
     _reg_nr: str # Registration number (REG.NR in original schema)
     _farens_reg_nr: Union[str, None] # Fathers registration number (FARENS REG.NR in original schema)
     _morfars_reg_nr: Union[str, None] # Grandfathers registration number (MORFARS REG.NR in original schema)
@@ -66,137 +97,40 @@ class Utstillingsamleres:
         if len(content) != 84:
             raise AssertionError("Input for Utstillingsamleres should be 84 bytes")
 
-        # The showcase table contains a 5 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[5:]
-
-        # Parse the REG.NR property
-        reg_nr = graceful_conversion(sub_content[:12]) # REG.NR (Registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the FARENS REG.NR property
-        farens_reg_nr = graceful_conversion(sub_content[:12]) # FARENS REG.NR (Fathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the MORFARS REG.NR property
-        morfars_reg_nr = graceful_conversion(sub_content[:12]) # MORFARS REG.NR (Grandfathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the FØDT property
-        fodt = None
-        fodt_raw = graceful_conversion(sub_content[:6])
-        try:
-            fodt = date_conversion(sub_content[:6]) # FØDT (Birthdate is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)        # Remove used data from next entries
-        sub_content = sub_content[6:]
-
-        # Parse the KJØNN property
-        kjonn_id = sub_content[0] # KJØNN (Sex of dog is an enum represented by a 1 byte integer)
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the OPPDATERINGSDATO property
-        oppdateringsdato = None
-        oppdateringsdato_raw = graceful_conversion(sub_content[:6])
-        try:
-            oppdateringsdato = date_conversion(sub_content[:6]) # OPPDATERINGSDATO (Update date is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)        # Remove used data from next entries
-        sub_content = sub_content[6:]
-
-        # Parse the ANTGANGUTSTILT property
-        antgangutstilt = struct.unpack('H', sub_content[:2])[0] # ANTGANGUTSTILT (Number of times displayed is a 2 byte integer)
-        antgangutstilt = None if antgangutstilt == 32768 else antgangutstilt # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        # Unpack every column in a single call, the layout skips the header
+        (reg_nr, farens_reg_nr, morfars_reg_nr, fodt_data, kjonn_id, oppdateringsdato_data, antgangutstilt,
+         premieant1, premiepros1, premieant2, premiepros2, premieant3, premiepros3, kibant, kibpros, hpant,
+         hppros, ckant, ckpros, certant, certpros) = _LAYOUT.unpack(content)
 
-        # Parse the 1PREMIEANT property
-        premieant1 = struct.unpack('H', sub_content[:2])[0] # 1PREMIEANT (Number of times won is a 2 byte integer)
-        premieant1 = None if premieant1 == 32768 else premieant1 # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        reg_nr = graceful_conversion(reg_nr)
+        farens_reg_nr = graceful_conversion(farens_reg_nr)
+        morfars_reg_nr = graceful_conversion(morfars_reg_nr)
 
-        # Parse the 1PREMIEPROS property
-        premiepros1 = struct.unpack('H', sub_content[:2])[0] # 1PREMIEPROS (Winning percentage is a 2 byte integer)
-        premiepros1 = None if premiepros1 == 32768 else premiepros1 # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        fodt_date = parse_date(fodt_data)
+        fodt, fodt_raw = fodt_date.date, fodt_date.raw
+        if fodt_date.error is not None:
+            anomaly('invalid date', 'fodt', fodt_raw)
 
-        # Parse the 2PREMIEANT property
-        premieant2 = struct.unpack('H', sub_content[:2])[0] # 2PREMIEANT (Number of times placed 2nd is a 2 byte integer)
-        premieant2 = None if premieant2 == 32768 else premieant2 # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        oppdateringsdato_date = parse_date(oppdateringsdato_data)
+        oppdateringsdato, oppdateringsdato_raw = oppdateringsdato_date.date, oppdateringsdato_date.raw
+        if oppdateringsdato_date.error is not None:
+            anomaly('invalid date', 'oppdateringsdato', oppdateringsdato_raw)
 
-        # Parse the 2PREMIEPROS property
-        premiepros2 = struct.unpack('H', sub_content[:2])[0] # 2PREMIEPROS (2nd place percentage is a 2 byte integer)
+        antgangutstilt = None if antgangutstilt == 32768 else antgangutstilt # Set to python None if value indicates null
+        premieant1 = None if premieant1 == 32768 else premieant1 # Set to python None if value indicates null
+        premiepros1 = None if premiepros1 == 32768 else premiepros1 # Set to python None if value indicates null
+        premieant2 = None if premieant2 == 32768 else premieant2 # Set to python None if value indicates null
         premiepros2 = None if premiepros2 == 32768 else premiepros2 # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 3PREMIEANT property
-        premieant3 = struct.unpack('H', sub_content[:2])[0] # 3PREMIEANT (Number of times placed 3rd is a 2 byte integer)
         premieant3 = None if premieant3 == 32768 else premieant3 # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 3PREMIEPROS property
-        premiepros3 = struct.unpack('H', sub_content[:2])[0] # 3PREMIEPROS (3rd place percentage is a 2 byte integer)
         premiepros3 = None if premiepros3 == 32768 else premiepros3 # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the KIBANT property
-        kibant = struct.unpack('H', sub_content[:2])[0] # KIBANT (KIB number is a 2 byte integer)
         kibant = None if kibant == 32768 else kibant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the KIBPROS property
-        kibpros = struct.unpack('H', sub_content[:2])[0] # KIBPROS (KIB Percentage is a 2 byte integer)
         kibpros = None if kibpros == 32768 else kibpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the HPANT property
-        hpant = struct.unpack('H', sub_content[:2])[0] # HPANT (HP number is a 2 byte integer)
         hpant = None if hpant == 32768 else hpant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the HPPROS property
-        hppros = struct.unpack('H', sub_content[:2])[0] # HPPROS (HP Percentage is a 2 byte integer)
         hppros = None if hppros == 32768 else hppros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CKANT property
-        ckant = struct.unpack('H', sub_content[:2])[0] # CKANT (CK number is a 2 byte integer)
         ckant = None if ckant == 32768 else ckant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CKPROS property
-        ckpros = struct.unpack('H', sub_content[:2])[0] # CKPROS (CK Percentage is a 2 byte integer)
         ckpros = None if ckpros == 32768 else ckpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CERTANT property
-        certant = struct.unpack('H', sub_content[:2])[0] # CERTANT (CERT number is a 2 byte integer)
         certant = None if certant == 32768 else certant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CERTPROS property
-        certpros = struct.unpack('H', sub_content[:2])[0] # CERTPROS (CERT Percentage is a 2 byte integer)
         certpros = None if certpros == 32768 else certpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
 
         return cls(reg_nr=reg_nr,
                    farens_reg_nr=farens_reg_nr,
@@ -1,10 +1,51 @@
-import struct
 from typing import List, Union
 from datetime import date
 
-from ...utils import graceful_conversion, date_conversion
+from ...utils import graceful_conversion, parse_date, anomaly, RecordLayout, LazyRecord
+
+# The Display Statistics table contains a 6 byte header that does not contain useful data
+_LAYOUT = RecordLayout(record_len=78, header_len=6, fields=[
+    ('farens_reg_nr', '12s', 'str'), # FARENS REG.NR (Fathers registration number is a string capped at 12 characters)
+    ('morfars_reg_nr', '12s', 'str'), # MORFARS REG.NR (Grandfathers registration number is a string capped at 12 characters)
+    ('oppdateringsdato', '6s', 'date'), # OPPDATERINGSDATO (Update date is represented by a 6 digit numerical string)
+    ('totantavkom', 'H', 'null'), # TOTANTAVKOM (Number of children is a 2 byte integer)
+    ('antkull', 'B', 'null'), # ANTKULL (Number of litters is a 1 byte integer)
+    ('antavkutstbar', 'H', 'null'), # ANTAVKUTSTBAR (Number of children displayable is a 2 byte integer)
+    ('antavkutstbarpros', 'H', 'null'), # ANTAVKUTSTBARPROS (Percentage of children displayable is a 2 byte integer)
+    ('antkullutstbar', 'B', 'null'), # ANTKULLUTSTBAR (Number of litters displayable is a 1 byte integer)
+    ('antutstilt', 'H', 'null'), # ANTUTSTILT (Number of children displayed is a 2 byte integer)
+    ('antutstiltpros', 'H', 'null'), # ANTUTSTILTPROS (Percentage of children displayed is a 2 byte integer)
+    ('antgangutstilt', 'H', 'null'), # ANTGANGUTSTILT (Number of times displayed is a 2 byte integer)
+    ('n1premieant', 'H', 'null'), # 1PREMIEANT (First prize number is a 2 byte integer)
+    ('n1premiepros', 'H', 'null'), # 1PREMIEPROS (First prize percentage is a 2 byte integer)
+    ('n2premieant', 'H', 'null'), # 2PREMIEANT (Second prize number is a 2 byte integer)
+    ('n2premiepros', 'H', 'null'), # 2PREMIEPROS (Second prize percentage is a 2 byte integer)
+    ('n3premieant', 'H', 'null'), # 3PREMIEANT (Third prize number is a 2 byte integer)
+    ('n3premiepros', 'H', 'null'), # 3PREMIEPROS (Third prize percentage is a 2 byte integer)
+    ('kibant', 'H', 'null'), # KIBANT (KIB is a 2 byte integer)
+    ('kibpros', 'H', 'null'), # KIBPROS (KIB is a 2 byte integer)
+    ('hpant', 'H', 'null'), # HPANT (HP is a 2 byte integer)
+    ('hppros', 'H', 'null'), # HPPROS (HP is a 2 byte integer)
+    ('ckant', 'H', 'null'), # CKANT (CK is a 2 byte integer)
+    ('ckpros', 'H', 'null'), # CKPROS (CK is a 2 byte integer)
+    ('certant', 'H', 'null'), # CERTANT (CK is a 2 byte integer)
+    ('certpros', 'H', 'null'), # CERTPROS (CK is a 2 byte integer)
+])
+
+class UtStStat(LazyRecord):
+    layout = _LAYOUT # Byte layout of a record, shared by from_bytes and the columnar reader
+    _column_names = { # Attributes can not start with a digit like the columns do
+        '1premieant': 'n1premieant', '1premiepros': 'n1premiepros',
+        '2premieant': 'n2premieant', '2premiepros': 'n2premiepros',
+        '3premieant': 'n3premieant', '3premiepros': 'n3premiepros',
+    }
+
+    __slots__ = ('_farens_reg_nr', '_morfars_reg_nr', '_oppdateringsdato', '_oppdateringsdato_raw', '_totantavkom',
+                 '_antkull', '_antavkutstbar', '_antavkutstbarpros', '_antkullutstbar', '_antutstilt',
+                 '_antutstiltpros', '_antgangutstilt', '_1premieant', '_1premiepros', '_2premieant', '_2premiepros',
+                 '_3premieant', '_3premiepros', '_kibant', '_kibpros', '_hpant', '_hppros', '_ckant', '_ckpros',
+                 '_certant', '_certpros')
 
-class UtStStat:
     _farens_reg_nr: str # Fathers registration number (FARENS REG.NR in original schema)
     _morfars_reg_nr: str # Grandfathers registration number (MORFARS REG.NR in original schema)
     _oppdateringsdato: Union[date, None] # Update date (OPPDATERINGSDATO in original schema)
@@ -73,160 +114,42 @@ class UtStStat:
         if len(content) != 78:
             raise AssertionError("Input for UtStStat should be 78 bytes")
 
-        # The Display Statistics table contains a 6 byte header that does not contain useful data
-        # Remove used data from next entries
-        sub_content = content[6:]
-
-        # Parse the FARENS REG.NR property
-        farens_reg_nr = graceful_conversion(sub_content[:12]) # FARENS REG.NR (Fathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the MORFARS REG.NR property
-        morfars_reg_nr = graceful_conversion(sub_content[:12]) # MORFARS REG.NR (Grandfathers registration number is a string capped at 12 characters)
-        # Remove used data from next entries
-        sub_content = sub_content[12:]
-
-        # Parse the OPPDATERINGSDATO property
-        oppdateringsdato = None
-        oppdateringsdato_raw = graceful_conversion(sub_content[:6])
-        try:
-            oppdateringsdato = date_conversion(sub_content[:6]) # OPPDATERINGSDATO (Update date is represented by a 6 digit numerical string)
-        except ValueError as e:
-            print(e)        # Remove used data from next entries
-        sub_content = sub_content[6:]
-
-        # Parse the TOTANTAVKOM property
-        totantavkom = struct.unpack('H', sub_content[:2])[0] # TOTANTAVKOM (Number of children is a 2 byte integer)
-        totantavkom = None if totantavkom == 32768 else totantavkom # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        # Unpack every column in a single call, the layout skips the header
+        (farens_reg_nr, morfars_reg_nr, oppdateringsdato_data, totantavkom, antkull, antavkutstbar,
+         antavkutstbarpros, antkullutstbar, antutstilt, antutstiltpros, antgangutstilt, n1premieant,
+         n1premiepros, n2premieant, n2premiepros, n3premieant, n3premiepros, kibant, kibpros, hpant, hppros,
+         ckant, ckpros, certant, certpros) = _LAYOUT.unpack(content)
 
-        # Parse the ANTKULL property
-        antkull = sub_content[0] # ANTKULL (Number of litters is a 1 byte integer)
-        antkull = None if antkull == 128 else antkull # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
+        farens_reg_nr = graceful_conversion(farens_reg_nr)
+        morfars_reg_nr = graceful_conversion(morfars_reg_nr)
 
-        # Parse the ANTAVKUTSTBAR property
-        antavkutstbar = struct.unpack('H', sub_content[:2])[0] # ANTAVKUTSTBAR (Number of children displayable is a 2 byte integer)
-        antavkutstbar = None if antavkutstbar == 32768 else antavkutstbar # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
+        oppdateringsdato_date = parse_date(oppdateringsdato_data)
+        oppdateringsdato, oppdateringsdato_raw = oppdateringsdato_date.date, oppdateringsdato_date.raw
+        if oppdateringsdato_date.error is not None:
+            anomaly('invalid date', 'oppdateringsdato', oppdateringsdato_raw)
 
-        # Parse the ANTAVKUTSTBARPROS property
-        antavkutstbarpros = struct.unpack('H', sub_content[:2])[0] # ANTAVKUTSTBARPROS (Percentage of children displayable is a 2 byte integer)
+        totantavkom = None if totantavkom == 32768 else totantavkom # Set to python None if value indicates null
+        antkull = None if antkull == 128 else antkull # Set to python None if value indicates null
+        antavkutstbar = None if antavkutstbar == 32768 else antavkutstbar # Set to python None if value indicates null
         antavkutstbarpros = None if antavkutstbarpros == 32768 else antavkutstbarpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the ANTKULLUTSTBAR property
-        antkullutstbar = sub_content[0] # ANTKULLUTSTBAR (Number of litters displayable is a 1 byte integer)
         antkullutstbar = None if antkullutstbar == 128 else antkullutstbar # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[1:]
-
-        # Parse the ANTUTSTILT property
-        antutstilt = struct.unpack('H', sub_content[:2])[0] # ANTUTSTILT (Number of children displayed is a 2 byte integer)
         antutstilt = None if antutstilt == 32768 else antutstilt # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the ANTUTSTILTPROS property
-        antutstiltpros = struct.unpack('H', sub_content[:2])[0] # ANTUTSTILTPROS (Percentage of children displayed is a 2 byte integer)
         antutstiltpros = None if antutstiltpros == 32768 else antutstiltpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the ANTGANGUTSTILT property
-        antgangutstilt = struct.unpack('H', sub_content[:2])[0] # ANTGANGUTSTILT (Number of times displayed is a 2 byte integer)
         antgangutstilt = None if antgangutstilt == 32768 else antgangutstilt # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 1PREMIEANT property
-        n1premieant = struct.unpack('H', sub_content[:2])[0] # 1PREMIEANT (First prize number is a 2 byte integer)
         n1premieant = None if n1premieant == 32768 else n1premieant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 1PREMIEPROS property
-        n1premiepros = struct.unpack('H', sub_content[:2])[0] # 1PREMIEPROS (First prize percentage is a 2 byte integer)
         n1premiepros = None if n1premiepros == 32768 else n1premiepros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 2PREMIEANT property
-        n2premieant = struct.unpack('H', sub_content[:2])[0] # 2PREMIEANT (Second prize number is a 2 byte integer)
         n2premieant = None if n2premieant == 32768 else n2premieant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 2PREMIEPROS property
-        n2premiepros = struct.unpack('H', sub_content[:2])[0] # 2PREMIEPROS (Second prize percentage is a 2 byte integer)
         n2premiepros = None if n2premiepros == 32768 else n2premiepros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 3PREMIEANT property
-        n3premieant = struct.unpack('H', sub_content[:2])[0] # 3PREMIEANT (Third prize number is a 2 byte integer)
         n3premieant = None if n3premieant == 32768 else n3premieant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the 3PREMIEPROS property
-        n3premiepros = struct.unpack('H', sub_content[:2])[0] # 3PREMIEPROS (Third prize percentage is a 2 byte integer)
         n3premiepros = None if n3premiepros == 32768 else n3premiepros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the KIBANT property
-        kibant = struct.unpack('H', sub_content[:2])[0] # KIBANT (KIB is a 2 byte integer)
         kibant = None if kibant == 32768 else kibant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the KIBPROS property
-        kibpros = struct.unpack('H', sub_content[:2])[0] # KIBPROS (KIB is a 2 byte integer)
         kibpros = None if kibpros == 32768 else kibpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the HPANT property
-        hpant = struct.unpack('H', sub_content[:2])[0] # HPANT (HP is a 2 byte integer)
         hpant = None if hpant == 32768 else hpant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the HPPROS property
-        hppros = struct.unpack('H', sub_content[:2])[0] # HPPROS (HP is a 2 byte integer)
         hppros = None if hppros == 32768 else hppros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CKANT property
-        ckant = struct.unpack('H', sub_content[:2])[0] # CKANT (CK is a 2 byte integer)
         ckant = None if ckant == 32768 else ckant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CKPROS property
-        ckpros = struct.unpack('H', sub_content[:2])[0] # CKPROS (CK is a 2 byte integer)
         ckpros = None if ckpros == 32768 else ckpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CERTANT property
-        certant = struct.unpack('H', sub_content[:2])[0] # CERTANT (CK is a 2 byte integer)
         certant = None if certant == 32768 else certant # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
-
-        # Parse the CERTPROS property
-        certpros = struct.unpack('H', sub_content[:2])[0] # CERTPROS (CK is a 2 byte integer)
         certpros = None if certpros == 32768 else certpros # Set to python None if value indicates null
-        # Remove used data from next entries
-        sub_content = sub_content[2:]
 
         return cls(farens_reg_nr=farens_reg_nr,
                    morfars_reg_nr=morfars_reg_nr,
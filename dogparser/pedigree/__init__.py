@@ -0,0 +1,2 @@
+from ._graph import PedigreeGraph
+from ._inbreeding import inbreeding_coefficients, inbreeding_report, stored_coefficient
\ No newline at end of file
@@ -0,0 +1,18 @@
+import argparse
+
+from ._inbreeding import inbreeding_report
+
+def main():
+    argument_parser = argparse.ArgumentParser(description='Compares computed inbreeding coefficients with the INNAVL table')
+    argument_parser.add_argument('HUNDER_SOURCE', help='The HUNDER dataease file, without extension')
+    argument_parser.add_argument('INNAVL_SOURCE', help='The INNAVL dataease file, without extension')
+    argument_parser.add_argument('REPORT_FILE', help='The CSV report to write')
+    argument_parser.add_argument('--tolerance', default=0.0005, type=float,
+                                 help='The largest difference between the coefficients that is still a match')
+
+    args = argument_parser.parse_args()
+
+    inbreeding_report(args.HUNDER_SOURCE, args.INNAVL_SOURCE, args.REPORT_FILE, args.tolerance)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
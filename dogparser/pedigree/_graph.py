@@ -0,0 +1,218 @@
+from array import array
+from typing import Dict, Iterable, List, Tuple, Union
+
+from ..parsers.hund._hund import Hund
+from ..utils import RecordReader
+
+class PedigreeGraph:
+    """Pedigree of the dogs in a HUNDER table, stored as integer parent pointers
+
+    Every dog is a node with an integer id, its father and mother are node ids in two arrays (-1 when unknown).
+    Parents that are referenced but have no record of their own (e.g. foreign dogs) get a node as well, with a
+    record position of -1. The children of every node are kept in compressed arrays (the children of node i are
+    children[child_offsets[i]:child_offsets[i + 1]]), so both directions are traversed without any objects.
+    When a registration number has more than one record, the first one is used.
+    """
+
+    _reg_nrs: List[str] # Registration number of each node
+    _ids: Dict[str, int] # Node id of each registration number
+    _fathers: array # Node id of the father of each node, -1 if unknown
+    _mothers: array # Node id of the mother of each node, -1 if unknown
+    _positions: array # Record index of each node in the .DBM file, -1 for parents without a record
+    _child_offsets: array # Start of the children of each node in _children, one extra entry at the end
+    _children: array # Node ids of the children, grouped by parent
+
+    def __init__(self, records: Iterable[Tuple[str, str, str]]) -> None:
+        """Builds the graph from (reg_nr, farens_reg_nr, morens_reg_nr) triples in record order"""
+
+        reg_nrs = []
+        ids = {}
+        parents = []
+        positions = array('i')
+
+        def node(reg_nr: str) -> int:
+            if not reg_nr:
+                return -1
+            node_id = ids.get(reg_nr)
+            if node_id is None:
+                node_id = ids[reg_nr] = len(reg_nrs)
+                reg_nrs.append(reg_nr)
+                parents.append(None)
+                positions.append(-1)
+            return node_id
+
+        for position, (reg_nr, farens_reg_nr, morens_reg_nr) in enumerate(records):
+            node_id = node(reg_nr)
+            if node_id == -1 or positions[node_id] != -1:
+                # Records without a registration number, or a duplicate of one seen before
+                continue
+            positions[node_id] = position
+            parents[node_id] = (farens_reg_nr, morens_reg_nr)
+
+        fathers = array('i', [-1]) * len(reg_nrs)
+        mothers = array('i', [-1]) * len(reg_nrs)
+        for node_id in range(len(parents)):
+            if parents[node_id] is not None:
+                farens_reg_nr, morens_reg_nr = parents[node_id]
+                # Parents added here are appended, they have no record and therefore no parents of their own
+                fathers[node_id] = node(farens_reg_nr)
+                mothers[node_id] = node(morens_reg_nr)
+        fathers.extend([-1] * (len(reg_nrs) - len(fathers)))
+        mothers.extend([-1] * (len(reg_nrs) - len(mothers)))
+
+        # Counting sort of the children by parent
+        counts = array('i', [0]) * (len(reg_nrs) + 1)
+        for parent_ids in (fathers, mothers):
+            for parent_id in parent_ids:
+                if parent_id != -1:
+                    counts[parent_id + 1] += 1
+        for i in range(len(reg_nrs)):
+            counts[i + 1] += counts[i]
+        children = array('i', [0]) * counts[-1]
+        fill = array('i', counts[:-1])
+        for parent_ids in (fathers, mothers):
+            for child_id, parent_id in enumerate(parent_ids):
+                if parent_id != -1:
+                    children[fill[parent_id]] = child_id
+                    fill[parent_id] += 1
+
+        self._reg_nrs = reg_nrs
+        self._ids = ids
+        self._fathers = fathers
+        self._mothers = mothers
+        self._positions = positions
+        self._child_offsets = counts
+        self._children = children
+
+    @classmethod
+    def from_hunder(cls, source_definition: str):
+        """Builds the graph from a HUNDER table, decoding only the registration numbers of each record"""
+
+        layout = Hund.layout
+        reg_nr = layout.column_decoder('reg_nr')
+        farens_reg_nr = layout.column_decoder('farens_reg_nr')
+        morens_reg_nr = layout.column_decoder('morens_reg_nr')
+
+        with RecordReader(source_definition + '.DBM', layout.record_len) as reader:
+            return cls((reg_nr(reader[i]), farens_reg_nr(reader[i]), morens_reg_nr(reader[i])) for i in range(len(reader)))
+
+    def __len__(self) -> int:
+        return len(self._reg_nrs)
+
+    def __contains__(self, reg_nr: str) -> bool:
+        return reg_nr in self._ids
+
+    @property
+    def fathers(self) -> array:
+        return self._fathers
+
+    @property
+    def mothers(self) -> array:
+        return self._mothers
+
+    def node(self, reg_nr: str) -> int:
+        """Node id of a registration number"""
+
+        node_id = self._ids.get(reg_nr)
+        if node_id is None:
+            raise KeyError(f'{reg_nr} is not in the pedigree')
+        return node_id
+
+    def reg_nr(self, node_id: int) -> str:
+        return self._reg_nrs[node_id]
+
+    def position(self, reg_nr: str) -> int:
+        """Record index of the dog in the .DBM file, -1 for parents without a record"""
+
+        return self._positions[self.node(reg_nr)]
+
+    def parents(self, reg_nr: str) -> Tuple[Union[str, None], Union[str, None]]:
+        node_id = self.node(reg_nr)
+        father, mother = self._fathers[node_id], self._mothers[node_id]
+        return (None if father == -1 else self._reg_nrs[father], None if mother == -1 else self._reg_nrs[mother])
+
+    def children(self, reg_nr: str) -> List[str]:
+        node_id = self.node(reg_nr)
+        return [self._reg_nrs[child_id] for child_id in self._children[self._child_offsets[node_id]:self._child_offsets[node_id + 1]]]
+
+    def ancestors(self, reg_nr: str, generations: int) -> Dict[str, int]:
+        """Ancestors up to the given number of generations back, with the nearest generation each appears in"""
+
+        fathers, mothers = self._fathers, self._mothers
+        found = {}
+        current = [self.node(reg_nr)]
+        for generation in range(1, generations + 1):
+            following = []
+            for node_id in current:
+                for parent_id in (fathers[node_id], mothers[node_id]):
+                    if parent_id != -1 and parent_id not in found:
+                        found[parent_id] = generation
+                        following.append(parent_id)
+            if not following:
+                break
+            current = following
+
+        return {self._reg_nrs[node_id]: generation for node_id, generation in found.items()}
+
+    def descendants(self, reg_nr: str, generations: int) -> Dict[str, int]:
+        """Descendants up to the given number of generations down, with the nearest generation each appears in"""
+
+        offsets, children = self._child_offsets, self._children
+        found = {}
+        current = [self.node(reg_nr)]
+        for generation in range(1, generations + 1):
+            following = []
+            for node_id in current:
+                for child_id in children[offsets[node_id]:offsets[node_id + 1]]:
+                    if child_id not in found:
+                        found[child_id] = generation
+                        following.append(child_id)
+            if not following:
+                break
+            current = following
+
+        return {self._reg_nrs[node_id]: generation for node_id, generation in found.items()}
+
+    def pedigree(self, reg_nr: str, generations: int) -> List[Union[str, None]]:
+        """The classic pedigree chart, generation by generation with the father before the mother
+
+        Holds 2 entries for the parents, then 4 for the grandparents and so on, None for unknown ancestors.
+        The parents of entry i are at 2i + 2 and 2i + 3.
+        """
+
+        fathers, mothers = self._fathers, self._mothers
+        chart = []
+        current = [self.node(reg_nr)]
+        for _ in range(generations):
+            current = [parent_id for node_id in current
+                       for parent_id in ((-1, -1) if node_id == -1 else (fathers[node_id], mothers[node_id]))]
+            chart.extend(None if node_id == -1 else self._reg_nrs[node_id] for node_id in current)
+
+        return chart
+
+    def topological_order(self) -> Tuple[array, int]:
+        """Node ids ordered so that parents come before their children
+
+        Also returns the number of dogs that are part of a parent cycle, which corrupt data can contain. Those
+        are appended last, in node order.
+        """
+
+        fathers, mothers = self._fathers, self._mothers
+        offsets, children = self._child_offsets, self._children
+        pending = array('b', ((father != -1) + (mother != -1) for father, mother in zip(fathers, mothers)))
+
+        order = array('i', (node_id for node_id in range(len(pending)) if not pending[node_id]))
+        i = 0
+        while i < len(order):
+            node_id = order[i]
+            for child_id in children[offsets[node_id]:offsets[node_id + 1]]:
+                pending[child_id] -= 1
+                if not pending[child_id]:
+                    order.append(child_id)
+            i += 1
+
+        cyclic = len(pending) - len(order)
+        if cyclic:
+            order.extend(node_id for node_id in range(len(pending)) if pending[node_id])
+
+        return order, cyclic
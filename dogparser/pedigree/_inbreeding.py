@@ -0,0 +1,133 @@
+import csv
+import re
+from array import array
+from heapq import heappop, heappush
+from typing import Union
+
+from ._graph import PedigreeGraph
+from ..parsers.innavl._innavl import Innavl
+from ..utils import RecordReader
+
+def inbreeding_coefficients(graph: PedigreeGraph) -> array:
+    """Wright's inbreeding coefficient of every dog in the pedigree, indexed by node id
+
+    Uses the algorithm of Meuwissen and Luo (1992), which walks the ancestors of each dog once, youngest first,
+    tracing the contributions through the L factor of the relationship matrix. Full siblings share their
+    coefficient, so it is computed once per pair of parents. Dogs in a parent cycle are treated as founders.
+    """
+
+    order, _ = graph.topological_order()
+    count = len(order)
+
+    # Work in the order of the pedigree, position 0 is the unknown parent
+    ranks = array('i', [0]) * count
+    for rank, node_id in enumerate(order, start=1):
+        ranks[node_id] = rank
+    fathers, mothers = graph.fathers, graph.mothers
+    sires = array('i', [0]) * (count + 1)
+    dams = array('i', [0]) * (count + 1)
+    for rank, node_id in enumerate(order, start=1):
+        sire, dam = fathers[node_id], mothers[node_id]
+        sire = 0 if sire == -1 else ranks[sire]
+        dam = 0 if dam == -1 else ranks[dam]
+        # A parent that comes later is part of a cycle, it is dropped
+        sires[rank] = sire if sire < rank else 0
+        dams[rank] = dam if dam < rank else 0
+
+    coefficients = array('d', [0.0]) * (count + 1)
+    coefficients[0] = -1.0
+    variances = array('d', [0.0]) * (count + 1) # Within family variance of each dog, D in the paper
+    contributions = array('d', [0.0]) * (count + 1) # Column of L for the current dog, reset after each walk
+    siblings = {}
+
+    for i in range(1, count + 1):
+        sire, dam = sires[i], dams[i]
+        variances[i] = 0.5 - 0.25 * (coefficients[sire] + coefficients[dam])
+        if not sire or not dam:
+            continue
+
+        key = (sire, dam) if sire < dam else (dam, sire)
+        coefficient = siblings.get(key)
+        if coefficient is None:
+            coefficient = -1.0
+            contributions[i] = 1.0
+            queue = [-i]
+            while queue:
+                j = -heappop(queue)
+                contribution = contributions[j]
+                for parent in (sires[j], dams[j]):
+                    if parent:
+                        # Contributions are positive, so a zero one has not been queued yet
+                        if not contributions[parent]:
+                            heappush(queue, -parent)
+                        contributions[parent] += 0.5 * contribution
+                coefficient += contribution * contribution * variances[j]
+                contributions[j] = 0.0
+            siblings[key] = coefficient
+        coefficients[i] = coefficient
+
+    result = array('d', [0.0]) * count
+    for node_id in range(count):
+        result[node_id] = coefficients[ranks[node_id]]
+    return result
+
+# A percentage in the INNAVL text, or else any number
+_PERCENTAGE = re.compile(r'(\d+(?:[.,]\d+)?)\s*%')
+_NUMBER = re.compile(r'\d+(?:[.,]\d+)?')
+
+def stored_coefficient(innavl: str) -> Union[float, None]:
+    """Best effort reading of the inbreeding coefficient in an INNAVL text, as a fraction
+
+    A percentage is preferred, otherwise the last number is used, read as a percentage when it is above 1.
+    """
+
+    match = _PERCENTAGE.search(innavl)
+    if match is not None:
+        return float(match.group(1).replace(',', '.')) / 100
+
+    numbers = _NUMBER.findall(innavl)
+    if not numbers:
+        return None
+    value = float(numbers[-1].replace(',', '.'))
+    return value / 100 if value > 1 else value
+
+def inbreeding_report(hunder_source: str, innavl_source: str, report_file: str, tolerance: float = 0.0005) -> dict:
+    """Computes the inbreeding coefficient of every dog in HUNDER and compares it to the INNAVL table
+
+    Writes one CSV row per INNAVL record with the stored text, the value read from it, the computed
+    coefficient and their difference. The status is match or mismatch (by tolerance), unreadable when no value
+    was found in the text, or missing when the dog is not in the pedigree. Returns the count of each status.
+    """
+
+    graph = PedigreeGraph.from_hunder(hunder_source)
+    coefficients = inbreeding_coefficients(graph)
+    print(f'Computed the inbreeding coefficients of {len(graph)} dogs')
+
+    layout = Innavl.layout
+    reg_nr = layout.column_decoder('reg_nr')
+    innavl = layout.column_decoder('innavl')
+    summary = {'match': 0, 'mismatch': 0, 'unreadable': 0, 'missing': 0}
+
+    with RecordReader(innavl_source + '.DBM', layout.record_len) as reader, open(report_file, 'w', encoding='utf8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['reg_nr', 'innavl', 'stored', 'computed', 'difference', 'status'])
+        for i in range(len(reader)):
+            record_reg_nr = reg_nr(reader[i])
+            text = innavl(reader[i])
+            stored = stored_coefficient(text)
+            computed = coefficients[graph.node(record_reg_nr)] if record_reg_nr in graph else None
+
+            difference = None
+            if computed is None:
+                status = 'missing'
+            elif stored is None:
+                status = 'unreadable'
+            else:
+                difference = computed - stored
+                status = 'match' if abs(difference) <= tolerance else 'mismatch'
+            summary[status] += 1
+
+            writer.writerow([record_reg_nr, text, stored, computed, difference, status])
+
+    print(', '.join(f'{count} {status}' for status, count in summary.items()))
+    return summary
@@ -0,0 +1,113 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from multiprocessing import Manager
+from typing import Dict, List, MutableMapping, Tuple, Union
+
+from dogparser.utils import MetricsExporter, StageProfiler, collecting, configure_logging, logger, profiling, quarantining, reporting
+
+from ._tables import EXPORT_FILES, parse_table
+
+def discover_tables(export_folder: str) -> List[Tuple[str, str]]:
+    """Finds the DBA/DBM pairs of a Hunder export, returns (table, source file) pairs ordered by file size"""
+
+    tables = []
+    for file_name in os.listdir(export_folder):
+        stem, extension = os.path.splitext(file_name)
+        if extension.upper() != '.DBM' or stem.upper() not in EXPORT_FILES:
+            continue
+        if extension != '.DBM':
+            # The parsers open <source file>.DBM and .DBA, a file with a lower case extension would not be found
+            logger.warning(f'Skipping {file_name}, the extension must be upper case .DBM')
+            continue
+
+        source_file = os.path.join(export_folder, stem)
+        if not os.path.exists(source_file + '.DBA'):
+            logger.warning(f'Skipping {file_name}, the schema file {stem}.DBA is missing')
+            continue
+
+        tables.append((os.path.getsize(source_file + '.DBM'), EXPORT_FILES[stem.upper()], source_file))
+
+    # Start the largest tables first, the run is bounded by the slowest one
+    return [(table, source_file) for _, table, source_file in sorted(tables, reverse=True)]
+
+def _timed_parse_table(table: str, source_file: str, destination_folder: str, output_format: str, checkpoint_len: int, resume: bool, profile: bool,
+                       progress_interval: float, metrics: Union[MutableMapping, None], log_level: Union[str, None], on_error: str) -> dict:
+    if log_level is not None:
+        # Worker processes that are spawned rather than forked start without the logging of the parent
+        configure_logging(log_level)
+
+    start = time.perf_counter()
+    quarantine_folder = os.path.join(destination_folder, table, 'DATA')
+    with reporting(table, progress_interval, metrics), collecting(table) as diagnostics, \
+            (quarantining(quarantine_folder, table) if on_error == 'quarantine' else nullcontext()) as quarantine, \
+            (profiling(quiet=True) if profile else nullcontext()) as profiler:
+        count = parse_table(table, source_file, destination_folder, output_format, 1, checkpoint_len, resume)
+    return {
+        'records': count,
+        'seconds': time.perf_counter() - start,
+        'quarantined': 0 if quarantine is None else len(quarantine),
+        'profile': None if profiler is None else profiler.report(),
+        'anomalies': diagnostics.report(),
+    }
+
+def parse_all(export_folder: str, destination_folder: str, output_format: str = 'json', workers: int = 1, checkpoint_len: int = 0, resume: bool = False, profile: bool = False,
+              progress_interval: float = 0, metrics_file: str = None, metrics_port: int = None,
+              log_level: str = None, on_error: str = 'raise') -> Dict[str, dict]:
+    """Parses every table of a Hunder export directory, running up to workers tables at the same time
+
+    Prints a line as each table finishes and a summary once all are done. A failing table does not stop
+    the others, its error is listed in the summary. With resume the tables that were interrupted continue from
+    their last checkpoint. With profile every table is profiled in its process, and the breakdown of each is
+    printed after the summary and kept in it. Every table prints its progress each progress_interval seconds,
+    and the progress of all tables is exported to the metrics_file and metrics_port, see MetricsExporter.
+    The anomalies met decoding each table are logged as a summary and kept in the summary, the tables log
+    from log_level on. With on_error quarantine the records that fail to decode are written to the quarantine
+    in the DATA folder of their table and counted in the summary, see Quarantine. Returns the summary by
+    table name.
+    """
+
+    tables = discover_tables(export_folder)
+    if not tables:
+        raise FileNotFoundError(f'No known DataEase tables were found in {export_folder}')
+    print(f'Parsing {len(tables)} tables from {export_folder} with {workers} workers')
+
+    summary = {}
+    start = time.perf_counter()
+    exported = metrics_file is not None or metrics_port is not None
+    # The tables run in other processes, they publish their progress through a manager
+    with (Manager() if exported else nullcontext()) as manager, ProcessPoolExecutor(max_workers=max(workers, 1)) as executor:
+        metrics = manager.dict() if exported else None
+        exporter = MetricsExporter(metrics, metrics_file, metrics_port, progress_interval) if exported else nullcontext()
+        with exporter:
+            futures = {
+                executor.submit(_timed_parse_table, table, source_file, destination_folder, output_format, checkpoint_len, resume, profile,
+                                progress_interval, metrics, log_level, on_error): (table, source_file)
+                for table, source_file in tables
+            }
+
+            for future in as_completed(futures):
+                table, source_file = futures[future]
+                try:
+                    summary[table] = {'source': source_file, 'error': None, **future.result()}
+                    print(f'{table} done, {summary[table]["records"]} records in {summary[table]["seconds"]:.1f}s ({len(summary)}/{len(tables)})')
+                except Exception as e:
+                    summary[table] = {'source': source_file, 'records': None, 'seconds': None, 'error': repr(e), 'quarantined': None, 'profile': None, 'anomalies': None}
+                    print(f'{table} failed, {e!r} ({len(summary)}/{len(tables)})')
+
+    print(f'\nParsed {len(tables)} tables in {time.perf_counter() - start:.1f}s')
+    for table, _ in tables:
+        result = summary[table]
+        if result['error']:
+            print(f'  {table:<20} FAILED  {result["error"]}')
+        else:
+            quarantined = f' {result["quarantined"]:>8} quarantined' if result['quarantined'] else ''
+            print(f'  {table:<20} {result["records"]:>10} records {result["seconds"]:>8.1f}s{quarantined}')
+
+    for table, _ in tables:
+        if summary[table]['profile'] is not None:
+            print(f'\n{table}')
+            StageProfiler.print_report(summary[table]['profile'])
+
+    return summary
\ No newline at end of file
@@ -0,0 +1,52 @@
+import os
+from collections import Counter
+from typing import Dict
+
+from dogparser.parsers.eier._eier import Eier
+from dogparser.parsers.hund._hund import Hund
+from dogparser.parsers.kull._kull import Kull
+from dogparser.parsers.oppdretter._oppdretter import Oppdretter
+from dogparser.parsers.poststed._poststed import Poststed
+from dogparser.utils import diff_records, write_records, DELTA_CHANGES
+from ._all import discover_tables
+
+# The model and key column of each table that can be diffed
+DIFF_TABLES = {
+    'HUNDER': (Hund, 'reg_nr'),
+    'EIERE': (Eier, 'reg_nr'),
+    'OPPDRETTERE': (Oppdretter, 'kennel'),
+    'KULL': (Kull, 'kullnr'),
+    'POSTSTEDER': (Poststed, 'postnr'),
+}
+
+def diff_exports(old_folder: str, new_folder: str, destination_folder: str, output_format: str = 'json') -> Dict[str, dict]:
+    """Writes the records that changed between two Hunder export directories, for every table in DIFF_TABLES
+
+    Each table found in both exports gets a <table>_delta output in its own folder of the destination
+    directory, holding the inserted, updated and deleted records with their change, see diff_records.
+    Returns the number of each change by table name.
+    """
+
+    old_tables = dict(discover_tables(old_folder))
+    new_tables = dict(discover_tables(new_folder))
+    tables = [table for table in DIFF_TABLES if table in old_tables and table in new_tables]
+    if not tables:
+        raise FileNotFoundError(f'No tables to diff were found in both {old_folder} and {new_folder}')
+
+    summary = {}
+    for table in tables:
+        element_type, key = DIFF_TABLES[table]
+        changes = Counter()
+
+        def counted(deltas):
+            for delta in deltas:
+                changes[delta.change] += 1
+                yield delta
+
+        deltas = diff_records(element_type, old_tables[table] + '.DBM', new_tables[table] + '.DBM', key)
+        write_records(counted(deltas), os.path.join(destination_folder, table), f'{table.lower()}_delta', output_format)
+
+        summary[table] = {change: changes[change] for change in DELTA_CHANGES}
+        print(f'{table}: {summary[table]["inserted"]} inserted, {summary[table]["updated"]} updated, {summary[table]["deleted"]} deleted')
+
+    return summary
\ No newline at end of file
@@ -1,82 +1,111 @@
 import argparse
+import json
 import os
-from dogparser.parsers import hund, eier, innavl, oppdretter, tyskull, utstillingsamleres, poststed, siegervinner, kull, hdstat, utststat, kaaringer, nv, utststattotal, kaaringsbeskrivelse, sykdom, hdstatfarmorfar
+import sys
+from dogparser.parsers import generic
+from contextlib import contextmanager, nullcontext
+from dogparser.utils import OUTPUT_FORMATS, ON_ERROR, MetricsExporter, collecting, configure_logging, profiling, quarantining, reporting, write_anomalies
+from ._all import parse_all
+from ._diff import diff_exports
+from ._tables import TABLES, parse_table
 
 
+@contextmanager
+def _monitoring(table: str, args: argparse.Namespace, table_folder: str = None):
+    """Reports the progress, the anomalies and the profile of a run as asked for on the command line
+
+    With --on-error quarantine the records that fail to decode are quarantined in the DATA folder of the table.
+    """
+
+    metrics = {}
+    profiler = nullcontext() if args.profile is None else profiling(args.profile or None)
+    quarantine = nullcontext() if args.on_error != 'quarantine' or table_folder is None else quarantining(os.path.join(table_folder, 'DATA'), table)
+    with MetricsExporter(metrics, args.metrics_file, args.metrics_port, args.progress), reporting(table, args.progress, metrics), \
+            collecting(table, args.anomalies), quarantine, profiler:
+        yield
+
 def parse():
     argument_parser = argparse.ArgumentParser(description='CLI interface for parsing DataEase files')
-    argument_parser.add_argument('TABLE', help='The dataease table to parse, defines the logic')
-    argument_parser.add_argument('SOURCE_FILE', help='The dataease file to parse')
-    argument_parser.add_argument('DESTINATION_FOLDER', help='The destination directory')
+    argument_parser.add_argument('TABLE', help='The dataease table to parse, defines the logic, or all to parse every table of an export directory, or diff to compare two export directories')
+    argument_parser.add_argument('SOURCE_FILE', help='The dataease file to parse, or the export directory when parsing all tables, or the old export directory with diff')
+    argument_parser.add_argument('DESTINATION_FOLDER', help='The destination directory, or the new export directory with diff')
+    argument_parser.add_argument('DELTA_FOLDER', nargs='?', default=None, help='With diff, the destination directory of the changed records')
+    argument_parser.add_argument('--format', default='json', choices=OUTPUT_FORMATS,
+                                 help='The output format, jsonl streams one record per line instead of buffering the table')
+    argument_parser.add_argument('--workers', default=1, type=int,
+                                 help='The number of processes decoding chunks of the source file in parallel, or tables in parallel when parsing all')
+    argument_parser.add_argument('--layout', default=None,
+                                 help='A layout definition JSON file, decodes a table that has no parser of its own')
+    argument_parser.add_argument('--checkpoint', default=100000, type=int,
+                                 help='The number of records between checkpoints of the output, 0 disables them')
+    argument_parser.add_argument('--resume', action='store_true',
+                                 help='Continue an interrupted parse from the last checkpoint of its output')
+    argument_parser.add_argument('--profile', nargs='?', const='', default=None, metavar='REPORT_FILE',
+                                 help='Print the time spent reading, decoding, converting and writing, and write it to a JSON report file if given')
+    argument_parser.add_argument('--progress', default=10.0, type=float,
+                                 help='The seconds between progress lines with the records/s, MB/s and ETA of the table, 0 disables them')
+    argument_parser.add_argument('--metrics-file', default=None,
+                                 help='A file the progress metrics are written to in the Prometheus text format, e.g. for the node exporter textfile collector')
+    argument_parser.add_argument('--metrics-port', default=None, type=int,
+                                 help='Serve the progress metrics in the Prometheus text format at http://localhost:PORT/metrics while parsing')
+    argument_parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                                 help='The least severe messages that are printed, DEBUG includes the schema details and every anomaly')
+    argument_parser.add_argument('--quiet', action='store_true',
+                                 help='Only print warnings, e.g. the summaries of the anomalies, and errors, and no progress lines')
+    argument_parser.add_argument('--on-error', default='raise', choices=ON_ERROR,
+                                 help='With quarantine a record that fails to decode is written raw to a quarantine file next to the output and the parse continues')
+    argument_parser.add_argument('--anomalies', default=None,
+                                 help='A JSON file the anomalies met decoding are written to, with their counts and first values by column')
 
     args = argument_parser.parse_args()
+    if args.quiet:
+        args.log_level, args.progress = 'WARNING', 0
+    configure_logging(args.log_level)
+
+    if args.TABLE == 'all':
+        if not os.path.isdir(args.SOURCE_FILE):
+            raise FileNotFoundError(f'The source folder, {args.SOURCE_FILE}, must be a valid directory.')
+
+        summary = parse_all(args.SOURCE_FILE, args.DESTINATION_FOLDER, args.format, args.workers, args.checkpoint, args.resume, args.profile is not None,
+                            args.progress, args.metrics_file, args.metrics_port, args.log_level, args.on_error)
+        if args.profile:
+            with open(args.profile, 'w', encoding='utf8') as f:
+                json.dump({table: result['profile'] for table, result in summary.items()}, f, indent=2)
+        if args.anomalies is not None:
+            write_anomalies({table: result['anomalies'] for table, result in summary.items()}, args.anomalies)
+        failed = [table for table, result in summary.items() if result['error']]
+        if failed:
+            sys.exit(f'{len(failed)} tables failed: {", ".join(failed)}')
+        return
+
+    if args.TABLE == 'diff':
+        for folder in (args.SOURCE_FILE, args.DESTINATION_FOLDER):
+            if not os.path.isdir(folder):
+                raise FileNotFoundError(f'The export folder, {folder}, must be a valid directory.')
+        if args.DELTA_FOLDER is None:
+            raise AssertionError('diff requires a destination directory for the changed records')
+
+        with _monitoring(args.TABLE, args):
+            diff_exports(args.SOURCE_FILE, args.DESTINATION_FOLDER, args.DELTA_FOLDER, args.format)
+        return
+
+    if args.layout is not None:
+        if not os.path.exists(args.SOURCE_FILE+'.DBM'):
+            raise FileNotFoundError(f'The source file, {args.SOURCE_FILE}, must be a valid file.')
+
+        os.makedirs(os.path.join(args.DESTINATION_FOLDER, args.TABLE), exist_ok=True)
+        with _monitoring(args.TABLE, args, os.path.join(args.DESTINATION_FOLDER, args.TABLE)):
+            generic.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE), args.layout, args.format, args.workers, args.checkpoint, args.resume)
+        return
 
     # Validate the inputs
-    if args.TABLE not in [
-        'HUNDER', 'EIERE', 'INNAVL',
-        'OPPDRETTERE', 'TYSKULL', 'UTSTILLINGSAMLERES',
-        'POSTSTEDER', 'SIEGERVINNER', 'KULL',
-        'HDSTAT', 'SIEGERVINNER2', 'UTSTSTAT',
-        'KÅRINGER', 'NV', 'UTSTSTATTOTAL',
-        'KÅRINGSBESKRIVELSER', 'SYKDOMMER', 'HDSTATFARMORFAR',
-        'HDSTATMORFARFAR']:
+    if args.TABLE not in TABLES:
         raise AssertionError(f'Table {args.TABLE} is not valid')
 
     if not os.path.exists(args.SOURCE_FILE+'.DBM'):
         raise FileNotFoundError(f'The source file, {args.SOURCE_FILE}, must be a valid file.')
-    
-    # Create the target folders
-    os.makedirs(os.path.join(args.DESTINATION_FOLDER, args.TABLE), exist_ok=True)
-
-    if args.TABLE == 'HUNDER':
-        hund.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'EIERE':
-        eier.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'INNAVL':
-        innavl.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'OPPDRETTERE':
-        oppdretter.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'TYSKULL':
-        tyskull.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'UTSTILLINGSAMLERES':
-        utstillingsamleres.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'POSTSTEDER':
-        poststed.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'SIEGERVINNER' or args.TABLE == 'SIEGERVINNER2':
-        siegervinner.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'KULL':
-        kull.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'HDSTAT':
-        hdstat.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'UTSTSTAT':
-        utststat.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'KÅRINGER':
-        kaaringer.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'NV':
-        nv.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'UTSTSTATTOTAL':
-        utststattotal.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'KÅRINGSBESKRIVELSER':
-        kaaringsbeskrivelse.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
-
-    elif args.TABLE == 'SYKDOMMER':
-        sykdom.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
 
-    elif args.TABLE == 'HDSTATFARMORFAR' or args.TABLE == 'HDSTATMORFARFAR':
-        hdstatfarmorfar.parse(args.SOURCE_FILE, os.path.join(args.DESTINATION_FOLDER, args.TABLE))
+    with _monitoring(args.TABLE, args, os.path.join(args.DESTINATION_FOLDER, args.TABLE)):
+        parse_table(args.TABLE, args.SOURCE_FILE, args.DESTINATION_FOLDER, args.format, args.workers, args.checkpoint, args.resume)
 
-    print('Hello World')
\ No newline at end of file
+    print('Hello World')
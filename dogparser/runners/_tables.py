@@ -0,0 +1,59 @@
+import os
+from dogparser.parsers import hund, eier, innavl, oppdretter, tyskull, utstillingsamleres, poststed, siegervinner, kull, hdstat, utststat, kaaringer, nv, utststattotal, kaaringsbeskrivelse, sykdom, hdstatfarmorfar
+
+# The parser for each of the dataease tables
+TABLES = {
+    'HUNDER': hund,
+    'EIERE': eier,
+    'INNAVL': innavl,
+    'OPPDRETTERE': oppdretter,
+    'TYSKULL': tyskull,
+    'UTSTILLINGSAMLERES': utstillingsamleres,
+    'POSTSTEDER': poststed,
+    'SIEGERVINNER': siegervinner,
+    'SIEGERVINNER2': siegervinner,
+    'KULL': kull,
+    'HDSTAT': hdstat,
+    'UTSTSTAT': utststat,
+    'KÅRINGER': kaaringer,
+    'NV': nv,
+    'UTSTSTATTOTAL': utststattotal,
+    'KÅRINGSBESKRIVELSER': kaaringsbeskrivelse,
+    'SYKDOMMER': sykdom,
+    'HDSTATFARMORFAR': hdstatfarmorfar,
+    'HDSTATMORFARFAR': hdstatfarmorfar,
+}
+
+# The file name of each table in a Hunder export directory (DEASE453/Hunder)
+EXPORT_FILES = {
+    'HUNDHAAE': 'HUNDER',
+    'EIERHAAA': 'EIERE',
+    'INNAHAAA': 'INNAVL',
+    'OPPDHAAA': 'OPPDRETTERE',
+    'TYSKHAAA': 'TYSKULL',
+    'UTSTHAAD': 'UTSTILLINGSAMLERES',
+    'POSTHAAA': 'POSTSTEDER',
+    'SIEGHAAA': 'SIEGERVINNER',
+    'SIEGHAAB': 'SIEGERVINNER2',
+    'KULLHAAE': 'KULL',
+    'HDSTHAAE': 'HDSTAT',
+    'UTSTHAAB': 'UTSTSTAT',
+    'KRINHAAB': 'KÅRINGER',
+    'NVAAHAAA': 'NV',
+    'UTSTHAAE': 'UTSTSTATTOTAL',
+    'KRINHAAA': 'KÅRINGSBESKRIVELSER',
+    'SYKDHAAA': 'SYKDOMMER',
+    'HDSTHAAA': 'HDSTATFARMORFAR',
+    'HDSTHAAB': 'HDSTATMORFARFAR',
+}
+
+def parse_table(table: str, source_file: str, destination_folder: str, output_format: str = 'json', workers: int = 1, checkpoint_len: int = 0, resume: bool = False) -> int:
+    """Parses a single table into its own folder in the destination directory, returns the number of records
+
+    With resume a table interrupted after a checkpoint continues where it stopped, see write_records.
+    """
+
+    # Create the target folders
+    os.makedirs(os.path.join(destination_folder, table), exist_ok=True)
+
+    return TABLES[table].parse(source_file, os.path.join(destination_folder, table), output_format, workers, checkpoint_len, resume)
@@ -1,2 +1,18 @@
-from ._conversion import graceful_conversion, date_conversion
-from ._extraction import extract_enum, extract_values, extract_decimal
\ No newline at end of file
+from ._conversion import graceful_conversion, date_conversion, parse_date, date_cache_info, clear_date_cache, ParsedDate
+from ._extraction import extract_enum, extract_values, extract_decimal
+from ._layout import RecordLayout
+from ._lazy import LazyRecord
+from ._records import RecordReader, read_records, decode_records
+from ._output import write_records, OUTPUT_FORMATS
+from ._columns import layout_dtype, read_columns, numeric_column, decode_column
+from ._schema import load_schema, write_enums, schema_cache_folder
+from ._decoder import compile_decoder, GenericRecord, LayoutDecoder, load_layout, write_layout
+from ._index import RecordIndex
+from ._checkpoint import read_checkpoint
+from ._files import atomic_write
+from ._diff import diff_records, DeltaRecord, DELTA_CHANGES
+from ._profile import StageProfiler, profiling, active_profiler
+from ._diagnostics import Diagnostics, anomaly, collecting, ignoring_anomalies, active_diagnostics, write_anomalies, configure_logging, logger
+from ._progress import ProgressReporter, MetricsExporter, render_metrics, reporting, active_reporter
+from ._quarantine import Quarantine, quarantining, active_quarantine, ON_ERROR
+from ._columnar import write_columnar, COLUMNAR_FORMATS, DICTIONARY_COLUMNS
\ No newline at end of file
@@ -0,0 +1,51 @@
+import json
+import os
+from typing import Union
+
+from ._files import atomic_write
+
+# Bumped when the layout of the checkpoint changes
+CHECKPOINT_VERSION = 1
+
+def checkpoint_file(data_file: str) -> str:
+    """Path of the checkpoint kept next to an output file while it is written"""
+
+    return data_file + '.checkpoint'
+
+def load_checkpoint(data_file: str) -> Union[dict, None]:
+    """The last checkpoint of an output file, with the number of records and the byte offset they end at
+
+    Returns None when the file has no checkpoint, i.e. it was never started or it was completed.
+    """
+
+    try:
+        with open(checkpoint_file(data_file), 'r', encoding='utf8') as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return None
+
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise AssertionError(f'The checkpoint of {data_file} was written by another version, it can not be resumed')
+    if not os.path.exists(data_file) or os.path.getsize(data_file) < checkpoint['offset']:
+        raise AssertionError(f'The checkpoint of {data_file} is ahead of the file, it can not be resumed')
+
+    return checkpoint
+
+def save_checkpoint(data_file: str, records: int, offset: int) -> None:
+    """Records that the first records of the output file end at offset, the file must be flushed first"""
+
+    # A crash never leaves a partial checkpoint
+    with atomic_write(checkpoint_file(data_file)) as f:
+        json.dump({'version': CHECKPOINT_VERSION, 'records': records, 'offset': offset}, f)
+
+def remove_checkpoint(data_file: str) -> None:
+    try:
+        os.remove(checkpoint_file(data_file))
+    except FileNotFoundError:
+        pass
+
+def read_checkpoint(destination_folder: str, name: str, output_format: str) -> int:
+    """Number of records of the table already written by an interrupted run, 0 when there is nothing to resume"""
+
+    checkpoint = load_checkpoint(os.path.join(destination_folder, f'DATA/{name}.{output_format}'))
+    return 0 if checkpoint is None else checkpoint['records']
\ No newline at end of file
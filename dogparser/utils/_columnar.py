@@ -0,0 +1,139 @@
+from datetime import date
+from itertools import islice
+from typing import Callable, Dict, Iterable, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError: # pyarrow is optional, only the columnar outputs need it
+    pa = None
+
+from ._layout import RecordLayout
+
+# Output formats written column by column with pyarrow
+COLUMNAR_FORMATS = ['parquet', 'arrow']
+
+# String columns with few distinct values, dictionary encoded in the columnar outputs
+DICTIONARY_COLUMNS = ['kennel', 'farge', 'far', 'mor']
+
+# Records per row group (parquet) or record batch (arrow)
+ROW_GROUP_LEN = 65536
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError('The parquet and arrow outputs require pyarrow, install it with pip install dogparser[arrow]')
+
+def _column_type(name: str, layout: Union[RecordLayout, None], column_names: Dict[str, str], values: list) -> 'pa.DataType':
+    """Arrow type of a native column, from its layout column or else from its values"""
+
+    if name in DICTIONARY_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+
+    conversions = {} if layout is None else layout.conversions
+    name = column_names.get(name, name)
+    if name in conversions:
+        field_format = dict(layout.fields)[name]
+        conversion = conversions[name]
+        if conversion in ('date', 'date_strict'):
+            return pa.date32()
+        elif conversion == 'decimal':
+            return pa.float32()
+        elif field_format == 'B':
+            return pa.uint8() # Enum ids and 1 byte integers, 128 is None for null columns
+        elif field_format == 'H':
+            return pa.uint16()
+        return pa.string()
+    elif name.endswith('_raw') and name[:-4] in conversions:
+        return pa.string()
+
+    # Attributes that are not named after their column, typed from the first value like the sqlite output
+    value = next((value for value in values if value is not None), None)
+    if isinstance(value, bool):
+        return pa.bool_()
+    elif isinstance(value, int):
+        return pa.int64()
+    elif isinstance(value, float):
+        return pa.float64()
+    return pa.string()
+
+def _column_converter(column_type: 'pa.DataType') -> Union[Callable, None]:
+    # The natives give dates in ISO format and decimals as strings
+    if column_type == pa.date32():
+        return date.fromisoformat
+    elif column_type == pa.float32():
+        return float
+    return None
+
+class _Dictionary:
+    """Dictionary of a dictionary encoded column, shared by the row groups so later ones only add values"""
+
+    __slots__ = ('codes', 'values')
+
+    def __init__(self) -> None:
+        self.codes = {}
+        self.values = []
+
+    def encode(self, values: list) -> 'pa.DictionaryArray':
+        codes = self.codes
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(None)
+                continue
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self.values)
+                self.values.append(value)
+            indices.append(code)
+        return pa.DictionaryArray.from_arrays(pa.array(indices, pa.int32()), pa.array(self.values, pa.string()))
+
+def write_columnar(natives: Iterable[dict], data_file: str, output_format: str, layout: RecordLayout = None, column_names: Dict[str, str] = None,
+                   row_group_len: int = ROW_GROUP_LEN) -> int:
+    """Streams the native form of the records into a parquet or arrow IPC file, a row group at a time
+
+    The columns are typed from the layout of the records where it has a column of the same name, or of the
+    name given in column_names (see the _column_names of the models): enum ids and 1 byte integers as uint8,
+    2 byte integers as uint16, dates as date32 and decimals as float32. The strings in DICTIONARY_COLUMNS are
+    dictionary encoded, the other columns are typed from the first row group.
+    Only a row group is held in memory at a time. Returns the number of records written.
+    """
+
+    _require_pyarrow()
+
+    natives = iter(natives)
+    batch = list(islice(natives, row_group_len))
+    columns = list(batch[0]) if batch else []
+    values = {column: [native[column] for native in batch] for column in columns}
+    schema = pa.schema([(column, _column_type(column, layout, column_names or {}, values[column])) for column in columns])
+    converters = {field.name: _column_converter(field.type) for field in schema}
+    dictionaries = {field.name: _Dictionary() for field in schema if pa.types.is_dictionary(field.type)}
+
+    if output_format == 'parquet':
+        writer = pa.parquet.ParquetWriter(data_file, schema)
+    elif output_format == 'arrow':
+        # The dictionaries grow with every batch, the file holds the new values as deltas
+        writer = pa.ipc.new_file(data_file, schema, options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+    else:
+        raise AssertionError(f'Output format {output_format} is not columnar')
+
+    count = 0
+    with writer:
+        while batch:
+            arrays = []
+            for field in schema:
+                column = values[field.name]
+                convert = converters[field.name]
+                if convert is not None:
+                    column = [None if value is None else convert(value) for value in column]
+                if field.name in dictionaries:
+                    arrays.append(dictionaries[field.name].encode(column))
+                else:
+                    arrays.append(pa.array(column, field.type))
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            count += len(batch)
+
+            batch = list(islice(natives, row_group_len))
+            values = {column: [native[column] for native in batch] for column in columns}
+
+    return count
\ No newline at end of file
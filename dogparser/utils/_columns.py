@@ -0,0 +1,84 @@
+import os
+from typing import Callable, List, Union
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional, only the columnar reader needs it
+    np = None
+
+from ._conversion import graceful_conversion
+from ._layout import RecordLayout, _NULL_VALUES
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('The columnar reader requires numpy, install it with pip install dogparser[numpy]')
+
+def layout_dtype(layout: RecordLayout) -> 'np.dtype':
+    """Structured numpy dtype matching a record layout, header and unused bytes are left out of the columns"""
+
+    _require_numpy()
+
+    formats = []
+    for _, field_format in layout.fields:
+        if field_format == 'B':
+            formats.append('u1')
+        elif field_format == 'H':
+            formats.append('<u2')
+        elif field_format.endswith('s'):
+            # Raw bytes, unlike 'S' this keeps trailing NULL bytes which decimals depend on
+            formats.append(f'V{field_format[:-1]}')
+        else:
+            raise AssertionError(f'Column format {field_format} has no numpy equivalent')
+
+    return np.dtype({
+        'names': layout.names,
+        'formats': formats,
+        'offsets': layout.offsets,
+        'itemsize': layout.record_len,
+    })
+
+def read_columns(layout: RecordLayout, data_file: str) -> 'np.ndarray':
+    """Maps a DataEase .DBM file as a numpy structured array with one field per column
+
+    Nothing is decoded up front, integer and enum columns can be used in bulk directly (see numeric_column)
+    while string columns are only converted when requested with decode_column. The array is backed by the
+    mapped file, a trailing partial record is ignored.
+    """
+
+    _require_numpy()
+
+    dtype = layout_dtype(layout)
+    count = os.path.getsize(data_file) // layout.record_len
+    if not count:
+        # Empty files can not be mapped
+        return np.empty(0, dtype=dtype)
+
+    return np.memmap(data_file, dtype=dtype, mode='r', shape=(count,))
+
+def numeric_column(layout: RecordLayout, columns: 'np.ndarray', name: str) -> 'np.ma.MaskedArray':
+    """Integer or enum column as a masked array, the DataEase null values are masked in the null columns of the layout
+
+    Enum ids and counters are not nullable, 128 or 32768 are valid values there and nothing is masked.
+    """
+
+    _require_numpy()
+
+    column = columns[name]
+    if column.dtype.kind != 'u':
+        raise AssertionError(f'Column {name} is not numeric')
+
+    if layout.conversions.get(name) != 'null':
+        return np.ma.masked_array(column)
+    return np.ma.masked_equal(column, _NULL_VALUES[column.dtype.itemsize])
+
+def decode_column(columns: 'np.ndarray', name: str, conversion: Callable[[bytes], object] = graceful_conversion) -> List[Union[str, object]]:
+    """Decodes a single bytes column of the structured array, by default into strings"""
+
+    column = columns[name]
+    if column.dtype.kind != 'V':
+        raise AssertionError(f'Column {name} is not a bytes column')
+
+    # One copy of the whole column, sliced per record
+    width = column.dtype.itemsize
+    raw = column.tobytes()
+    return [conversion(raw[offset:offset + width]) for offset in range(0, len(raw), width)]
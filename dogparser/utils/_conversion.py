@@ -1,8 +1,34 @@
-from typing import Union
+import codecs
+import re
+from functools import lru_cache
+from typing import NamedTuple, Union
 from datetime import date
 
+# Characters outside ASCII that DataEase stores as single bytes, mapped straight to the final character.
+# The examples for each byte are listed in sure_conversion and base_conversions.
+DATAEASE_CHARACTERS = {
+    0x81: 'ü', 0x82: 'é', 0x84: 'ä', 0x85: 'à', 0x86: 'å', 0x8a: 'è', 0x8e: 'Ä', 0x8f: 'Å',
+    0x90: 'É', 0x91: 'æ', 0x92: 'Æ', 0x94: 'ö', 0x99: 'Ö', 0x9a: 'Ü', 0x9b: 'ø', 0x9d: 'Ø',
+    0xa1: 'í', 0xa5: 'Ñ', 0xb5: 'Á', 0xb7: 'À', 0xd4: 'È', 0xe1: 'Β', 0xe4: 'õ',
+    0xf9: 'Å', # Typo Å, x8f collision
+}
+
+# 256 entry decoding table, bytes that are not listed are undefined ('\ufffe') and fail the single pass decode
+_DECODING_TABLE = ''.join(chr(i) if i < 0x80 else DATAEASE_CHARACTERS.get(i, '\ufffe') for i in range(256))
+
+# Input that the chained replacements would treat differently from the table, a literal '?x' or an 'x' that
+# follows a converted byte could form a placeholder together with the neighbouring characters
+_PLACEHOLDER_LIKE = re.compile(b'[?\x80-\xff]x')
+
 def graceful_conversion(input_element: bytes) -> str:
     data_out = input_element.rstrip(b'\x00')
+    if not _PLACEHOLDER_LIKE.search(data_out):
+        try:
+            return codecs.charmap_decode(data_out, 'strict', _DECODING_TABLE)[0]
+        except UnicodeDecodeError:
+            pass
+
+    # Fall back on the chained conversions for the rare bytes without a single character (\x93, \x96, \xfe and \xff)
     out_str = base_conversions(data_out).decode('utf8')
     out_str = sure_conversion(out_str)
     return out_str
@@ -71,22 +97,63 @@ def base_conversions(input_element: bytes) -> bytes:
     
     return data_out
 
-def date_conversion(data: bytes) -> Union[date, None]:
+class ParsedDate(NamedTuple):
+    date: Union[date, None] # The date, None if the field is empty or invalid
+    iso: Union[str, None] # The date in ISO format
+    raw: str # The decoded 6 digit string
+    error: Union[Exception, None] # Why the date is invalid, None for valid and empty fields
+
+# Large enough for every date in a century and then some, the cache stops growing once it is full
+DATE_CACHE_SIZE = 65536
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(data: bytes) -> ParsedDate:
     datestr = graceful_conversion(data)
     if len(datestr) != 6:
-        return None
-    else:
-        try:
-            year = int(datestr[-2:])
-            if year > 25:
-                year += 1900
-            else:
-                year += 2000
-
-            month = int(datestr[2:-2])
-            day = int(datestr[0:2])
-
-            return date(day=day, month=month, year=year)
-        except Exception as e:
-            print(datestr, data)
-            raise e
+        return ParsedDate(None, None, datestr, None)
+
+    try:
+        year = int(datestr[-2:])
+        if year > 25:
+            year += 1900
+        else:
+            year += 2000
+
+        month = int(datestr[2:-2])
+        day = int(datestr[0:2])
+
+        value = date(day=day, month=month, year=year)
+    except Exception as e:
+        # Cached without its traceback, which would keep the frames of the failed parse alive
+        return ParsedDate(None, None, datestr, e.with_traceback(None))
+
+    return ParsedDate(value, value.isoformat(), datestr, None)
+
+def parse_date(data: Union[bytes, memoryview]) -> ParsedDate:
+    """Decodes a 6 digit DDMMYY date field, cached on its raw bytes since the same dates repeat across records"""
+
+    return _parse_date(bytes(data))
+
+def date_cache_info() -> dict:
+    """Hit rate of the date cache in this process"""
+
+    info = _parse_date.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': info.hits / lookups if lookups else 0.0,
+        'size': info.currsize,
+        'max_size': info.maxsize,
+    }
+
+def clear_date_cache() -> None:
+    _parse_date.cache_clear()
+
+def date_conversion(data: bytes) -> Union[date, None]:
+    parsed = parse_date(data)
+    if parsed.error is not None:
+        # A fresh exception, raising the cached one again would chain every traceback onto it
+        raise type(parsed.error)(*parsed.error.args)
+
+    return parsed.date
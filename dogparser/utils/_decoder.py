@@ -0,0 +1,108 @@
+import json
+from typing import Callable, Union
+
+from ._conversion import graceful_conversion, date_conversion, parse_date
+from ._diagnostics import anomaly
+from ._extraction import extract_decimal
+from ._layout import RecordLayout, _NULL_VALUES
+
+def compile_decoder(layout: RecordLayout) -> Callable[[Union[bytes, memoryview]], dict]:
+    """Generates a function decoding a full record of the layout into a dict of native values
+
+    The function is generated as source and compiled, so a record is decoded with the same single unpack call
+    and inline conversions as a hand written from_bytes. Dates are given in ISO format, with the raw string of
+    date columns next to them as <name>_raw like in the native form of the models.
+    """
+
+    values = [f'v{i}' for i in range(len(layout.fields))]
+    lines = ['def decode(content):', f'    ({", ".join(values)},) = unpack(content)']
+    items = []
+    for i, (name, field_format) in enumerate(layout.fields):
+        conversion = layout.conversions[name]
+        value = values[i]
+        if conversion == 'str':
+            lines.append(f'    {value} = graceful_conversion({value})')
+        elif conversion == 'null':
+            lines.append(f'    {value} = None if {value} == {_NULL_VALUES[1 if field_format == "B" else 2]} else {value}')
+        elif conversion == 'decimal':
+            lines.append(f'    {value} = extract_decimal({value})')
+        elif conversion in ('date', 'date_strict'):
+            lines.append(f'    d{i} = parse_date({value})')
+            lines.append(f'    if d{i}.error is not None:')
+            if conversion == 'date':
+                lines.append(f'        anomaly("invalid date", {name!r}, d{i}.raw)')
+            else:
+                lines.append(f'        date_conversion({value}) # Raises the error of the invalid date')
+            items.append((name, f'd{i}.iso'))
+            if conversion == 'date':
+                items.append((f'{name}_raw', f'd{i}.raw'))
+            continue
+        items.append((name, value))
+    lines.append('    return {' + ', '.join(f'{name!r}: {expression}' for name, expression in items) + '}')
+
+    namespace = {
+        'unpack': layout.unpack,
+        'graceful_conversion': graceful_conversion,
+        'date_conversion': date_conversion,
+        'parse_date': parse_date,
+        'anomaly': anomaly,
+        'extract_decimal': extract_decimal,
+    }
+    exec(compile('\n'.join(lines), f'<decoder of {layout.record_len} byte records>', 'exec'), namespace)
+    return namespace['decode']
+
+class GenericRecord:
+    """Record decoded by a LayoutDecoder, holding its native values"""
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: dict) -> None:
+        self._values = values
+
+    @property
+    def native(self) -> dict:
+        """Method converts class instance to native python classes for serialization purposes"""
+
+        return self._values
+
+class LayoutDecoder:
+    """Decodes the records of a table straight from its layout, for tables without a hand written model
+
+    Used in place of a model class, e.g. decode_records(LayoutDecoder(layout), data_file, layout.record_len).
+    """
+
+    _layout: RecordLayout
+    _decode: Callable[[Union[bytes, memoryview]], dict]
+
+    def __init__(self, layout: RecordLayout) -> None:
+        self._layout = layout
+        self._decode = compile_decoder(layout)
+
+    def __reduce__(self):
+        # The generated function can not be pickled, worker processes compile it again
+        return (LayoutDecoder, (self._layout,))
+
+    @property
+    def layout(self) -> RecordLayout:
+        return self._layout
+
+    def from_bytes(self, content: Union[bytes, memoryview]) -> GenericRecord:
+        if len(content) != self._layout.record_len:
+            raise AssertionError(f'Input should be {self._layout.record_len} bytes')
+
+        return GenericRecord(self._decode(content))
+
+def load_layout(layout_file: str) -> RecordLayout:
+    """Loads a layout from a layout definition JSON file"""
+
+    with open(layout_file, 'r', encoding='utf8') as f:
+        return RecordLayout.from_definition(json.load(f))
+
+def write_layout(layout: RecordLayout, layout_file: str) -> None:
+    """Writes the definition of a layout to a JSON file, e.g. as a starting point for a changed table"""
+
+    definition = layout.definition
+    # One column per line, which keeps the file readable and easy to edit
+    fields = ',\n'.join(f'    {json.dumps(field, ensure_ascii=False)}' for field in definition['fields'])
+    with open(layout_file, 'w', encoding='utf8') as f:
+        f.write(f'{{\n  "record_len": {definition["record_len"]},\n  "header_len": {definition["header_len"]},\n  "fields": [\n{fields}\n  ]\n}}\n')
@@ -0,0 +1,129 @@
+import json
+import logging
+import os
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Union
+
+# The logger of the package, silent below WARNING until the application configures logging
+logger = logging.getLogger('dogparser')
+
+# Values kept of each kind of anomaly, the rest are only counted
+SAMPLE_LEN = 5
+
+class Diagnostics:
+    """Counts the anomalies met while decoding, e.g. invalid dates, by kind and column
+
+    Only the first SAMPLE_LEN values of each kind and column are kept, so a dirty export costs a counter
+    increment per anomaly instead of a line of console output.
+    """
+
+    _counts: Dict[Tuple[str, str], int] # Anomalies by kind and column
+    _samples: Dict[Tuple[str, str], List[str]] # The first values of each kind and column
+
+    def __init__(self) -> None:
+        self._counts = {}
+        self._samples = {}
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def anomaly(self, kind: str, column: str, value) -> None:
+        key = (kind, column)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count < SAMPLE_LEN:
+            self._samples.setdefault(key, []).append(str(value))
+
+    def merge(self, state: list) -> None:
+        """Adds the anomalies of another collector, given as its state, e.g. from a worker process"""
+
+        for kind, column, count, samples in state:
+            key = (kind, column)
+            self._counts[key] = self._counts.get(key, 0) + count
+            kept = self._samples.setdefault(key, [])
+            kept.extend(samples[:SAMPLE_LEN - len(kept)])
+
+    def state(self) -> list:
+        return [(kind, column, count, self._samples.get((kind, column), [])) for (kind, column), count in self._counts.items()]
+
+    def report(self) -> List[dict]:
+        return [
+            {'kind': kind, 'column': column, 'count': count, 'samples': samples}
+            for kind, column, count, samples in sorted(self.state(), key=lambda anomaly: -anomaly[2])
+        ]
+
+    def log_summary(self, table: str = None) -> None:
+        """Logs a warning per kind and column with the count and the first values"""
+
+        prefix = f'{table}: ' if table else ''
+        for anomaly in self.report():
+            samples = ', '.join(repr(sample) for sample in anomaly['samples'])
+            logger.warning(f'{prefix}{anomaly["count"]} {anomaly["kind"]} values in {anomaly["column"]}, first {len(anomaly["samples"])} samples {samples}')
+
+# The collector of the running parse, None unless the anomalies are collected
+_active: Union[Diagnostics, None] = None
+
+# Set while records that were already decoded are decoded again, their anomalies are already recorded
+_ignoring = False
+
+def active_diagnostics() -> Union[Diagnostics, None]:
+    return _active
+
+def anomaly(kind: str, column: str, value) -> None:
+    """Records an anomaly of a decoded value, only logged at debug level when no collector is active"""
+
+    if _ignoring:
+        return
+    if _active is not None:
+        _active.anomaly(kind, column, value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f'{kind} value in {column}: {value!r}')
+
+@contextmanager
+def collecting(table: str = None, report_file: str = None, summary: bool = True):
+    """Collects the anomalies met inside the block, see Diagnostics
+
+    At the end a summary is logged unless summary is False, and the anomalies are written to report_file as
+    JSON if given.
+    """
+
+    global _active
+    previous, _active = _active, Diagnostics()
+    diagnostics = _active
+    try:
+        yield diagnostics
+    finally:
+        _active = previous
+
+    if summary:
+        diagnostics.log_summary(table)
+    if report_file is not None:
+        write_anomalies({table or '': diagnostics.report()}, report_file)
+
+@contextmanager
+def ignoring_anomalies():
+    """Neither collects nor logs the anomalies met inside the block, e.g. when the profiler decodes a sample again"""
+
+    global _ignoring
+    previous, _ignoring = _ignoring, True
+    try:
+        yield
+    finally:
+        _ignoring = previous
+
+def write_anomalies(reports: Dict[str, List[dict]], report_file: str) -> None:
+    """Writes the anomaly reports of one or more tables to a JSON file"""
+
+    os.makedirs(os.path.dirname(os.path.abspath(report_file)), exist_ok=True)
+    with open(report_file, 'w', encoding='utf8') as f:
+        json.dump(reports, f, indent=2, ensure_ascii=False)
+
+def configure_logging(level: Union[int, str] = logging.INFO) -> None:
+    """Prints the log of the package to the console from level on, e.g. for the command line"""
+
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False # Printed once, even if the application also logs to the console
+    logger.setLevel(level)
\ No newline at end of file
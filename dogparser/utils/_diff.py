@@ -0,0 +1,68 @@
+import hashlib
+from typing import Dict, Iterator, Tuple
+
+from ._records import RecordReader
+
+# Changes a delta record can hold
+DELTA_CHANGES = ['inserted', 'updated', 'deleted']
+
+class DeltaRecord:
+    """A record that changed between two snapshots of a table, with the kind of change
+
+    Inserted and updated records hold the record of the new snapshot, deleted records the one of the old.
+    """
+
+    __slots__ = ('change', 'element')
+
+    def __init__(self, change: str, element) -> None:
+        self.change = change
+        self.element = element
+
+    @property
+    def native(self) -> dict:
+        """Method converts class instance to native python classes for serialization purposes"""
+
+        return {'change': self.change, **self.element.native}
+
+def _record_hashes(reader: RecordReader, key_decoder, header_len: int) -> Dict[Tuple[str, int], Tuple[bytes, int]]:
+    """Hash and record index of every record, by its key and the occurrence of that key"""
+
+    hashes = {}
+    occurrences = {}
+    for i in range(len(reader)):
+        record = reader[i]
+        key = key_decoder(record)
+        occurrence = occurrences[key] = occurrences.get(key, -1) + 1
+        # The header is left out, it does not hold any data
+        hashes[key, occurrence] = (hashlib.blake2b(record[header_len:], digest_size=16).digest(), i)
+    return hashes
+
+def diff_records(element_type: type, old_data_file: str, new_data_file: str, key: str) -> Iterator[DeltaRecord]:
+    """Generator yielding the records that were inserted, updated or deleted between two .DBM snapshots
+
+    The records are matched by the key column, which is the only column decoded for unchanged records. A key
+    that occurs more than once is matched by the order of its occurrences. Records are compared by a hash of
+    their raw bytes, only changed records are decoded by element_type.from_bytes. Inserted and updated records
+    are yielded in the order of the new snapshot, followed by the deleted records in the order of the old.
+    """
+
+    layout = element_type.layout
+    key_decoder = layout.column_decoder(key)
+
+    with RecordReader(old_data_file, layout.record_len) as old_reader, RecordReader(new_data_file, layout.record_len) as new_reader:
+        old_hashes = _record_hashes(old_reader, key_decoder, layout.header_len)
+
+        occurrences = {}
+        for i in range(len(new_reader)):
+            record = new_reader[i]
+            record_key = key_decoder(record)
+            occurrence = occurrences[record_key] = occurrences.get(record_key, -1) + 1
+
+            old = old_hashes.pop((record_key, occurrence), None)
+            if old is None:
+                yield DeltaRecord('inserted', element_type.from_bytes(record))
+            elif old[0] != hashlib.blake2b(record[layout.header_len:], digest_size=16).digest():
+                yield DeltaRecord('updated', element_type.from_bytes(record))
+
+        for _, old_index in sorted(old_hashes.values(), key=lambda old: old[1]):
+            yield DeltaRecord('deleted', element_type.from_bytes(old_reader[old_index]))
\ No newline at end of file
@@ -2,12 +2,13 @@ import struct
 from typing import List, Tuple, Union
 
 from ._conversion import graceful_conversion
+from ._diagnostics import logger
 
 def extract_enum(elements: List[bytes], query_term: bytes) -> Tuple[List[str], List[bytes]]:
     query_idx = elements.index(query_term)
     query_len = elements[query_idx+1][0]
     
-    print(f'{query_term} contains {query_len+1} entries including leading NULL')
+    logger.debug(f'{query_term} contains {query_len+1} entries including leading NULL')
 
     enum, return_elements = extract_values(elements, query_idx+1, query_len)
     enum = [''] + enum
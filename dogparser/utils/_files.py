@@ -0,0 +1,22 @@
+import os
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w'):
+    """Opens a temporary file next to path and moves it over path once the block completes
+
+    Readers, parallel runs and a crash therefore never see a partial file, only the previous or the new one.
+    The temporary file is removed if the block fails.
+    """
+
+    temporary_file = f'{path}.{os.getpid()}'
+    try:
+        with open(temporary_file, mode, encoding=None if 'b' in mode else 'utf8') as f:
+            yield f
+        os.replace(temporary_file, path)
+    except BaseException:
+        try:
+            os.remove(temporary_file)
+        except FileNotFoundError:
+            pass
+        raise
\ No newline at end of file
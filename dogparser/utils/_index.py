@@ -0,0 +1,145 @@
+import os
+import struct
+from typing import Dict, Union
+
+from ._diagnostics import logger
+from ._files import atomic_write
+from ._layout import RecordLayout
+from ._records import RecordReader
+
+# Index file header: magic, version, size and modification time of the indexed .DBM file, number of entries
+_HEADER = struct.Struct('<4sHQqI')
+_MAGIC = b'DPIX'
+_VERSION = 1
+# Entry: length of the UTF-8 key and the index of its record, followed by the key
+_ENTRY = struct.Struct('<HI')
+
+class RecordIndex:
+    """Persistent index from the values of a column to the records of a DataEase .DBM file
+
+    The index is built by decoding only the indexed column of every record, and is stored next to the .DBM
+    file (<data_file>.<column>.idx) unless another index file is given. It is rebuilt when the size or the
+    modification time of the .DBM file no longer match. Lookups go through a memory mapped reader that stays
+    open, so fetching a record decodes nothing but that record. When a value occurs more than once the first
+    record is indexed.
+    """
+
+    _data_file: str # Path to the .DBM file
+    _layout: RecordLayout # Layout of the records
+    _column: str # The indexed column
+    _index_file: str # Path to the persisted index
+    _positions: Dict[str, int] # Record index of each value
+    _reader: Union[RecordReader, None] # Reader over the .DBM file, opened on the first record lookup
+    _stat: tuple # Size and modification time of the .DBM file the index belongs to
+
+    def __init__(self, data_file: str, layout: RecordLayout, column: str = 'reg_nr', index_file: str = None) -> None:
+        self._data_file = data_file
+        self._layout = layout
+        self._column = column
+        self._index_file = index_file if index_file is not None else f'{data_file}.{column}.idx'
+        self._reader = None
+
+        stat = os.stat(data_file)
+        self._positions = self._load(stat)
+        if self._positions is None:
+            self._positions = self._build()
+            self._save(stat)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+    @property
+    def index_file(self) -> str:
+        return self._index_file
+
+    @property
+    def stale(self) -> bool:
+        """Whether the .DBM file changed since the index was loaded or built"""
+
+        stat = os.stat(self._data_file)
+        return (stat.st_size, stat.st_mtime_ns) != self._stat
+
+    def position(self, key: str) -> Union[int, None]:
+        """Index of the record holding the value, None if no record does"""
+
+        return self._positions.get(key)
+
+    def lookup(self, key: str, element_type: type):
+        """Decodes the record holding the value with element_type.from_bytes, None if no record does"""
+
+        position = self._positions.get(key)
+        if position is None:
+            return None
+
+        if self._reader is None:
+            self._reader = RecordReader(self._data_file, self._layout.record_len)
+        return element_type.from_bytes(self._reader[position])
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _build(self) -> Dict[str, int]:
+        decode = self._layout.column_decoder(self._column)
+        positions = {}
+        duplicates = 0
+        with RecordReader(self._data_file, self._layout.record_len) as reader:
+            for i in range(len(reader)):
+                key = decode(reader[i])
+                if key in positions:
+                    duplicates += 1
+                else:
+                    positions[key] = i
+
+        logger.info(f'Indexed {len(positions)} values of {self._column} in {self._data_file}, {duplicates} duplicates skipped')
+        return positions
+
+    def _load(self, stat: os.stat_result) -> Union[Dict[str, int], None]:
+        self._stat = (stat.st_size, stat.st_mtime_ns)
+        try:
+            with open(self._index_file, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, size, mtime, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or (size, mtime) != self._stat:
+            return None
+
+        positions = {}
+        offset = _HEADER.size
+        entry_size = _ENTRY.size
+        for _ in range(count):
+            key_len, position = _ENTRY.unpack_from(data, offset)
+            offset += entry_size
+            positions[data[offset:offset + key_len].decode('utf8')] = position
+            offset += key_len
+
+        return positions
+
+    def _save(self, stat: os.stat_result) -> None:
+        self._stat = (stat.st_size, stat.st_mtime_ns)
+        parts = [_HEADER.pack(_MAGIC, _VERSION, stat.st_size, stat.st_mtime_ns, len(self._positions))]
+        for key, position in self._positions.items():
+            encoded = key.encode('utf8')
+            parts.append(_ENTRY.pack(len(encoded), position))
+            parts.append(encoded)
+
+        try:
+            # A concurrent reader never sees a partial index
+            with atomic_write(self._index_file, 'wb') as f:
+                f.write(b''.join(parts))
+        except OSError as e:
+            logger.warning(f'Unable to save the index {self._index_file}, {e}')
@@ -0,0 +1,143 @@
+import struct
+from typing import Callable, Dict, List, Tuple, Union
+
+from ._conversion import graceful_conversion, date_conversion, parse_date
+from ._diagnostics import anomaly
+from ._extraction import extract_decimal
+
+# Conversions of the raw column values that the record models apply, given as the optional third element of a column
+# str: DataEase string, null: integer that uses 128/32768 as null, decimal: 4 byte float,
+# date: 6 digit date that is kept as a raw string as well, date_strict: 6 digit date that must be valid
+CONVERSIONS = ['str', 'null', 'decimal', 'date', 'date_strict']
+
+# Null sentinels DataEase uses for integer columns, by the size of the column in bytes
+_NULL_VALUES = {1: 128, 2: 32768}
+
+class RecordLayout:
+    """Precompiled layout of a fixed width DataEase record
+
+    The columns are given in record order as (name, struct format) pairs, e.g. ('reg_nr', '12s') for a
+    12 character string, ('kjonn_id', 'B') for a 1 byte enum or ('ant', 'H') for a 2 byte integer.
+    Unused bytes inside the record are given as (None, '1x'). The header and any unused trailing bytes are
+    skipped, so a whole record is unpacked in a single call. A column can name the conversion its raw value
+    needs as a third element, e.g. ('navn', '38s', 'str'), see CONVERSIONS.
+    """
+
+    _record_len: int # Length of a full record in bytes
+    _header_len: int # Length of the leading header that does not contain useful data
+    _fields: List[Tuple[str, str]] # Column names and their struct formats in record order, unused bytes excluded
+    _offsets: List[int] # Byte offset of each column within the record
+    _conversions: Dict[str, Union[str, None]] # Conversion of each column, None for values that are used as is
+    _columns: Dict[str, Tuple[struct.Struct, int]] # Compiled format and offset of each column for single column reads
+    _struct: struct.Struct # The compiled record format
+    _definition: dict # The arguments of the layout, for pickling and layout definition files
+
+    def __init__(self, record_len: int, header_len: int, fields: List[Tuple]) -> None:
+        # DataEase stores integers little endian without any alignment padding
+        record_format = f'<{header_len}x'
+        offsets = []
+        conversions = {}
+        columns = {}
+        for name, field_format, *conversion in fields:
+            if name is not None:
+                offset = struct.calcsize(record_format)
+                offsets.append(offset)
+                conversions[name] = conversion[0] if conversion else None
+                columns[name] = (struct.Struct(f'<{field_format}'), offset)
+                if conversions[name] is not None and conversions[name] not in CONVERSIONS:
+                    raise AssertionError(f'Column {name} has an unknown conversion {conversions[name]}')
+            record_format += field_format
+
+        used_len = struct.calcsize(record_format)
+        if used_len > record_len:
+            raise AssertionError(f'Layout uses {used_len} bytes, but the record is {record_len} bytes')
+        elif used_len < record_len:
+            record_format += f'{record_len - used_len}x'
+
+        self._definition = {
+            'record_len': record_len,
+            'header_len': header_len,
+            'fields': [list(field) for field in fields],
+        }
+        self._record_len = record_len
+        self._header_len = header_len
+        self._fields = [(field[0], field[1]) for field in fields if field[0] is not None]
+        self._offsets = offsets
+        self._conversions = conversions
+        self._columns = columns
+        self._struct = struct.Struct(record_format)
+
+    @classmethod
+    def from_definition(cls, definition: dict):
+        """Creates a layout from its definition, e.g. as loaded from a layout definition JSON file"""
+
+        return cls(definition['record_len'], definition['header_len'], [tuple(field) for field in definition['fields']])
+
+    def __reduce__(self):
+        # The compiled structs can not be pickled, the layout is compiled again from its definition
+        return (RecordLayout.from_definition, (self._definition,))
+
+    @property
+    def definition(self) -> dict:
+        return self._definition
+
+    @property
+    def record_len(self) -> int:
+        return self._record_len
+
+    @property
+    def header_len(self) -> int:
+        return self._header_len
+
+    @property
+    def fields(self) -> List[Tuple[str, str]]:
+        return self._fields
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self._fields]
+
+    @property
+    def offsets(self) -> List[int]:
+        return self._offsets
+
+    @property
+    def conversions(self) -> Dict[str, Union[str, None]]:
+        return self._conversions
+
+    def unpack(self, content: Union[bytes, memoryview]) -> tuple:
+        """Unpacks a full record into a tuple with one raw value per column, without copying the record first"""
+
+        return self._struct.unpack(content)
+
+    def column_decoder(self, name: str, raw: bool = False) -> Callable[[Union[bytes, memoryview]], object]:
+        """Compiles a function that reads a single column without touching the rest of the record
+
+        The column's conversion is applied unless raw is set, giving the same value as the model's from_bytes.
+        """
+
+        column_struct, offset = self._columns[name]
+        unpack_from = column_struct.unpack_from
+        conversion = None if raw else self._conversions[name]
+
+        if conversion == 'str':
+            return lambda content: graceful_conversion(unpack_from(content, offset)[0])
+        elif conversion == 'null':
+            null_value = _NULL_VALUES[column_struct.size]
+            def decode_null(content):
+                value = unpack_from(content, offset)[0]
+                return None if value == null_value else value # Set to python None if value indicates null
+            return decode_null
+        elif conversion == 'decimal':
+            return lambda content: extract_decimal(unpack_from(content, offset)[0])
+        elif conversion == 'date':
+            def decode_date(content):
+                parsed = parse_date(unpack_from(content, offset)[0])
+                if parsed.error is not None:
+                    anomaly('invalid date', name, parsed.raw)
+                return parsed.date
+            return decode_date
+        elif conversion == 'date_strict':
+            return lambda content: date_conversion(unpack_from(content, offset)[0])
+
+        return lambda content: unpack_from(content, offset)[0]
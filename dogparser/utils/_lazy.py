@@ -0,0 +1,56 @@
+from typing import Callable, Dict, Union
+
+from ._conversion import parse_date
+from ._layout import RecordLayout
+
+class LazyRecord:
+    """Base of the record models that allows a record to be created without decoding any of its columns
+
+    A record created with from_buffer keeps a copy of its raw bytes and decodes a column the first time its
+    property is read, the decoded value is then cached on the instance. Properties and native give the same
+    values as for a record decoded up front by from_bytes, so consumers that only read a few columns (e.g.
+    reg_nr and the parents) skip the cost of the rest.
+    """
+
+    __slots__ = ('_content',) # Raw record of a lazy record, not set for records decoded by from_bytes
+
+    layout: RecordLayout # Layout of the record, set by every model
+    _column_names: Dict[str, str] = {} # Layout column of the attributes that are not named after their column
+    _decoders: Dict[str, Callable] = {} # Decoder of each private attribute, compiled from the layout
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        attributes = {column: attribute for attribute, column in cls._column_names.items()}
+        decoders = {}
+        for column, conversion in cls.layout.conversions.items():
+            attribute = attributes.get(column, column)
+            decoders[f'_{attribute}'] = cls.layout.column_decoder(column)
+            if conversion == 'date':
+                # The raw string of a date is kept next to it
+                decoders[f'_{attribute}_raw'] = _raw_decoder(cls.layout, column)
+        cls._decoders = decoders
+
+    @classmethod
+    def from_buffer(cls, content: Union[bytes, memoryview]):
+        if len(content) != cls.layout.record_len:
+            raise AssertionError(f'Input for {cls.__name__} should be {cls.layout.record_len} bytes')
+
+        record = cls.__new__(cls)
+        # Copy the record, the views of a memory mapped file are invalidated once the reader is closed
+        record._content = bytes(content)
+        return record
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set, for lazy records these are the columns not decoded yet
+        decoder = self._decoders.get(name)
+        if decoder is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        value = decoder(self._content)
+        setattr(self, name, value)
+        return value
+
+def _raw_decoder(layout: RecordLayout, column: str) -> Callable:
+    unpack = layout.column_decoder(column, raw=True)
+    return lambda content: parse_date(unpack(content)).raw
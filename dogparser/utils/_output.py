@@ -0,0 +1,188 @@
+import glob
+import json
+import os
+import sqlite3
+from itertools import chain, islice
+from typing import Iterable
+
+from ._diagnostics import logger
+from ._checkpoint import load_checkpoint, remove_checkpoint, save_checkpoint
+from ._columnar import COLUMNAR_FORMATS, write_columnar
+from ._profile import active_profiler, profiled
+
+OUTPUT_FORMATS = ['json', 'jsonl', 'sqlite'] + COLUMNAR_FORMATS
+
+# Columns that are indexed in the sqlite output, wherever a table has them
+SQLITE_INDEXES = ['reg_nr', 'farens_reg_nr', 'morens_reg_nr', 'kullnr', 'kennel']
+
+# Records inserted per executemany call
+SQLITE_BATCH_LEN = 10000
+
+def write_records(elements: Iterable, destination_folder: str, name: str, output_format: str = 'json', checkpoint_len: int = 0, resume: bool = False) -> int:
+    """Writes the native form of the parsed elements to DATA/<name>.<output_format> in the destination folder
+
+    The json format writes the whole table as one indented list. Both json and the jsonl format, which has one
+    element per line, are written as the elements are consumed, so elements can be passed as a generator and
+    the table is never held in memory. The sqlite format streams the elements into a table of the same name in
+    DATA/<name>.sqlite, see write_sqlite. The parquet and arrow formats write typed columns a row group at a
+    time, see write_columnar, and need pyarrow.
+
+    With a checkpoint_len the output is flushed every checkpoint_len elements and a checkpoint is written next
+    to it. With resume the output is cut back to its last checkpoint and the elements are appended, they must
+    start after the records the checkpoint holds (see read_checkpoint). The parquet and arrow files can not be
+    appended to, they are not checkpointed and an interrupted parse writes them again from the start. Returns
+    the number of elements in the output.
+    """
+
+    if output_format not in OUTPUT_FORMATS:
+        raise AssertionError(f'Output format {output_format} is not valid')
+
+    with profiled('write'):
+        return _write_records(elements, destination_folder, name, output_format, checkpoint_len, resume)
+
+def _natives(elements: Iterable) -> Iterable[dict]:
+    """The native form of each element, timed as the native stage when the run is profiled"""
+
+    natives = (element.native for element in elements)
+    profiler = active_profiler()
+    return natives if profiler is None else profiler.timed('native', natives)
+
+def _write_records(elements: Iterable, destination_folder: str, name: str, output_format: str, checkpoint_len: int, resume: bool) -> int:
+    os.makedirs(os.path.join(destination_folder, 'DATA'), exist_ok=True)
+    data_file = os.path.join(destination_folder, f'DATA/{name}.{output_format}')
+
+    if output_format == 'sqlite':
+        return write_sqlite(elements, data_file, name, destination_folder, checkpoint_len, resume)
+
+    if output_format in COLUMNAR_FORMATS:
+        # The columns are typed from the layout of the model, taken from the first element
+        elements = iter(elements)
+        first = next(elements, None)
+        element_type = type(first)
+        remove_checkpoint(data_file)
+        natives = _natives(chain([first], elements) if first is not None else [])
+        return write_columnar(natives, data_file, output_format, getattr(element_type, 'layout', None), getattr(element_type, '_column_names', None))
+
+    checkpoint = load_checkpoint(data_file) if resume else None
+    if checkpoint is None:
+        remove_checkpoint(data_file)
+        count = 0
+    else:
+        logger.info(f'Resuming {data_file} after {checkpoint["records"]} records')
+        count = checkpoint['records']
+
+    # Written as encoded bytes, so the position in the file is a byte offset
+    with open(data_file, 'wb' if checkpoint is None else 'r+b') as f:
+        if checkpoint is not None:
+            f.truncate(checkpoint['offset'])
+            f.seek(checkpoint['offset'])
+        elif output_format == 'json':
+            f.write(b'[')
+
+        for native in _natives(elements):
+            if output_format == 'json':
+                # Matches json.dump of the whole list with indent=2
+                text = json.dumps(native, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                f.write(b',\n  ' if count else b'\n  ')
+                f.write(text.encode('utf8'))
+            else:
+                f.write(json.dumps(native, ensure_ascii=False).encode('utf8'))
+                f.write(b'\n')
+            count += 1
+
+            if checkpoint_len and not count % checkpoint_len:
+                f.flush()
+                os.fsync(f.fileno())
+                save_checkpoint(data_file, count, f.tell())
+
+        if output_format == 'json':
+            f.write(b'\n]' if count else b']')
+
+    remove_checkpoint(data_file)
+    return count
+
+def _sqlite_type(value) -> str:
+    if isinstance(value, int):
+        return 'INTEGER'
+    elif isinstance(value, float):
+        return 'REAL'
+    return 'TEXT'
+
+def write_sqlite(elements: Iterable, data_file: str, name: str, enum_folder: str = None, checkpoint_len: int = 0, resume: bool = False) -> int:
+    """Writes the native form of the elements into the table name of a new sqlite database
+
+    The records are inserted with executemany in batches inside a single transaction, the column types are
+    taken from the first batch. The columns in SQLITE_INDEXES are indexed once the table is loaded. The enum
+    JSON files in enum_folder are stored as lookup tables enum_<FILE> with the columns id and value.
+
+    With a checkpoint_len the transaction is committed every checkpoint_len elements instead, with the
+    journal on, and a checkpoint is written next to the database. With resume the rows after the last
+    checkpoint are deleted and the elements are appended. Returns the number of elements in the table.
+    """
+
+    checkpoint = load_checkpoint(data_file) if resume else None
+    if checkpoint is None:
+        remove_checkpoint(data_file)
+        if os.path.exists(data_file):
+            os.remove(data_file)
+
+    natives = _natives(elements)
+    batch_len = min(SQLITE_BATCH_LEN, checkpoint_len) if checkpoint_len else SQLITE_BATCH_LEN
+    count = 0
+
+    connection = sqlite3.connect(data_file)
+    try:
+        if not checkpoint_len:
+            # The database is created from scratch, a failed load is simply run again
+            connection.execute('PRAGMA journal_mode = OFF')
+            connection.execute('PRAGMA synchronous = OFF')
+
+        with connection:
+            batch = list(islice(natives, batch_len))
+            if checkpoint is not None:
+                logger.info(f'Resuming {data_file} after {checkpoint["records"]} records')
+                count = checkpoint['records']
+                columns = [row[1] for row in connection.execute(f'PRAGMA table_info("{name}")')]
+                # Rows are only appended, so the rowid is the position of the record
+                connection.execute(f'DELETE FROM "{name}" WHERE rowid > ?', (count,))
+            elif batch:
+                columns = list(batch[0])
+                types = {}
+                for native in batch:
+                    for column in columns:
+                        if column not in types and native[column] is not None:
+                            types[column] = _sqlite_type(native[column])
+
+                column_definitions = ', '.join(f'"{column}" {types.get(column, "TEXT")}' for column in columns)
+                connection.execute(f'CREATE TABLE "{name}" ({column_definitions})')
+
+            if checkpoint is not None or batch:
+                insert = f'INSERT INTO "{name}" VALUES ({", ".join("?" for _ in columns)})'
+
+                while batch:
+                    connection.executemany(insert, [[native[column] for column in columns] for native in batch])
+                    previous, count = count, count + len(batch)
+
+                    if checkpoint_len and count // checkpoint_len > previous // checkpoint_len:
+                        connection.commit()
+                        save_checkpoint(data_file, count, 0)
+
+                    batch = list(islice(natives, batch_len))
+
+                for column in SQLITE_INDEXES:
+                    if column in columns:
+                        connection.execute(f'CREATE INDEX "{name}_{column}" ON "{name}" ("{column}")')
+
+            if enum_folder is not None:
+                for enum_file in sorted(glob.glob(os.path.join(enum_folder, '*.json'))):
+                    with open(enum_file, 'r', encoding='utf8') as f:
+                        enum = json.load(f)
+
+                    enum_table = f'enum_{os.path.splitext(os.path.basename(enum_file))[0]}'
+                    connection.execute(f'CREATE TABLE "{enum_table}" (id INTEGER PRIMARY KEY, value TEXT)')
+                    connection.executemany(f'INSERT INTO "{enum_table}" VALUES (?, ?)', enumerate(enum))
+    finally:
+        connection.close()
+
+    remove_checkpoint(data_file)
+    return count
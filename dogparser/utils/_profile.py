@@ -0,0 +1,175 @@
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Iterator, List, Union
+
+from ._diagnostics import ignoring_anomalies
+from ._layout import RecordLayout
+
+# Name of the conversion function behind each conversion of a layout column, None is a plain integer
+CONVERSION_FUNCTIONS = {
+    'str': 'graceful_conversion',
+    'null': 'integer',
+    None: 'integer',
+    'decimal': 'extract_decimal',
+    'date': 'parse_date',
+    'date_strict': 'date_conversion',
+}
+
+class StageProfiler:
+    """Wall time, CPU time and call counts of the stages of a parse run
+
+    Stages nest, the time of a stage excludes the time of the stages entered while it runs. A decode stage
+    that pulls records from a read stage is therefore reported without the reads. Iterators are timed per item
+    with timed, so the stages of a streamed pipeline are told apart even though they interleave.
+    """
+
+    _stages: Dict[str, List[float]] # Wall time, CPU time and calls of each stage, exclusive of nested stages
+    _stack: List[List[float]] # Wall and CPU time spent in nested stages, for each stage that is running
+    _sources: List[tuple] # Layouts and .DBM files decoded during the run, sampled for the field breakdown
+
+    def __init__(self) -> None:
+        self._stages = {}
+        self._stack = []
+        self._sources = []
+
+    def _enter(self) -> tuple:
+        self._stack.append([0.0, 0.0])
+        return time.perf_counter(), time.process_time()
+
+    def _exit(self, name: str, start: tuple) -> None:
+        wall = time.perf_counter() - start[0]
+        cpu = time.process_time() - start[1]
+        nested = self._stack.pop()
+        if self._stack:
+            self._stack[-1][0] += wall
+            self._stack[-1][1] += cpu
+
+        stage = self._stages.setdefault(name, [0.0, 0.0, 0])
+        stage[0] += wall - nested[0]
+        stage[1] += cpu - nested[1]
+        stage[2] += 1
+
+    @contextmanager
+    def stage(self, name: str):
+        start = self._enter()
+        try:
+            yield
+        finally:
+            self._exit(name, start)
+
+    def timed(self, name: str, iterable: Iterable) -> Iterator:
+        """Yields the items of iterable, timing the production of each one as a call of the stage"""
+
+        iterator = iter(iterable)
+        while True:
+            start = self._enter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self._exit(name, start)
+                return
+            except BaseException:
+                self._exit(name, start)
+                raise
+            self._exit(name, start)
+            yield item
+
+    def add_source(self, layout: RecordLayout, data_file: str) -> None:
+        self._sources.append((layout, data_file))
+
+    def sampled_fields(self, sample_len: int = 10000) -> Dict[str, dict]:
+        """Estimated decoding time of every conversion function, from a sample decoded again after the run
+
+        This is not a measurement of the run: the first sample_len records of each decoded file are read once
+        more and each column is decoded on its own, grouped by the conversion function. The sampled_values and
+        sampled_seconds are what was measured on the sample, estimated_seconds scales the time to all the
+        records of the file. The anomalies of the sample are not recorded again.
+        """
+
+        from ._records import RecordReader # The reader is profiled itself, so it imports this module
+
+        fields = {}
+        for layout, data_file in self._sources:
+            with RecordReader(data_file, layout.record_len) as reader, ignoring_anomalies():
+                records = [bytes(reader[i]) for i in range(min(sample_len, len(reader)))]
+                if not records:
+                    continue
+                scale = len(reader) / len(records)
+
+                for name in layout.names:
+                    decoder = layout.column_decoder(name)
+                    start = time.perf_counter()
+                    for record in records:
+                        decoder(record)
+                    elapsed = time.perf_counter() - start
+
+                    field = fields.setdefault(CONVERSION_FUNCTIONS[layout.conversions[name]], {'columns': 0, 'sampled_values': 0, 'sampled_seconds': 0.0, 'estimated_seconds': 0.0})
+                    field['columns'] += 1
+                    field['sampled_values'] += len(records)
+                    field['sampled_seconds'] += elapsed
+                    field['estimated_seconds'] += elapsed * scale
+        return fields
+
+    def report(self, sample_len: int = 10000) -> dict:
+        """Breakdown of the run by stage, measured, and by conversion function, estimated from a sample (see sampled_fields)"""
+
+        return {
+            'stages': {name: {'wall_seconds': wall, 'cpu_seconds': cpu, 'calls': calls} for name, (wall, cpu, calls) in self._stages.items()},
+            'sample_len': sample_len,
+            'sampled_fields': self.sampled_fields(sample_len),
+        }
+
+    @staticmethod
+    def print_report(report: dict) -> None:
+        total = sum(stage['wall_seconds'] for stage in report['stages'].values()) or 1.0
+        print(f'\n{"Stage":<24} {"wall s":>10} {"cpu s":>10} {"calls":>12} {"share":>8}')
+        for name, stage in sorted(report['stages'].items(), key=lambda item: -item[1]['wall_seconds']):
+            print(f'{name:<24} {stage["wall_seconds"]:>10.3f} {stage["cpu_seconds"]:>10.3f} {stage["calls"]:>12} {stage["wall_seconds"] / total:>8.1%}')
+
+        if report['sampled_fields']:
+            print(f'\nField conversions, estimated by decoding the first {report["sample_len"]} records of each file again after the run')
+            print(f'{"Field conversion":<24} {"columns":>10} {"sampled":>12} {"sample s":>10} {"est. s":>10}')
+            for name, field in sorted(report['sampled_fields'].items(), key=lambda item: -item[1]['estimated_seconds']):
+                print(f'{name:<24} {field["columns"]:>10} {field["sampled_values"]:>12} {field["sampled_seconds"]:>10.3f} {field["estimated_seconds"]:>10.3f}')
+
+# The profiler of the running parse, None unless a run is profiled
+_active: Union[StageProfiler, None] = None
+
+def active_profiler() -> Union[StageProfiler, None]:
+    return _active
+
+def profiled(name: str):
+    """Context timing the block as a stage of the active profiler, does nothing when the run is not profiled"""
+
+    return nullcontext() if _active is None else _active.stage(name)
+
+@contextmanager
+def profiling(report_file: str = None, sample_len: int = 10000, quiet: bool = False):
+    """Profiles the parse run inside the block, printing a breakdown at the end and writing it to report_file
+
+    Only work done in this process is timed, with more than one worker the decode stage is the time spent
+    waiting for the worker processes. With quiet nothing is printed, the report can be taken from the
+    profiler afterwards.
+    """
+
+    global _active
+    previous, _active = _active, StageProfiler()
+    profiler = _active
+    try:
+        with profiler.stage('other'):
+            yield profiler
+    finally:
+        _active = previous
+
+    if quiet and report_file is None:
+        return
+
+    report = profiler.report(sample_len)
+    if not quiet:
+        profiler.print_report(report)
+    if report_file is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(report_file)), exist_ok=True)
+        with open(report_file, 'w', encoding='utf8') as f:
+            json.dump(report, f, indent=2)
\ No newline at end of file
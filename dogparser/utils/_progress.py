@@ -0,0 +1,215 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Iterator, MutableMapping, Union
+
+from ._files import atomic_write
+
+# Records decoded between looks at the clock, so the hot loop does not time every record
+CLOCK_INTERVAL = 1000
+
+# Name, type and help text of the Prometheus metrics, in the order they are exposed
+METRICS = [
+    ('records', 'gauge', 'Records in the source file of the table', 'total'),
+    ('records_parsed_total', 'counter', 'Records decoded so far', 'records'),
+    ('bytes_parsed_total', 'counter', 'Bytes of the source file decoded so far', 'bytes'),
+    ('records_per_second', 'gauge', 'Records decoded per second in this run', 'records_per_second'),
+    ('bytes_per_second', 'gauge', 'Bytes decoded per second in this run', 'bytes_per_second'),
+    ('eta_seconds', 'gauge', 'Estimated seconds until the table is decoded', 'eta_seconds'),
+    ('errors_total', 'counter', 'Records that could not be decoded', 'errors'),
+    ('done', 'gauge', '1 once the table is decoded', 'done'),
+]
+
+class ProgressReporter:
+    """Tracks the records decoded from a table and reports the progress, throughput and ETA
+
+    The total is known up front from the size of the .DBM file. A progress line is printed every interval
+    seconds and once the table is decoded, 0 prints nothing, and a snapshot is published to metrics under the table name, e.g. a
+    dict read by a MetricsExporter, or a multiprocessing manager dict when the tables run in other processes.
+    """
+
+    _table: Union[str, None] # Name the progress is reported under, the .DBM file name if None
+    _interval: float # Seconds between progress lines, 0 disables them
+    _metrics: Union[MutableMapping, None] # Where the snapshots are published, by table name
+    _errors: int # Records that could not be decoded
+
+    def __init__(self, table: str = None, interval: float = 10.0, metrics: MutableMapping = None) -> None:
+        self._table = table
+        self._interval = interval
+        self._metrics = metrics
+        self._errors = 0
+
+    def error(self, count: int = 1) -> None:
+        self._errors += count
+
+    def track(self, elements: Iterable, data_file: str, element_len: int, start: int = 0) -> Iterator:
+        """Yields the decoded elements of data_file, counting them, from record start on"""
+
+        table = self._table or os.path.basename(data_file)
+        total = os.path.getsize(data_file) // element_len
+        count = start
+        started = time.monotonic()
+        next_report = started + self._interval
+
+        def snapshot(done: bool) -> dict:
+            seconds = time.monotonic() - started
+            rate = (count - start) / seconds if seconds > 0 else 0.0
+            return {
+                'table': table,
+                'total': total,
+                'records': count,
+                'bytes': count * element_len,
+                'seconds': seconds,
+                'records_per_second': rate,
+                'bytes_per_second': rate * element_len,
+                'eta_seconds': 0.0 if done else (total - count) / rate if rate else None,
+                'errors': self._errors,
+                'done': int(done),
+            }
+
+        self._publish(snapshot(False))
+        try:
+            for element in elements:
+                yield element
+                count += 1
+                if not count % CLOCK_INTERVAL and self._interval and time.monotonic() >= next_report:
+                    next_report += self._interval
+                    progress = snapshot(False)
+                    self._publish(progress)
+                    self.print_progress(progress)
+        except BaseException:
+            self._publish(snapshot(False))
+            raise
+
+        progress = snapshot(True)
+        self._publish(progress)
+        if self._interval:
+            self.print_progress(progress)
+
+    def _publish(self, progress: dict) -> None:
+        if self._metrics is not None:
+            self._metrics[progress['table']] = progress
+
+    @staticmethod
+    def print_progress(progress: dict) -> None:
+        if progress['done']:
+            print(f'{progress["table"]}: {progress["records"]} records in {progress["seconds"]:.1f}s, '
+                  f'{progress["records_per_second"]:.0f} records/s, {progress["bytes_per_second"] / 2**20:.1f} MB/s, {progress["errors"]} errors')
+            return
+
+        share = progress['records'] / progress['total'] if progress['total'] else 1.0
+        eta = '?' if progress['eta_seconds'] is None else time.strftime('%H:%M:%S', time.gmtime(progress['eta_seconds']))
+        print(f'{progress["table"]}: {progress["records"]}/{progress["total"]} records ({share:.1%}), '
+              f'{progress["records_per_second"]:.0f} records/s, {progress["bytes_per_second"] / 2**20:.1f} MB/s, ETA {eta}, {progress["errors"]} errors')
+
+def render_metrics(snapshots: MutableMapping) -> str:
+    """The published snapshots in the Prometheus text format, labelled by table"""
+
+    snapshots = sorted(dict(snapshots).values(), key=lambda progress: progress['table'])
+    lines = []
+    for name, metric_type, description, key in METRICS:
+        lines.append(f'# HELP dogparser_{name} {description}')
+        lines.append(f'# TYPE dogparser_{name} {metric_type}')
+        for progress in snapshots:
+            if progress[key] is not None:
+                table = progress['table'].replace('\\', '\\\\').replace('"', '\\"')
+                lines.append(f'dogparser_{name}{{table="{table}"}} {progress[key]}')
+    return '\n'.join(lines) + '\n'
+
+class MetricsExporter:
+    """Exposes the snapshots published by progress reporters to a batch dashboard
+
+    With a metrics_file the metrics are written to it every interval seconds and when the exporter is closed,
+    in the Prometheus text format read by e.g. the node exporter textfile collector. With a port they are
+    served at http://localhost:<port>/metrics for as long as the exporter is open.
+    """
+
+    _snapshots: MutableMapping # The snapshots by table name
+    _metrics_file: Union[str, None]
+    _port: Union[int, None]
+    _interval: float
+    _server: Union[ThreadingHTTPServer, None]
+    _stopped: threading.Event
+    _threads: list
+
+    def __init__(self, snapshots: MutableMapping, metrics_file: str = None, port: int = None, interval: float = 10.0) -> None:
+        self._snapshots = snapshots
+        self._metrics_file = metrics_file
+        self._port = port
+        self._interval = interval or 10.0
+        self._server = None
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._port is not None:
+            snapshots = self._snapshots
+
+            class MetricsHandler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split('?')[0] != '/metrics':
+                        self.send_error(404)
+                        return
+                    content = render_metrics(snapshots).encode('utf8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                    self.send_header('Content-Length', str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+
+                def log_message(self, *_):
+                    pass
+
+            self._server = ThreadingHTTPServer(('localhost', self._port), MetricsHandler)
+            self._threads.append(threading.Thread(target=self._server.serve_forever, daemon=True))
+
+        if self._metrics_file is not None:
+            self._threads.append(threading.Thread(target=self._write_periodically, daemon=True))
+
+        for thread in self._threads:
+            thread.start()
+
+    def _write_periodically(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.write()
+
+    def write(self) -> None:
+        # A collector never reads a partial file
+        with atomic_write(self._metrics_file) as f:
+            f.write(render_metrics(self._snapshots))
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self._metrics_file is not None:
+            self.write()
+
+# The progress reporter of the running parse, None unless progress is reported
+_active: Union[ProgressReporter, None] = None
+
+def active_reporter() -> Union[ProgressReporter, None]:
+    return _active
+
+@contextmanager
+def reporting(table: str = None, interval: float = 10.0, metrics: MutableMapping = None):
+    """Reports the progress of the records decoded inside the block, see ProgressReporter"""
+
+    global _active
+    previous, _active = _active, ProgressReporter(table, interval, metrics)
+    try:
+        yield _active
+    finally:
+        _active = previous
\ No newline at end of file
@@ -0,0 +1,120 @@
+import json
+import os
+from contextlib import contextmanager
+from typing import Dict, IO, Union
+
+from ._diagnostics import logger
+
+# What happens to a record that fails to decode, raise aborts the parse
+ON_ERROR = ['raise', 'quarantine']
+
+class Quarantine:
+    """Keeps the records that fail to decode out of the output instead of aborting the parse
+
+    Each failed record of a .DBM file is written to <file name>.quarantine.jsonl in the quarantine folder,
+    one JSON object per line with the record index, the byte offset in the .DBM file, the error and the raw
+    record as hex, so it can be inspected and fixed without parsing the table again.
+    """
+
+    _folder: str # The folder the quarantine files are written to
+    _files: Dict[str, IO] # The open quarantine file of each .DBM file
+    _counts: Dict[str, int] # Records quarantined from each .DBM file
+
+    def __init__(self, folder: str) -> None:
+        self._folder = folder
+        self._files = {}
+        self._counts = {}
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    def quarantine_file(self, data_file: str) -> str:
+        return os.path.join(self._folder, os.path.basename(data_file) + '.quarantine.jsonl')
+
+    def open(self, data_file: str, start: int = 0) -> int:
+        """Starts quarantining the records of data_file after start decoded records, returns the record to read next
+
+        The records quarantined by an interrupted run are not part of its output, so a run resuming after start
+        records continues after start records plus those quarantined before them. Records quarantined after that
+        point are dropped from the file, they are decoded again.
+        """
+
+        quarantine_file = self.quarantine_file(data_file)
+        entries = []
+        if start and os.path.exists(quarantine_file):
+            with open(quarantine_file, 'r', encoding='utf8') as f:
+                entries = sorted((json.loads(line) for line in f if line.strip()), key=lambda entry: entry['index'])
+
+        position = start
+        kept = []
+        for entry in entries:
+            # Every quarantined record up to the position moves it on by one, it is not part of the output
+            if entry['index'] > position:
+                break
+            position += 1
+            kept.append(entry)
+
+        os.makedirs(self._folder, exist_ok=True)
+        f = open(quarantine_file, 'w', encoding='utf8')
+        for entry in kept:
+            f.write(json.dumps(entry) + '\n')
+        f.flush()
+
+        self._close(data_file)
+        self._files[data_file] = f
+        self._counts[data_file] = len(kept)
+        return position
+
+    def add(self, data_file: str, index: int, element_len: int, content: Union[bytes, memoryview], error: Union[Exception, str]) -> None:
+        entry = {
+            'index': index,
+            'offset': index * element_len,
+            'error': error if isinstance(error, str) else repr(error),
+            'record': bytes(content).hex(),
+        }
+        f = self._files[data_file]
+        f.write(json.dumps(entry) + '\n')
+        f.flush() # A crash later on must not lose the records that were taken out of the output
+        self._counts[data_file] += 1
+
+    def _close(self, data_file: str) -> None:
+        f = self._files.pop(data_file, None)
+        if f is not None:
+            f.close()
+            if not self._counts[data_file]:
+                os.remove(f.name) # Only tables with failed records leave a quarantine file behind
+
+    def close(self) -> None:
+        for data_file in list(self._files):
+            self._close(data_file)
+
+    def log_summary(self, table: str = None) -> None:
+        prefix = f'{table}: ' if table else ''
+        for data_file, count in self._counts.items():
+            if count:
+                logger.warning(f'{prefix}{count} records of {data_file} could not be decoded, see {self.quarantine_file(data_file)}')
+
+# The quarantine of the running parse, None unless failed records are quarantined
+_active: Union[Quarantine, None] = None
+
+def active_quarantine() -> Union[Quarantine, None]:
+    return _active
+
+@contextmanager
+def quarantining(folder: str, table: str = None):
+    """Quarantines the records that fail to decode inside the block instead of raising, see Quarantine"""
+
+    global _active
+    previous, _active = _active, Quarantine(folder)
+    quarantine = _active
+    try:
+        yield quarantine
+    finally:
+        _active = previous
+        quarantine.close()
+
+    quarantine.log_summary(table)
\ No newline at end of file
@@ -0,0 +1,187 @@
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, Union
+
+from ._diagnostics import active_diagnostics, collecting
+from ._profile import active_profiler
+from ._progress import active_reporter
+from ._quarantine import Quarantine, active_quarantine
+
+class RecordReader:
+    """Memory mapped reader for the fixed width records of a DataEase .DBM file
+
+    Records are returned as memoryview slices of the mapped file, so reading a record neither copies it nor
+    issues a read call, and any record can be fetched directly by its index. The views are only valid until
+    the reader is closed, decode them (e.g. with from_bytes) rather than keeping them around.
+    """
+
+    _data_file: str # Path to the .DBM file
+    _element_len: int # Length of a single record in bytes
+    _count: int # Number of complete records in the file, a trailing partial record is ignored
+    _map: Union[mmap.mmap, None] # The mapped file, None for empty files that can not be mapped
+    _view: memoryview # View over the full mapped file
+
+    def __init__(self, data_file: str, element_len: int) -> None:
+        self._data_file = data_file
+        self._element_len = element_len
+        self._count = os.path.getsize(data_file) // element_len
+
+        if self._count:
+            with open(data_file, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+        else:
+            self._map = None
+            self._view = memoryview(b'')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> memoryview:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f'Record {index} is outside of {self._data_file}, which has {self._count} records')
+
+        offset = index * self._element_len
+        return self._view[offset:offset + self._element_len]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        element_len = self._element_len
+        view = self._view
+        for offset in range(0, self._count * element_len, element_len):
+            yield view[offset:offset + element_len]
+
+    @property
+    def element_len(self) -> int:
+        return self._element_len
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Views handed out are still referenced, the map is closed once they are garbage collected
+                pass
+            self._map = None
+
+def read_records(data_file: str, element_len: int, start: int = 0) -> Iterator[memoryview]:
+    """Generator yielding the fixed width records of a DataEase .DBM file one at a time, from record start"""
+
+    with RecordReader(data_file, element_len) as reader:
+        for i in range(start, len(reader)):
+            yield reader[i]
+
+def _decode_chunk(element_type: type, data_file: str, element_len: int, start: int, stop: int, lazy: bool = False, tolerant: bool = False) -> tuple:
+    """Decodes the records start to stop of a .DBM file, runs in the worker processes of decode_records
+
+    Returns the records and the anomalies met decoding them, to be collected in the parent process. With
+    tolerant the records that fail to decode are returned as (index, raw record, error) failures instead of
+    raising, to be quarantined by the parent process.
+    """
+
+    decode = element_type.from_buffer if lazy else element_type.from_bytes
+    elements = []
+    failures = []
+    with RecordReader(data_file, element_len) as reader, collecting(summary=False) as diagnostics:
+        for i in range(start, stop):
+            if not tolerant:
+                elements.append(decode(reader[i]))
+                continue
+            try:
+                elements.append(decode(reader[i]))
+            except Exception as e:
+                failures.append((i, bytes(reader[i]), repr(e)))
+    return elements, diagnostics.state(), failures
+
+def decode_records(element_type: type, data_file: str, element_len: int, workers: int = 1, chunk_len: int = 10000, lazy: bool = False, start: int = 0) -> Iterator:
+    """Generator yielding the decoded records of a DataEase .DBM file in their original order
+
+    With more than one worker the file is split into chunks of chunk_len records that are decoded by
+    element_type.from_bytes in a process pool. Only a couple of chunks per worker are in flight at a time,
+    so a slow consumer does not cause the whole table to pile up in memory. With lazy the records are created
+    by element_type.from_buffer instead, and only decode the columns that are read. Records before start are
+    skipped without being read, e.g. when resuming from a checkpoint. Inside reporting the progress is
+    reported as the records are consumed.
+
+    Inside quarantining a record that fails to decode is written to the quarantine instead of raising, and
+    start counts the decoded records only, the records quarantined before them are skipped as well. Lazy
+    records would only fail once a column is read, after they are yielded, so the records are decoded by
+    element_type.from_bytes when quarantining even if lazy is set.
+    """
+
+    quarantine = active_quarantine()
+    if quarantine is not None:
+        start = quarantine.open(data_file, start)
+        lazy = False
+
+    elements = _decode_records(element_type, data_file, element_len, workers, chunk_len, lazy, start, quarantine)
+    profiler = active_profiler()
+    if profiler is not None:
+        profiler.add_source(element_type.layout, data_file)
+        elements = profiler.timed('decode', elements)
+
+    reporter = active_reporter()
+    if reporter is not None:
+        elements = reporter.track(elements, data_file, element_len, start)
+    return elements
+
+def _quarantine_record(quarantine: Quarantine, data_file: str, index: int, element_len: int, content, error) -> None:
+    quarantine.add(data_file, index, element_len, content, error)
+    reporter = active_reporter()
+    if reporter is not None:
+        reporter.error()
+
+def _decode_records(element_type: type, data_file: str, element_len: int, workers: int, chunk_len: int, lazy: bool, start: int, quarantine: Union[Quarantine, None]) -> Iterator:
+
+    decode = element_type.from_buffer if lazy else element_type.from_bytes
+    if workers <= 1:
+        records = read_records(data_file, element_len, start)
+        profiler = active_profiler()
+        if profiler is not None:
+            records = profiler.timed('read', records)
+        if quarantine is None:
+            for data in records:
+                yield decode(data)
+            return
+
+        for i, data in enumerate(records, start):
+            try:
+                element = decode(data)
+            except Exception as e:
+                _quarantine_record(quarantine, data_file, i, element_len, data, e)
+                continue
+            yield element
+        return
+
+    count = os.path.getsize(data_file) // element_len
+    chunks = iter(range(start, count, chunk_len))
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_start in islice(chunks, workers * 2):
+            pending.append(executor.submit(_decode_chunk, element_type, data_file, element_len, chunk_start, min(chunk_start + chunk_len, count), lazy, quarantine is not None))
+
+        while pending:
+            elements, anomalies, failures = pending.popleft().result()
+            diagnostics = active_diagnostics()
+            if diagnostics is not None:
+                diagnostics.merge(anomalies)
+            for i, content, error in failures:
+                _quarantine_record(quarantine, data_file, i, element_len, content, error)
+
+            chunk_start = next(chunks, None)
+            if chunk_start is not None:
+                pending.append(executor.submit(_decode_chunk, element_type, data_file, element_len, chunk_start, min(chunk_start + chunk_len, count), lazy, quarantine is not None))
+
+            yield from elements
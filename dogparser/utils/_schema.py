@@ -0,0 +1,88 @@
+import hashlib
+import json
+import marshal
+import os
+from typing import Callable
+
+from ._diagnostics import logger
+from ._files import atomic_write
+from ._profile import profiled
+
+# Bumped when the layout of the manifest changes
+SCHEMA_MANIFEST_VERSION = 1
+
+def schema_cache_folder() -> str:
+    """Folder holding the schema manifests, set with DOGPARSER_CACHE, an empty value disables the cache"""
+
+    return os.environ.get('DOGPARSER_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'dogparser'))
+
+def load_schema(schema_file: str, read_schema: Callable[[bytes], dict]) -> dict:
+    """Reads the schema of a DataEase .DBA file with read_schema, or loads it from its manifest
+
+    The manifest is keyed on the path of the DBA file and stores its size, modification time and hash, together
+    with a hash of the read_schema code. An unchanged DBA file read by unchanged code is loaded from the manifest
+    without being read, a touched file whose hash still matches is loaded after hashing it. The result of
+    read_schema must be JSON serializable.
+    """
+
+    with profiled('schema'):
+        return _load_schema(schema_file, read_schema)
+
+def _load_schema(schema_file: str, read_schema: Callable[[bytes], dict]) -> dict:
+    cache_folder = schema_cache_folder()
+    stat = os.stat(schema_file)
+    reader_hash = hashlib.sha1(marshal.dumps(read_schema.__code__)).hexdigest()
+
+    manifest = None
+    manifest_file = None
+    if cache_folder:
+        manifest_file = os.path.join(cache_folder, hashlib.sha1(os.path.abspath(schema_file).encode('utf8')).hexdigest() + '.json')
+        try:
+            with open(manifest_file, 'r', encoding='utf8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+
+        if manifest is not None and (manifest.get('version') != SCHEMA_MANIFEST_VERSION or manifest.get('reader') != reader_hash):
+            manifest = None
+
+        if manifest is not None and manifest['size'] == stat.st_size and manifest['mtime'] == stat.st_mtime_ns:
+            logger.info(f'Using the cached schema of {schema_file}')
+            return manifest['schema']
+
+    with open(schema_file, 'rb') as f:
+        schema_data = f.read()
+    schema_hash = hashlib.sha256(schema_data).hexdigest()
+
+    if manifest is not None and manifest['sha256'] == schema_hash:
+        logger.info(f'Using the cached schema of {schema_file}')
+        schema = manifest['schema']
+    else:
+        schema = read_schema(schema_data)
+
+    if manifest_file is not None:
+        manifest = {
+            'version': SCHEMA_MANIFEST_VERSION,
+            'source': os.path.abspath(schema_file),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'sha256': schema_hash,
+            'reader': reader_hash,
+            'schema': schema,
+        }
+        try:
+            os.makedirs(cache_folder, exist_ok=True)
+            # Parallel runs never see a partial manifest
+            with atomic_write(manifest_file) as f:
+                json.dump(manifest, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f'Unable to cache the schema of {schema_file}, {e}')
+
+    return schema
+
+def write_enums(schema: dict, destination_folder: str) -> None:
+    """Writes each enum of a schema to its JSON file in the destination folder"""
+
+    for file, enum in schema['enums'].items():
+        with open(os.path.join(destination_folder, file), 'w', encoding='utf8') as f:
+            json.dump(enum, f, ensure_ascii=False, indent=True)
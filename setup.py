@@ -23,6 +23,10 @@ setup(
     },
     install_requires=[
     ],
+    extras_require={
+        'numpy': ['numpy'],
+        'arrow': ['pyarrow'],
+    },
     test_suite='test',
     python_requires='>=3.7',
     classifiers=[
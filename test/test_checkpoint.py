@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from dogparser.benchmarks._synthetic import write_synthetic_table
+from dogparser.parsers.hund._hund import Hund
+from dogparser.runners._tables import parse_table
+from dogparser.utils import read_checkpoint
+
+RECORDS = 1000
+CHECKPOINT_LEN = 100
+
+# The decode of this record fails in the interrupted run, after 6 checkpoints
+INTERRUPTED_AT = 650
+
+class Interrupted(Exception):
+    pass
+
+def interrupting_decoder(after: int):
+    from_bytes = Hund.from_bytes
+    calls = []
+
+    def decode(content):
+        if len(calls) == after:
+            raise Interrupted()
+        calls.append(None)
+        return from_bytes(content)
+    return decode
+
+def read_output(destination_folder: str, output_format: str):
+    data_file = os.path.join(destination_folder, 'HUNDER', 'DATA', f'hund.{output_format}')
+    if output_format == 'sqlite':
+        with sqlite3.connect(data_file) as connection:
+            return connection.execute('SELECT * FROM hund').fetchall()
+    with open(data_file, 'rb') as f:
+        return f.read()
+
+class TestResume(unittest.TestCase):
+    def setUp(self):
+        self._folder = tempfile.TemporaryDirectory()
+        self.folder = self._folder.name
+        self.source_definition = os.path.join(self.folder, 'HUNDHAAE')
+        write_synthetic_table(Hund, self.source_definition, RECORDS)
+
+    def tearDown(self):
+        self._folder.cleanup()
+
+    def test_resumed_output_equals_uninterrupted_output(self):
+        for output_format in ('jsonl', 'json', 'sqlite'):
+            with self.subTest(output_format=output_format):
+                complete = os.path.join(self.folder, f'COMPLETE_{output_format}')
+                self.assertEqual(parse_table('HUNDER', self.source_definition, complete, output_format, 1, CHECKPOINT_LEN), RECORDS)
+
+                resumed = os.path.join(self.folder, f'RESUMED_{output_format}')
+                with mock.patch.object(Hund, 'from_bytes', interrupting_decoder(INTERRUPTED_AT)):
+                    with self.assertRaises(Interrupted):
+                        parse_table('HUNDER', self.source_definition, resumed, output_format, 1, CHECKPOINT_LEN)
+                self.assertEqual(read_checkpoint(os.path.join(resumed, 'HUNDER'), 'hund', output_format), INTERRUPTED_AT // CHECKPOINT_LEN * CHECKPOINT_LEN)
+
+                self.assertEqual(parse_table('HUNDER', self.source_definition, resumed, output_format, 1, CHECKPOINT_LEN, resume=True), RECORDS)
+                self.assertEqual(read_output(resumed, output_format), read_output(complete, output_format))
+                self.assertEqual(read_checkpoint(os.path.join(resumed, 'HUNDER'), 'hund', output_format), 0)
+
+    def test_resume_without_checkpoint_starts_over(self):
+        destination = os.path.join(self.folder, 'OUT')
+        self.assertEqual(parse_table('HUNDER', self.source_definition, destination, 'jsonl', 1, CHECKPOINT_LEN, resume=True), RECORDS)
+        with open(os.path.join(destination, 'HUNDER', 'DATA', 'hund.jsonl'), 'rb') as f:
+            self.assertEqual(len(f.read().splitlines()), RECORDS)
+
+if __name__ == '__main__':
+    unittest.main()
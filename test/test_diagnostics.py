@@ -0,0 +1,53 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from dogparser.benchmarks._synthetic import synthetic_record, synthetic_schema
+from dogparser.parsers.hund._hund import Hund
+from dogparser.runners import parse
+
+# Every INVALID_EVERY record of the test table has an invalid birth date
+INVALID_EVERY = 7
+
+def write_dirty_table(source_definition: str, count: int) -> int:
+    """Writes a HUNDER .DBA/.DBM pair with invalid birth dates, returns the number of invalid dates"""
+
+    offset = dict(zip(Hund.layout.names, Hund.layout.offsets))['fodt']
+    with open(source_definition + '.DBA', 'wb') as f:
+        f.write(synthetic_schema(Hund))
+    with open(source_definition + '.DBM', 'wb') as f:
+        for i in range(count):
+            content = bytearray(synthetic_record(Hund, i))
+            if not i % INVALID_EVERY:
+                content[offset:offset + 6] = b'320199' # 32nd of January
+            f.write(bytes(content))
+    return len(range(0, count, INVALID_EVERY))
+
+def run_cli(*arguments: str) -> None:
+    with mock.patch.object(sys, 'argv', ['dog', *arguments]), contextlib.redirect_stdout(io.StringIO()):
+        parse()
+
+class TestAnomalies(unittest.TestCase):
+    def test_profile_does_not_count_anomalies_again(self):
+        with tempfile.TemporaryDirectory() as folder:
+            source_definition = os.path.join(folder, 'HUNDHAAE')
+            invalid = write_dirty_table(source_definition, 500)
+
+            counts = []
+            for profile in ([], ['--profile', os.path.join(folder, 'profile.json')]):
+                destination = os.path.join(folder, f'OUT{len(counts)}')
+                anomalies_file = os.path.join(folder, f'anomalies{len(counts)}.json')
+                run_cli('HUNDER', source_definition, destination, '--quiet', '--anomalies', anomalies_file, *profile)
+                with open(anomalies_file, 'r', encoding='utf8') as f:
+                    counts.append({(anomaly['kind'], anomaly['column']): anomaly['count'] for anomaly in json.load(f)['HUNDER']})
+
+            self.assertEqual(counts[0], {('invalid date', 'fodt'): invalid})
+            self.assertEqual(counts[1], counts[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from dogparser.benchmarks._synthetic import synthetic_record, synthetic_schema
+from dogparser.parsers.hund._hund import Hund
+from dogparser.runners._diff import diff_exports
+from dogparser.utils import diff_records
+
+def write_table(source_definition: str, records: list) -> None:
+    with open(source_definition + '.DBA', 'wb') as f:
+        f.write(synthetic_schema(Hund))
+    with open(source_definition + '.DBM', 'wb') as f:
+        f.write(b''.join(records))
+
+def renamed(record: bytes, name: bytes) -> bytes:
+    offset = dict(zip(Hund.layout.names, Hund.layout.offsets))['navn']
+    content = bytearray(record)
+    content[offset:offset + 38] = name.ljust(38, b'\x00')
+    return bytes(content)
+
+class TestDiff(unittest.TestCase):
+    def setUp(self):
+        self._folder = tempfile.TemporaryDirectory()
+        self.folder = self._folder.name
+        os.makedirs(os.path.join(self.folder, 'OLD'))
+        os.makedirs(os.path.join(self.folder, 'NEW'))
+
+        old = [synthetic_record(Hund, i) for i in range(100)]
+        new = list(old)
+        new[40] = renamed(new[40], b'NEW NAME') # Updated
+        new[41] = b'\xff' * Hund.layout.header_len + new[41][Hund.layout.header_len:] # Only the header differs
+        new += [synthetic_record(Hund, i) for i in (100, 101)] # Inserted
+        new.append(renamed(old[3], b'SECOND RECORD')) # A second record of REG3, inserted
+        del new[17], new[5] # Deleted
+
+        write_table(os.path.join(self.folder, 'OLD', 'HUNDHAAE'), old)
+        write_table(os.path.join(self.folder, 'NEW', 'HUNDHAAE'), new)
+
+    def tearDown(self):
+        self._folder.cleanup()
+
+    def test_diff_records(self):
+        deltas = diff_records(Hund, os.path.join(self.folder, 'OLD', 'HUNDHAAE.DBM'), os.path.join(self.folder, 'NEW', 'HUNDHAAE.DBM'), 'reg_nr')
+        changes = [(delta.change, delta.element.reg_nr, delta.element.navn) for delta in deltas]
+        self.assertEqual(changes, [
+            ('updated', 'REG40', 'NEW NAME'),
+            ('inserted', 'REG100', 'NAV100'),
+            ('inserted', 'REG101', 'NAV101'),
+            ('inserted', 'REG3', 'SECOND RECORD'),
+            ('deleted', 'REG5', 'NAV5'),
+            ('deleted', 'REG17', 'NAV17'),
+        ])
+
+    def test_diff_exports(self):
+        destination = os.path.join(self.folder, 'DELTA')
+        with contextlib.redirect_stdout(io.StringIO()):
+            summary = diff_exports(os.path.join(self.folder, 'OLD'), os.path.join(self.folder, 'NEW'), destination, 'jsonl')
+        self.assertEqual(summary, {'HUNDER': {'inserted': 3, 'updated': 1, 'deleted': 2}})
+
+        with open(os.path.join(destination, 'HUNDER', 'DATA', 'hunder_delta.jsonl'), 'r', encoding='utf8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([(record['change'], record['reg_nr']) for record in records], [
+            ('updated', 'REG40'), ('inserted', 'REG100'), ('inserted', 'REG101'), ('inserted', 'REG3'), ('deleted', 'REG5'), ('deleted', 'REG17'),
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
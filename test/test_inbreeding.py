@@ -0,0 +1,70 @@
+import unittest
+
+from dogparser.pedigree import PedigreeGraph, inbreeding_coefficients, stored_coefficient
+
+# (reg_nr, farens_reg_nr, morens_reg_nr) of a small pedigree and the inbreeding coefficient of every dog.
+# The records are not in birth order, and the founders A and B have no record of their own.
+PEDIGREE = [
+    ('K', 'E', 'E2'), # Second generation of full sibling matings
+    ('E', 'C', 'D'), # Full siblings
+    ('E2', 'C', 'D'),
+    ('C', 'A', 'B'),
+    ('D', 'A', 'B'),
+    ('X', '', ''),
+    ('Y', 'A', 'X'),
+    ('G', 'C', 'Y'), # Half siblings through A
+    ('H', 'A', 'C'), # Father and daughter
+    ('M', 'A', ''), # Unknown mother
+    ('N', 'K', 'E'), # Son and mother, both inbred
+]
+EXPECTED = {
+    'A': 0.0, 'B': 0.0, 'X': 0.0, 'C': 0.0, 'D': 0.0, 'Y': 0.0, 'M': 0.0,
+    'E': 0.25, 'E2': 0.25, 'G': 0.125, 'H': 0.25, 'K': 0.375, 'N': 0.5,
+}
+
+def kinship(parents: dict, a: str, b: str) -> float:
+    """Kinship by its recursive definition, the reference the fast algorithm is checked against"""
+
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return (1 + kinship(parents, *parents.get(a, ('', '')))) / 2
+
+    # Recurse on the parents of the younger dog, an ancestor is always fewer generations from the founders
+    if generation(parents, a) < generation(parents, b):
+        a, b = b, a
+    father, mother = parents.get(a, ('', ''))
+    return (kinship(parents, father, b) + kinship(parents, mother, b)) / 2
+
+def generation(parents: dict, reg_nr: str) -> int:
+    if reg_nr not in parents:
+        return 0
+    return 1 + max(generation(parents, parent) for parent in parents[reg_nr])
+
+class TestInbreeding(unittest.TestCase):
+    def setUp(self):
+        self.graph = PedigreeGraph(PEDIGREE)
+        self.coefficients = inbreeding_coefficients(self.graph)
+
+    def coefficient(self, reg_nr: str) -> float:
+        return self.coefficients[self.graph.node(reg_nr)]
+
+    def test_known_coefficients(self):
+        for reg_nr, expected in EXPECTED.items():
+            with self.subTest(reg_nr=reg_nr):
+                self.assertAlmostEqual(self.coefficient(reg_nr), expected)
+
+    def test_against_kinship_of_the_parents(self):
+        parents = {reg_nr: (father, mother) for reg_nr, father, mother in PEDIGREE}
+        for reg_nr, (father, mother) in parents.items():
+            with self.subTest(reg_nr=reg_nr):
+                self.assertAlmostEqual(self.coefficient(reg_nr), kinship(parents, father, mother))
+
+    def test_stored_coefficient(self):
+        self.assertAlmostEqual(stored_coefficient('Innavl 12,5 %'), 0.125)
+        self.assertAlmostEqual(stored_coefficient('0.25'), 0.25)
+        self.assertAlmostEqual(stored_coefficient('F = 6.25'), 0.0625)
+        self.assertIsNone(stored_coefficient('ukjent'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from itertools import islice
+
+from dogparser.benchmarks._synthetic import synthetic_record
+from dogparser.parsers.tyskull._tyskull import TysKull
+from dogparser.utils import decode_records, quarantining
+
+RECORDS = 40
+
+# Records with an invalid birth date, TysKull reads it strictly so they fail to decode
+FAILING = [3, 11, 12, 30]
+
+def read_quarantine(quarantine_file: str) -> list:
+    with open(quarantine_file, 'r', encoding='utf8') as f:
+        return [json.loads(line) for line in f]
+
+class TestQuarantine(unittest.TestCase):
+    def setUp(self):
+        self._folder = tempfile.TemporaryDirectory()
+        self.folder = self._folder.name
+        self.data_file = os.path.join(self.folder, 'TYSKHAAA.DBM')
+        self.quarantine_folder = os.path.join(self.folder, 'QUARANTINE')
+        self.quarantine_file = os.path.join(self.quarantine_folder, 'TYSKHAAA.DBM.quarantine.jsonl')
+
+        layout = TysKull.layout
+        offset = dict(zip(layout.names, layout.offsets))['fodt']
+        self.records = []
+        for i in range(RECORDS):
+            content = bytearray(synthetic_record(TysKull, i))
+            if i in FAILING:
+                content[offset:offset + 6] = b'320199' # 32nd of January
+            self.records.append(bytes(content))
+        with open(self.data_file, 'wb') as f:
+            f.write(b''.join(self.records))
+
+    def tearDown(self):
+        self._folder.cleanup()
+
+    def decode(self, start: int = 0, stop: int = None, **kwargs) -> list:
+        with quarantining(self.quarantine_folder):
+            elements = decode_records(TysKull, self.data_file, TysKull.layout.record_len, start=start, **kwargs)
+            return [element.native for element in islice(elements, stop)]
+
+    def assert_quarantined(self, entries: list) -> None:
+        self.assertEqual([entry['index'] for entry in entries], FAILING)
+        for entry in entries:
+            self.assertEqual(entry['offset'], entry['index'] * TysKull.layout.record_len)
+            self.assertEqual(bytes.fromhex(entry['record']), self.records[entry['index']])
+            self.assertIn('ValueError', entry['error'])
+
+    def test_offsets(self):
+        natives = self.decode()
+        self.assertEqual(len(natives), RECORDS - len(FAILING))
+        self.assert_quarantined(read_quarantine(self.quarantine_file))
+
+    def test_lazy_records_are_quarantined(self):
+        self.assertEqual(self.decode(lazy=True), self.decode())
+        self.assert_quarantined(read_quarantine(self.quarantine_file))
+
+    def test_workers(self):
+        self.assertEqual(self.decode(workers=2, chunk_len=7), self.decode())
+        self.assert_quarantined(read_quarantine(self.quarantine_file))
+
+    def test_resume(self):
+        complete = self.decode()
+
+        # Interrupted after 10 decoded records, one was quarantined before them. The resumed run starts after
+        # the 10 decoded records and the quarantined one, and keeps the quarantine entries up to there.
+        first = self.decode(stop=10)
+        self.assertEqual([entry['index'] for entry in read_quarantine(self.quarantine_file)], [3])
+        rest = self.decode(start=len(first))
+
+        self.assertEqual(first + rest, complete)
+        self.assert_quarantined(read_quarantine(self.quarantine_file))
+
+    def test_no_quarantine_file_without_failures(self):
+        self.decode(stop=3)
+        self.assertFalse(os.path.exists(self.quarantine_file))
+
+if __name__ == '__main__':
+    unittest.main()